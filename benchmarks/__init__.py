@@ -0,0 +1,11 @@
+"""ベンチマーク（`python -m benchmarks --help`）
+
+リポジトリのルートで`python -m benchmarks ...`と実行する．パッケージをインストールしていなくても，
+作業ツリーの`src`を`sys.path`の先頭に追加するので，計測されるのは常に手元の`atcoder`である．
+"""
+import sys
+from pathlib import Path
+
+_SRC = str(Path(__file__).resolve().parent.parent / "src")
+if _SRC not in sys.path:
+    sys.path.insert(0, _SRC)
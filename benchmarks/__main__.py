@@ -0,0 +1,65 @@
+"""ベンチマークのコマンドラインインターフェース
+
+リポジトリのルートで実行する（`src`は`benchmarks/__init__.py`が`sys.path`に追加するので，`PYTHONPATH`の設定は不要）
+
+例::
+
+    python -m benchmarks run --sizes 1000 100000 --only sorted_multiset scc -o before.json
+    python -m benchmarks run -o after.json
+    python -m benchmarks compare before.json after.json --threshold 1.2
+"""
+import argparse
+import json
+import sys
+
+from .compare import compare, format_rows
+from .runner import DEFAULT_SIZES, run_all
+from .workloads import WORKLOADS
+
+
+def main(argv: list[str] | None = None) -> int:
+    """エントリーポイント（悪化があれば終了コード1）"""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = sub.add_parser("run", help="計測してJSONを出力")
+    run_parser.add_argument("--only", nargs="+", choices=sorted(WORKLOADS), help="計測する負荷")
+    run_parser.add_argument("--sizes", nargs="+", type=int, default=list(DEFAULT_SIZES), help="サイズのリスト")
+    run_parser.add_argument("--seed", type=int, default=0)
+    run_parser.add_argument("--repeat", type=int, default=3)
+    run_parser.add_argument("--no-memory", action="store_true", help="tracemallocによる計測をしない")
+    run_parser.add_argument("-o", "--output", help="出力先 (省略時は標準出力)")
+
+    compare_parser = sub.add_parser("compare", help="2つのJSONを比較して悪化を報告")
+    compare_parser.add_argument("old")
+    compare_parser.add_argument("new")
+    compare_parser.add_argument("--threshold", type=float, default=1.1)
+
+    sub.add_parser("list", help="負荷の一覧")
+
+    args = parser.parse_args(argv)
+    if args.command == "list":
+        for name, w in WORKLOADS.items():
+            print(f"{name:32s} max_n={w.max_n}")
+        return 0
+    if args.command == "run":
+        result = run_all(args.only, args.sizes, args.seed, args.repeat, memory=not args.no_memory,
+                         verbose=args.output is not None)
+        text = json.dumps(result, indent=2)
+        if args.output is None:
+            print(text)
+        else:
+            with open(args.output, "w") as f:  # noqa: PTH123
+                f.write(text + "\n")
+        return 0
+    with open(args.old) as f:  # noqa: PTH123
+        old = json.load(f)
+    with open(args.new) as f:  # noqa: PTH123
+        new = json.load(f)
+    rows = compare(old, new, args.threshold)
+    print(format_rows(rows))
+    return int(any(row["regression"] for row in rows))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,45 @@
+"""2つの計測結果の比較"""
+from typing import Any
+
+
+def compare(old: dict[str, Any], new: dict[str, Any], threshold: float = 1.1,
+            min_time: float = 1e-3) -> list[dict[str, Any]]:
+    """`old`と`new`で共通する(負荷, サイズ)について実行時間・ピークメモリの比を計算
+
+    Args:
+        old (dict[str, Any]): 比較元の計測結果（`run_all`の出力）
+        new (dict[str, Any]): 比較先の計測結果
+        threshold (float): 比がこの値を超えたら悪化（regression）とみなす
+        min_time (float): 両方の実行時間がこの値（秒）未満なら，時間の比では悪化とみなさない（誤差対策）
+
+    Returns:
+        list[dict[str, Any]]: 比較結果のリスト（`regression`が`True`なら悪化）
+    """
+    old_results = {(r["name"], r["n"]): r for r in old["results"]}
+    rows = []
+    for r in new["results"]:
+        o = old_results.get((r["name"], r["n"]))
+        if o is None:
+            continue
+        time_ratio = r["time"] / o["time"] if o["time"] > 0 else float("inf")
+        regression = time_ratio > threshold and max(r["time"], o["time"]) >= min_time
+        row: dict[str, Any] = {"name": r["name"], "n": r["n"], "old_time": o["time"], "new_time": r["time"],
+                               "time_ratio": time_ratio}
+        if "peak_memory" in r and "peak_memory" in o:
+            memory_ratio = r["peak_memory"] / o["peak_memory"] if o["peak_memory"] > 0 else float("inf")
+            row["memory_ratio"] = memory_ratio
+            regression = regression or (memory_ratio > threshold and r["peak_memory"] > o["peak_memory"] + 2**16)
+        row["regression"] = regression
+        rows.append(row)
+    return rows
+
+
+def format_rows(rows: list[dict[str, Any]]) -> str:
+    """比較結果を表形式の文字列にする"""
+    lines = [f"{'name':32s} {'n':>8s} {'old[s]':>10s} {'new[s]':>10s} {'time':>7s} {'memory':>7s}"]
+    for row in rows:
+        memory = f"{row['memory_ratio']:.2f}x" if "memory_ratio" in row else "-"
+        mark = "  <-- regression" if row["regression"] else ""
+        lines.append(f"{row['name']:32s} {row['n']:8d} {row['old_time']:10.4f} {row['new_time']:10.4f} "
+                     f"{row['time_ratio']:6.2f}x {memory:>7s}{mark}")
+    return "\n".join(lines)
@@ -0,0 +1,93 @@
+"""負荷の実行と計測"""
+import gc
+import platform
+import random
+import time
+import tracemalloc
+import zlib
+from typing import Any, Iterable
+
+import numpy as np
+
+from .workloads import WORKLOADS
+
+DEFAULT_SIZES = (10**3, 10**4, 10**5, 10**6)
+
+
+def _rng(name: str, n: int, seed: int) -> random.Random:
+    """負荷の名前・サイズ・シードから決まる乱数生成器（負荷の入力を再現するためのもので，暗号用途ではない）"""
+    return random.Random(zlib.crc32(f"{name}:{n}:{seed}".encode()))  # noqa: S311
+
+
+def measure(name: str, n: int, seed: int, repeat: int = 3, *, memory: bool = True) -> dict[str, Any]:
+    """負荷`name`をサイズ`n`で実行し，実行時間（`repeat`回の最小値）とピークメモリを計測
+
+    Args:
+        name (str): 負荷の名前（`WORKLOADS`のキー）
+        n (int): サイズ
+        seed (int): 乱数のシード（負荷の名前・サイズごとに派生させる）
+        repeat (int): 実行時間の計測回数
+        memory (bool): `tracemalloc`でピークメモリを計測するかどうか（計測は時間計測とは別に1回行う）
+
+    Returns:
+        dict[str, Any]: 計測結果
+    """
+    setup = WORKLOADS[name].setup
+    times = []
+    for _ in range(repeat):
+        run = setup(n, _rng(name, n, seed))
+        gc.collect()
+        start = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - start)
+    result: dict[str, Any] = {"name": name, "n": n, "time": min(times), "times": times}
+    if memory:
+        run = setup(n, _rng(name, n, seed))
+        gc.collect()
+        tracemalloc.start()
+        try:
+            run()
+            result["peak_memory"] = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return result
+
+
+def run_all(names: Iterable[str] | None = None, sizes: Iterable[int] = DEFAULT_SIZES, seed: int = 0,
+            repeat: int = 3, *, memory: bool = True, verbose: bool = False) -> dict[str, Any]:
+    """複数の負荷をサイズを変えて計測
+
+    Args:
+        names (Iterable[str] | None): 負荷の名前（`None`なら全て）
+        sizes (Iterable[int]): サイズのリスト（各負荷の`max_n`を超えるものは飛ばす）
+        seed (int): 乱数のシード
+        repeat (int): 実行時間の計測回数
+        memory (bool): ピークメモリを計測するかどうか
+        verbose (bool): 計測ごとに結果を表示するかどうか
+
+    Returns:
+        dict[str, Any]: `{"meta": 実行環境, "results": 計測結果のリスト}`（JSONにそのまま書き出せる）
+    """
+    names = list(WORKLOADS) if names is None else list(names)
+    sizes = list(sizes)
+    results = []
+    for name in names:
+        for n in sizes:
+            if n > WORKLOADS[name].max_n:
+                continue
+            result = measure(name, n, seed, repeat, memory=memory)
+            results.append(result)
+            if verbose:
+                peak = result.get("peak_memory")
+                print(f"{name:32s} n={n:<8d} time={result['time']:.4f}s"
+                      + ("" if peak is None else f" peak={peak / 2**20:.2f}MiB"), flush=True)
+    meta = {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "seed": seed,
+        "repeat": repeat,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+    }
+    return {"meta": meta, "results": results}
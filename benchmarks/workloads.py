@@ -0,0 +1,652 @@
+"""モジュールごとのランダムな負荷の生成"""
+import io
+import random
+import sys
+from functools import partial
+from operator import gt
+from typing import Any, Callable, Generator, NamedTuple
+
+import numpy as np
+
+from atcoder.datastructure.fenwick_tree_2d import FenwickTree2D, OfflineFenwickTree2D
+from atcoder.datastructure.heap import IndexedHeap, IntervalHeap, RemovableHeap
+from atcoder.datastructure.li_chao_tree import DynamicLiChaoTree, LiChaoTree, MonotoneCHT
+from atcoder.datastructure.segment_tree import SegmentTree
+from atcoder.datastructure.segment_tree_beats import SegmentTreeBeats
+from atcoder.datastructure.sorted_multiset import SortedMultiset
+from atcoder.datastructure.sorted_set import SortedSet
+from atcoder.datastructure.sparse_table import DisjointSparseTable, SparseTable
+from atcoder.datastructure.unionfind import UnionFind
+from atcoder.datastructure.wavelet_matrix import WaveletMatrix
+from atcoder.graph.strong_connected_component import scc
+from atcoder.integer.basechanger import basechanger
+from atcoder.integer.combination_mod import cmb_mod
+from atcoder.integer.combination_mod_precalculation import prepare
+from atcoder.integer.convolution_mod import convolve_mod
+from atcoder.integer.divisor_enumeration import enum_divisors
+from atcoder.integer.is_prime import is_prime
+from atcoder.integer.linear_recurrence import berlekamp_massey, linear_recurrence_nth
+from atcoder.integer.matrix_mod import mat_pow_mod
+from atcoder.integer.modular import batch_inverse, discrete_log, floor_sum_many
+from atcoder.integer.prime_factorization import prime_factorize
+from atcoder.others.compressor import Compressor, event_order, group_starts, rank_with_index
+from atcoder.others.cumulative_sum_2d import PrefixSum2D
+from atcoder.others.input import Reader
+from atcoder.others.longest_increasing_subsequence import count_lis, lis_indices
+from atcoder.others.mo import Mo
+from atcoder.others.recursion import recursive
+from atcoder.others.run_length_encoding import RunLengthArray, iter_run_length, run_length_encoding_np
+from atcoder.string.rolling_hash import DoubleRollingHash, RollingHash
+from atcoder.string.suffix_array import lcp_array, suffix_array
+from atcoder.string.z_algorithm import z_algorithm
+
+MOD = 998244353
+
+
+def numpy_rng(rng: random.Random) -> np.random.Generator:
+    """`rng`から派生させたNumPyの乱数生成器"""
+    return np.random.default_rng(rng.randrange(2**63))
+
+
+class Workload(NamedTuple):
+    """負荷の定義
+
+    Attributes:
+        setup: `(n, rng)`を受け取り，計測対象の処理（引数なしの関数）を返す（`setup`自体は計測しない）
+        max_n: この負荷を実行する最大の`n`（大きすぎると時間がかかるもの用）
+    """
+    setup: Callable[[int, random.Random], Callable[[], object]]
+    max_n: int
+
+
+WORKLOADS: dict[str, Workload] = {}
+
+
+def workload(name: str, max_n: int = 10**6) -> Callable[
+        [Callable[[int, random.Random], Callable[[], object]]], Callable[[int, random.Random], Callable[[], object]]]:
+    """`WORKLOADS`に負荷を登録するデコレータ"""
+    def decorator(setup: Callable[[int, random.Random], Callable[[], object]]) -> Callable[
+            [int, random.Random], Callable[[], object]]:
+        assert name not in WORKLOADS
+        WORKLOADS[name] = Workload(setup, max_n)
+        return setup
+    return decorator
+
+
+@workload("interval_heap")
+def _interval_heap(n: int, rng: random.Random) -> Callable[[], object]:
+    """空から始めてpush / pop_min / pop_maxをn回"""
+    ops = [(rng.randrange(4), rng.randrange(10**9)) for _ in range(n)]
+
+    def run() -> object:
+        heap: IntervalHeap[int] = IntervalHeap()
+        res = 0
+        for t, x in ops:
+            if t <= 1 or not len(heap):
+                heap.push(x)
+            elif t == 2:  # noqa: PLR2004
+                res ^= heap.pop_min()
+            else:
+                res ^= heap.pop_max()
+        return res
+    return run
+
+
+@workload("indexed_heap", max_n=10**5)
+def _indexed_heap(n: int, rng: random.Random) -> Callable[[], object]:
+    """頂点数n，辺数4nのランダムなグラフでのDijkstra法（decrease_key）"""
+    graph: list[list[tuple[int, int]]] = [[] for _ in range(n)]
+    for _ in range(4 * n):
+        graph[rng.randrange(n)].append((rng.randrange(n), rng.randint(1, 10**9)))
+
+    def run() -> object:
+        inf = 1 << 60
+        dist = [inf] * n
+        dist[0] = 0
+        heap = IndexedHeap(n)
+        heap.push(0, 0)
+        while len(heap):
+            v = heap.pop()
+            d = dist[v]
+            for to, w in graph[v]:
+                if d + w < dist[to]:
+                    dist[to] = d + w
+                    heap.decrease_key(to, d + w)
+        return sum(x for x in dist if x < inf)
+    return run
+
+
+@workload("removable_heap")
+def _removable_heap(n: int, rng: random.Random) -> Callable[[], object]:
+    """n個で構築 + 任意の要素の削除と最小値の参照をn回"""
+    a = [rng.randrange(10**9) for _ in range(n)]
+    removes = a[:]
+    rng.shuffle(removes)
+
+    def run() -> object:
+        heap = RemovableHeap(a)
+        res = 0
+        for x in removes[:-1]:
+            heap.remove(x)
+            res ^= heap.top()
+        return res
+    return run
+
+
+@workload("li_chao_tree", max_n=10**5)
+def _li_chao_tree(n: int, rng: random.Random) -> Callable[[], object]:
+    """座標圧縮版に直線・線分をn本追加 + n点の最小値をまとめて計算"""
+    g = numpy_rng(rng)
+    xs = g.integers(-10**9, 10**9, n)
+    lines = [(rng.randint(-10**6, 10**6), rng.randint(-10**12, 10**12)) for _ in range(n)]
+    ranges = [sorted((rng.randint(-10**9, 10**9), rng.randint(-10**9, 10**9))) for _ in range(n)]
+
+    def run() -> object:
+        tree = LiChaoTree(xs)
+        for (a, b), (lo, hi) in zip(lines, ranges):
+            tree.add_segment(a, b, lo, hi)
+            tree.add_line(a, b)
+        return tree.eval_many(xs)
+    return run
+
+
+@workload("dynamic_li_chao_tree")
+def _dynamic_li_chao_tree(n: int, rng: random.Random) -> Callable[[], object]:
+    """直線の追加と一点の最小値をn回ずつ交互に"""
+    ops = [(rng.randint(-10**6, 10**6), rng.randint(-10**12, 10**12), rng.randint(-10**9, 10**9))
+           for _ in range(n)]
+
+    def run() -> object:
+        tree = DynamicLiChaoTree(-10**9, 10**9 + 1)
+        res = 0
+        for a, b, x in ops:
+            tree.add_line(a, b)
+            res ^= tree.query(x)
+        return res
+    return run
+
+
+@workload("monotone_cht")
+def _monotone_cht(n: int, rng: random.Random) -> Callable[[], object]:
+    """傾きの降順に直線をn本追加 + 単調なn点の最小値"""
+    slopes = sorted((rng.randint(-10**6, 10**6) for _ in range(n)), reverse=True)
+    lines = [(a, rng.randint(-10**12, 10**12)) for a in slopes]
+    xs = sorted(rng.randint(-10**6, 10**6) for _ in range(n))
+
+    def run() -> object:
+        cht = MonotoneCHT()
+        for a, b in lines:
+            cht.add_line(a, b)
+        return sum(cht.query_monotone(x) for x in xs)
+    return run
+
+
+@workload("segment_tree")
+def _segment_tree(n: int, rng: random.Random) -> Callable[[], object]:
+    """構築 + 一点更新・区間和・max_rightをn回ずつ"""
+    a = [rng.randrange(10**9) for _ in range(n)]
+    ops = [(rng.randrange(3), rng.randrange(n), rng.randrange(n + 1), rng.randrange(10**9)) for _ in range(n)]
+
+    def run() -> object:
+        seg = SegmentTree(a, max, -1)
+        res = 0
+        for t, i, j, v in ops:
+            if t == 0:
+                seg.set_value(i, v)
+            elif t == 1:
+                res ^= seg.query(min(i, j), max(i, j))
+            else:
+                res ^= seg.max_right(i, partial(gt, v))  # x < v
+        return res
+    return run
+
+
+@workload("segment_tree_beats", max_n=10**4)
+def _segment_tree_beats(n: int, rng: random.Random) -> Callable[[], object]:
+    """構築 + 区間chmin・chmax・加算・和をn回"""
+    a = [rng.randrange(10**9) for _ in range(n)]
+    ops = [(rng.randrange(4), *sorted((rng.randrange(n + 1), rng.randrange(n + 1))), rng.randrange(10**9))
+           for _ in range(n)]
+
+    def run() -> object:
+        seg = SegmentTreeBeats(a)
+        res = 0
+        for t, i, j, x in ops:
+            if t == 0:
+                seg.chmin(i, j, x)
+            elif t == 1:
+                seg.chmax(i, j, x)
+            elif t == 2:  # noqa: PLR2004
+                seg.add(i, j, x - 5 * 10**8)
+            else:
+                res ^= seg.query_sum(i, j)
+        return res
+    return run
+
+
+@workload("sparse_table")
+def _sparse_table(n: int, rng: random.Random) -> Callable[[], object]:
+    """構築（NumPy）+ n個の区間minをまとめて計算"""
+    g = numpy_rng(rng)
+    a = g.integers(0, 10**9, n)
+    left = g.integers(0, n, n)
+    right = g.integers(left + 1, n + 1)
+    return lambda: SparseTable(a, "min").query_many(left, right)
+
+
+@workload("disjoint_sparse_table", max_n=10**5)
+def _disjoint_sparse_table(n: int, rng: random.Random) -> Callable[[], object]:
+    """構築 + mod付きの区間和をn回"""
+    a = [rng.randrange(MOD) for _ in range(n)]
+    qs = [sorted((rng.randrange(n), rng.randrange(n))) for _ in range(n)]
+
+    def run() -> object:
+        dst = DisjointSparseTable(a, lambda x, y: (x + y) % MOD)
+        return sum(dst.query(i, j + 1) for i, j in qs)
+    return run
+
+
+@workload("wavelet_matrix", max_n=10**5)
+def _wavelet_matrix(n: int, rng: random.Random) -> Callable[[], object]:
+    """構築（NumPy）+ 区間k番目・区間の値の個数をn回ずつ"""
+    g = numpy_rng(rng)
+    a = g.integers(0, 10**9, n)
+    qs = [(*sorted((rng.randrange(n), rng.randrange(n))), rng.randrange(10**9)) for _ in range(n)]
+
+    def run() -> object:
+        wm = WaveletMatrix(a)
+        res = 0
+        for i, j, x in qs:
+            res ^= wm.kth_smallest(i, j + 1, (j - i) // 2) ^ wm.range_freq(i, j + 1, x, 10**9)
+        return res
+    return run
+
+
+def _multiset_ops(n: int, rng: random.Random) -> list[tuple[int, int]]:
+    """操作列（add / discard / index / `__getitem__`を混ぜる）"""
+    return [(rng.randrange(4), rng.randrange(n)) for _ in range(n)]
+
+
+@workload("sorted_multiset")
+def _sorted_multiset(n: int, rng: random.Random) -> Callable[[], object]:
+    """空から始めてadd / discard / index / `__getitem__`をn回"""
+    ops = _multiset_ops(n, rng)
+
+    def run() -> object:
+        s: SortedMultiset[int] = SortedMultiset()
+        res = 0
+        for t, x in ops:
+            if t == 0 or not s:
+                s.add(x)
+            elif t == 1:
+                s.discard(x)
+            elif t == 2:  # noqa: PLR2004
+                res += s.index(x)
+            else:
+                res += s[x % len(s)]
+        return res
+    return run
+
+
+@workload("sorted_set")
+def _sorted_set(n: int, rng: random.Random) -> Callable[[], object]:
+    """空から始めてadd / discard / ge / le をn回"""
+    ops = _multiset_ops(n, rng)
+
+    def run() -> object:
+        s: SortedSet[int] = SortedSet()
+        res = 0
+        for t, x in ops:
+            if t == 0 or not s:
+                s.add(x)
+            elif t == 1:
+                s.discard(x)
+            elif t == 2:  # noqa: PLR2004
+                res += s.ge(x) or 0
+            else:
+                res += s.le(x) or 0
+        return res
+    return run
+
+
+@workload("unionfind")
+def _unionfind(n: int, rng: random.Random) -> Callable[[], object]:
+    """n頂点でunion / is_same_groupをn回ずつ"""
+    edges = [(rng.randrange(n), rng.randrange(n)) for _ in range(n)]
+    queries = [(rng.randrange(n), rng.randrange(n)) for _ in range(n)]
+
+    def run() -> object:
+        uf = UnionFind(n)
+        for a, b in edges:
+            uf.union(a, b)
+        return sum(uf.is_same_group(a, b) for a, b in queries)
+    return run
+
+
+@workload("scc")
+def _scc(n: int, rng: random.Random) -> Callable[[], object]:
+    """n頂点2n辺のランダムな有向グラフ"""
+    edges = [(rng.randrange(n), rng.randrange(n)) for _ in range(2 * n)]
+    return lambda: len(scc(n, edges))
+
+
+@workload("basechanger", max_n=10**5)
+def _basechanger(n: int, rng: random.Random) -> Callable[[], object]:
+    """2進数表記の整数n個を10進数に変換"""
+    xs = [int(f"{rng.randrange(1, 10**9):b}") for _ in range(n)]
+    return lambda: sum(len(basechanger(x, 2, 10)) for x in xs)
+
+
+@workload("cmb_mod")
+def _cmb_mod(n: int, rng: random.Random) -> Callable[[], object]:
+    """二項係数 nCk (k ≒ n / 2) を1回"""
+    k = n // 2 + rng.randrange(2)
+    return lambda: cmb_mod(n, k, MOD)
+
+
+@workload("combination_mod_precalculation")
+def _combination_mod_precalculation(n: int, rng: random.Random) -> Callable[[], object]:  # noqa: ARG001
+    """n以下の階乗とその逆元の前計算"""
+    return lambda: prepare(n, MOD)
+
+
+@workload("convolve_mod")
+def _convolve_mod(n: int, rng: random.Random) -> Callable[[], object]:
+    """長さnの数列どうしの畳み込み (mod 998244353)"""
+    g = numpy_rng(rng)
+    f = g.integers(0, MOD, n)
+    h = g.integers(0, MOD, n)
+    return lambda: convolve_mod(f, h, MOD)
+
+
+@workload("mat_pow_mod")
+def _mat_pow_mod(n: int, rng: random.Random) -> Callable[[], object]:
+    """n^(1/3)次の正方行列の10^18乗 (mod 998244353)"""
+    size = round(n ** (1 / 3))
+    a = numpy_rng(rng).integers(0, MOD, (size, size))
+    return lambda: mat_pow_mod(a, 10**18, MOD)
+
+
+@workload("linear_recurrence_nth", max_n=10**5)
+def _linear_recurrence_nth(n: int, rng: random.Random) -> Callable[[], object]:
+    """n次の線形漸化式の第10^18項（Bostan–Mori）"""
+    a = [rng.randrange(MOD) for _ in range(n)]
+    c = [rng.randrange(MOD) for _ in range(n)]
+    return lambda: linear_recurrence_nth(a, c, 10**18, MOD)
+
+
+@workload("berlekamp_massey", max_n=10**4)
+def _berlekamp_massey(n: int, rng: random.Random) -> Callable[[], object]:
+    """n/2次の線形漸化式を満たす数列の先頭n項から漸化式を復元"""
+    d = max(n // 2, 1)
+    c = [rng.randrange(MOD) for _ in range(d)]
+    a = [rng.randrange(MOD) for _ in range(d)]
+    while len(a) < n:
+        a.append(sum(x * y for x, y in zip(c, reversed(a[-d:]))) % MOD)
+    return lambda: berlekamp_massey(a, MOD)
+
+
+@workload("batch_inverse")
+def _batch_inverse(n: int, rng: random.Random) -> Callable[[], object]:
+    """n個の逆元 (mod 998244353) をまとめて計算"""
+    a = numpy_rng(rng).integers(1, MOD, n)
+    return lambda: batch_inverse(a, MOD)
+
+
+@workload("floor_sum_many")
+def _floor_sum_many(n: int, rng: random.Random) -> Callable[[], object]:
+    """n個のfloor sum（n, m <= 10^9，a, b < m）をまとめて計算"""
+    g = numpy_rng(rng)
+    args = g.integers(0, 10**9, (4, n))
+    args[1] += 1
+    args[2:] %= args[1]  # 答えがint64に収まるように a, b < m
+    return lambda: floor_sum_many(*args)
+
+
+@workload("discrete_log", max_n=10**3)
+def _discrete_log(n: int, rng: random.Random) -> Callable[[], object]:
+    """法が10^9程度の離散対数をn回"""
+    qs = [(rng.randrange(10**9), rng.randrange(10**9), rng.randint(1, 10**9)) for _ in range(n)]
+    return lambda: [discrete_log(x, y, m) for x, y, m in qs]
+
+
+@workload("enum_divisors", max_n=10**4)
+def _enum_divisors(n: int, rng: random.Random) -> Callable[[], object]:
+    """10^6以下の整数n個の約数列挙"""
+    xs = [rng.randrange(1, 10**6) for _ in range(n)]
+    return lambda: sum(len(enum_divisors(x)) for x in xs)
+
+
+@workload("is_prime", max_n=10**4)
+def _is_prime(n: int, rng: random.Random) -> Callable[[], object]:
+    """10^6以下の整数n個の素数判定"""
+    xs = [rng.randrange(1, 10**6) | 1 for _ in range(n)]
+    return lambda: sum(map(is_prime, xs))
+
+
+@workload("prime_factorize", max_n=10**4)
+def _prime_factorize(n: int, rng: random.Random) -> Callable[[], object]:
+    """10^6以下の整数n個の素因数分解"""
+    xs = [rng.randrange(1, 10**6) for _ in range(n)]
+    return lambda: sum(len(prime_factorize(x)) for x in xs)
+
+
+@workload("prefix_sum_2d")
+def _prefix_sum_2d(n: int, rng: random.Random) -> Callable[[], object]:
+    """√n × √n の行列で構築 + n個の長方形をまとめて計算"""
+    g = numpy_rng(rng)
+    h = max(1, int(n ** 0.5))
+    a = g.integers(0, 10**9, (h, h))
+    x = np.sort(g.integers(0, h + 1, (2, n)), axis=0)
+    y = np.sort(g.integers(0, h + 1, (2, n)), axis=0)
+
+    def run() -> object:
+        return PrefixSum2D(a).query_many(x[0], y[0], x[1], y[1])
+    return run
+
+
+@workload("fenwick_tree_2d")
+def _fenwick_tree_2d(n: int, rng: random.Random) -> Callable[[], object]:
+    """√n × √n のグリッドで一点加算・長方形和をn回"""
+    h = max(1, int(n ** 0.5))
+    ops = [(rng.randrange(h), rng.randrange(h), rng.randrange(h + 1), rng.randrange(h + 1)) for _ in range(n)]
+
+    def run() -> object:
+        bit = FenwickTree2D(h, h)
+        res = 0
+        for x, y, u, v in ops:
+            bit.add(x, y, u)
+            res += bit.query(min(x, u), min(y, v), max(x, u), max(y, v))
+        return res
+    return run
+
+
+@workload("offline_fenwick_tree_2d")
+def _offline_fenwick_tree_2d(n: int, rng: random.Random) -> Callable[[], object]:
+    """10^9 × 10^9 の平面上のn点で構築 + 長方形内の点数をn回"""
+    xs = [rng.randrange(10**9) for _ in range(n)]
+    ys = [rng.randrange(10**9) for _ in range(n)]
+    qs = [sorted((rng.randrange(10**9), rng.randrange(10**9))) + sorted((rng.randrange(10**9), rng.randrange(10**9)))
+          for _ in range(n)]
+
+    def run() -> object:
+        bit = OfflineFenwickTree2D(xs, ys)
+        return sum(bit.query(x1, y1, x2, y2) for x1, x2, y1, y2 in qs)
+    return run
+
+
+@workload("compressor")
+def _compressor(n: int, rng: random.Random) -> Callable[[], object]:
+    """長さnの列2つをまとめて座標圧縮し，n個の値を変換"""
+    g = numpy_rng(rng)
+    a = g.integers(0, 10**9, n)
+    b = g.integers(0, 10**9, n)
+    queries = g.integers(0, 10**9, n)
+
+    def run() -> object:
+        compressor = Compressor(a, b)
+        return int(compressor.compress_many(queries).sum() + compressor.lower_bound_many(queries).sum())
+    return run
+
+
+@workload("offline_sweep")
+def _offline_sweep(n: int, rng: random.Random) -> Callable[[], object]:
+    """n個のイベントを(座標, 種類)順に並べ，同じ座標ごとに区切る・(値, 位置)で順位付け"""
+    g = numpy_rng(rng)
+    xs = g.integers(0, n, n)
+    kinds = g.integers(0, 2, n)
+
+    def run() -> object:
+        order = event_order(xs, kinds)
+        return len(group_starts(xs[order])) + int(rank_with_index(xs)[0])
+    return run
+
+
+@workload("lis")
+def _lis(n: int, rng: random.Random) -> Callable[[], object]:
+    """長さnのランダムな列のLIS復元"""
+    a = [rng.randrange(10**9) for _ in range(n)]
+    return lambda: len(lis_indices(a))
+
+
+@workload("count_lis")
+def _count_lis(n: int, rng: random.Random) -> Callable[[], object]:
+    """長さnのランダムな列のLISの個数"""
+    a = [rng.randrange(n) for _ in range(n)]
+    return lambda: count_lis(a)
+
+
+@workload("mo", max_n=10**5)
+def _mo(n: int, rng: random.Random) -> Callable[[], object]:
+    """長さnの列の区間の種類数（ヒルベルト順）をn個"""
+    a = [rng.randrange(n) for _ in range(n)]
+    g = numpy_rng(rng)
+    left = g.integers(0, n, n)
+    right = g.integers(left + 1, n + 1)
+
+    def run() -> object:
+        count = [0] * n
+        distinct = 0
+
+        def add(i: int) -> None:
+            nonlocal distinct
+            if count[a[i]] == 0:
+                distinct += 1
+            count[a[i]] += 1
+
+        def remove(i: int) -> None:
+            nonlocal distinct
+            count[a[i]] -= 1
+            if count[a[i]] == 0:
+                distinct -= 1
+        return sum(Mo(n, left, right).run(add, add, remove, remove, lambda: distinct))
+    return run
+
+
+@workload("run_length_encoding")
+def _run_length_encoding(n: int, rng: random.Random) -> Callable[[], object]:
+    """長さnの文字列のランレングス圧縮 + 位置・個数クエリをn回"""
+    s = "".join(rng.choice("ab") for _ in range(n))
+    qs = [(rng.randrange(n), rng.randrange(n + 1)) for _ in range(n)]
+
+    def run() -> object:
+        rla = RunLengthArray(iter_run_length(s))
+        return sum(rla.count("a", min(i, j), max(i, j)) for i, j in qs)
+    return run
+
+
+@workload("run_length_encoding_np")
+def _run_length_encoding_np(n: int, rng: random.Random) -> Callable[[], object]:
+    """長さnのbytesのランレングス圧縮（NumPy）"""
+    s = numpy_rng(rng).integers(0, 2, n, dtype=np.uint8).tobytes()
+    return lambda: len(run_length_encoding_np(s)[0])
+
+
+@workload("reader")
+def _reader(n: int, rng: random.Random) -> Callable[[], object]:
+    """n個の整数の読み込み（`int_array`）"""
+    data = " ".join(str(rng.randrange(10**9)) for _ in range(n)).encode()
+    return lambda: Reader(io.BytesIO(data)).int_array(n).sum()
+
+
+def _deep_tree(n: int, rng: random.Random) -> list[list[int]]:
+    """n頂点のランダムな木（深さが大きくなりやすい）の子のリスト"""
+    children: list[list[int]] = [[] for _ in range(n)]
+    for v in range(1, n):
+        children[max(0, v - 1 - rng.randrange(3))].append(v)
+    return children
+
+
+@workload("recursion")
+def _recursion(n: int, rng: random.Random) -> Callable[[], object]:
+    """n頂点のランダムな木（深さが大きくなりやすい）の部分木サイズをトランポリンで計算"""
+    children = _deep_tree(n, rng)
+
+    @recursive
+    def dfs(v: int) -> Generator[Any, Any, int]:
+        size = 1
+        for c in children[v]:
+            size += yield dfs(c)
+        return size
+    return lambda: dfs(0)
+
+
+@workload("recursion_native")
+def _recursion_native(n: int, rng: random.Random) -> Callable[[], object]:
+    """`recursion`と同じ木の部分木サイズを，再帰の上限を上げた通常の再帰で計算（比較用）"""
+    children = _deep_tree(n, rng)
+
+    def dfs(v: int) -> int:
+        size = 1
+        for c in children[v]:
+            size += dfs(c)
+        return size
+
+    def run() -> object:
+        limit = sys.getrecursionlimit()
+        sys.setrecursionlimit(max(limit, n + 1000))
+        try:
+            return dfs(0)
+        finally:
+            sys.setrecursionlimit(limit)
+    return run
+
+
+def _random_string(n: int, rng: random.Random) -> str:
+    """長さnの英小文字4種からなるランダムな文字列"""
+    return "".join(rng.choice("abcd") for _ in range(n))
+
+
+@workload("suffix_array")
+def _suffix_array(n: int, rng: random.Random) -> Callable[[], object]:
+    """長さnの文字列の接尾辞配列（SA-IS）+ LCP配列"""
+    s = _random_string(n, rng)
+    return lambda: sum(lcp_array(s, suffix_array(s)))
+
+
+@workload("z_algorithm")
+def _z_algorithm(n: int, rng: random.Random) -> Callable[[], object]:
+    """長さnの文字列のZ配列"""
+    s = _random_string(n, rng)
+    return lambda: sum(z_algorithm(s))
+
+
+@workload("rolling_hash", max_n=10**5)
+def _rolling_hash(n: int, rng: random.Random) -> Callable[[], object]:
+    """長さnの文字列で構築 + ランダムな2箇所のLCPをn回"""
+    s = _random_string(n, rng)
+    qs = [(rng.randrange(n), rng.randrange(n)) for _ in range(n)]
+
+    def run() -> object:
+        rh = RollingHash(s)
+        return sum(rh.lcp(i, j) for i, j in qs)
+    return run
+
+
+@workload("double_rolling_hash")
+def _double_rolling_hash(n: int, rng: random.Random) -> Callable[[], object]:
+    """長さnのbytesで構築（NumPy）+ n個の部分文字列のハッシュをまとめて計算"""
+    s = _random_string(n, rng).encode()
+    g = numpy_rng(rng)
+    lr = np.sort(g.integers(0, n + 1, (2, n)), axis=0)
+    return lambda: DoubleRollingHash(s).get_many(lr[0], lr[1])
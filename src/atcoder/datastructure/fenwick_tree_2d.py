@@ -0,0 +1,238 @@
+"""2次元Fenwick Tree (Binary Indexed Tree)"""
+from bisect import bisect_left
+
+
+class FenwickTree2D:
+    """密なグリッド上の2次元Fenwick Tree（一点加算・長方形和）
+
+    Attributes:
+        _h: 行数
+        _w: 列数
+        _stride: 1行あたりの要素数（= `_w + 1`）
+        _t: Fenwick Treeの要素を1次元に並べたリスト（1-indexed, 行・列0は使わない）
+
+    Note:
+        - 区間はすべて左閉右開区間 `[x1, x2) × [y1, y2)`
+        - 一点加算・長方形和ともに O(log H log W)
+    """
+    def __init__(self, height: int, width: int, matrix: list[list[int]] | None = None) -> None:
+        """Init. O(HW)
+
+        Args:
+            height (int): 行数
+            width (int): 列数
+            matrix (list[list[int]] | None): 初期値（`height`行`width`列．指定した場合は線形時間で構築）
+        """
+        self._h = height
+        self._w = width
+        self._stride = stride = width + 1
+        t = self._t = [0] * ((height + 1) * stride)
+        if matrix is None:
+            return
+        assert len(matrix) == height
+        for i in range(height):
+            row = matrix[i]
+            # 長さの異なる行をスライスに代入すると，リストの長さが変わって以降の行の位置がずれる
+            assert len(row) == width
+            base = (i + 1) * stride
+            t[base + 1: base + stride] = row
+        # 各行について列方向に親へ伝播し，次に行方向に親の行へ伝播する
+        for i in range(1, height + 1):
+            base = i * stride
+            for j in range(1, width + 1):
+                k = j + (j & -j)
+                if k <= width:
+                    t[base + k] += t[base + j]
+        for i in range(1, height + 1):
+            k = i + (i & -i)
+            if k <= height:
+                src = i * stride
+                dst = k * stride
+                for j in range(1, width + 1):
+                    t[dst + j] += t[src + j]
+
+    def add(self, x: int, y: int, value: int) -> None:
+        """`matrix[x][y]`に`value`を加算 O(log H log W)"""
+        assert 0 <= x < self._h
+        assert 0 <= y < self._w
+        t = self._t
+        stride = self._stride
+        w = self._w
+        i = x + 1
+        while i <= self._h:
+            base = i * stride
+            j = y + 1
+            while j <= w:
+                t[base + j] += value
+                j += j & -j
+            i += i & -i
+
+    def prefix_sum(self, x: int, y: int) -> int:
+        """`sum(matrix[0: x, 0: y])` O(log H log W)"""
+        assert 0 <= x <= self._h
+        assert 0 <= y <= self._w
+        t = self._t
+        stride = self._stride
+        res = 0
+        i = x
+        while i > 0:
+            base = i * stride
+            j = y
+            while j > 0:
+                res += t[base + j]
+                j -= j & -j
+            i -= i & -i
+        return res
+
+    def query(self, x1: int, y1: int, x2: int, y2: int) -> int:
+        """`sum(matrix[x1: x2, y1: y2])` O(log H log W)"""
+        assert 0 <= x1 <= x2 <= self._h
+        assert 0 <= y1 <= y2 <= self._w
+        return self.prefix_sum(x2, y2) - self.prefix_sum(x1, y2) - self.prefix_sum(x2, y1) + self.prefix_sum(x1, y1)
+
+
+class OfflineFenwickTree2D:
+    """座標圧縮した疎な点集合上の2次元Fenwick Tree（一点加算・長方形和／長方形内の点数）
+
+    Attributes:
+        _xs: 圧縮後のx座標（昇順・重複なし）
+        _start: 外側のFenwick Treeの各ノード`i`が担当するy座標の開始位置（`_start[i]: _start[i + 1]`）
+        _ys: 各ノードが担当するy座標（ノードごとに昇順・重複なし）を1次元に並べたリスト
+        _t: 各ノードの内側のFenwick Tree（1-indexed）を1次元に並べたリスト
+            （`_t[_start[i] + p]` がノード`i`の`p + 1`番目）
+
+    Note:
+        - 加算されうる点 `(x, y)` をすべて事前に与える必要がある（オフライン）
+        - 構築 O(n log n)，一点加算・長方形和ともに O(log^2 n)
+        - 座標の範囲は制限なし（10^9 × 10^9 の平面でも可）
+        - 区間はすべて左閉右開区間 `[x1, x2) × [y1, y2)`
+    """
+    def __init__(self, xs: list[int], ys: list[int], weights: list[int] | None = None) -> None:
+        """Init. O(n log n)
+
+        Args:
+            xs (list[int]): 点のx座標のリスト
+            ys (list[int]): 点のy座標のリスト
+            weights (list[int] | None): 点の初期の重み（`None`なら全て1，すなわち点の個数を数える）
+        """
+        n = len(xs)
+        assert len(ys) == n
+        if weights is None:
+            weights = [1] * n
+        self._xs = sorted(set(xs))
+        m = len(self._xs)
+        x_index = {x: i for i, x in enumerate(self._xs)}
+
+        # y座標の昇順に各ノードへ追加すればノードごとのyリストは整列済みになる
+        node_ys: list[list[int]] = [[] for _ in range(m + 1)]
+        node_ws: list[list[int]] = [[] for _ in range(m + 1)]
+        for k in sorted(range(n), key=ys.__getitem__):
+            y = ys[k]
+            w = weights[k]
+            i = x_index[xs[k]] + 1
+            while i <= m:
+                ny = node_ys[i]
+                if ny and ny[-1] == y:
+                    node_ws[i][-1] += w
+                else:
+                    ny.append(y)
+                    node_ws[i].append(w)
+                i += i & -i
+
+        start = self._start = [0] * (m + 2)
+        for i in range(1, m + 1):
+            start[i + 1] = start[i] + len(node_ys[i])
+        self._ys = [y for ny in node_ys for y in ny]
+        t = self._t = [w for nw in node_ws for w in nw]
+        # 内側のFenwick Treeを線形時間で構築
+        for i in range(1, m + 1):
+            s = start[i] - 1
+            size = start[i + 1] - start[i]
+            for j in range(1, size + 1):
+                k = j + (j & -j)
+                if k <= size:
+                    t[s + k] += t[s + j]
+
+    def add(self, x: int, y: int, value: int) -> None:
+        """点`(x, y)`の重みに`value`を加算（点は構築時に与えたもの） O(log^2 n)"""
+        xs = self._xs
+        m = len(xs)
+        i = bisect_left(xs, x)
+        assert i < m
+        assert xs[i] == x
+        i += 1
+        start = self._start
+        ys = self._ys
+        t = self._t
+        while i <= m:
+            lo = start[i]
+            hi = start[i + 1]
+            p = bisect_left(ys, y, lo, hi)
+            assert p < hi
+            assert ys[p] == y
+            s = lo - 1
+            size = hi - lo
+            j = p - lo + 1
+            while j <= size:
+                t[s + j] += value
+                j += j & -j
+            i += i & -i
+
+    def _prefix_sum(self, i: int, y1: int, y2: int) -> int:
+        """圧縮後のx座標が`i`未満で，y座標が`[y1, y2)`の点の重みの和"""
+        start = self._start
+        ys = self._ys
+        t = self._t
+        res = 0
+        while i > 0:
+            lo = start[i]
+            hi = start[i + 1]
+            s = lo - 1
+            j = bisect_left(ys, y2, lo, hi) - lo
+            while j > 0:
+                res += t[s + j]
+                j -= j & -j
+            j = bisect_left(ys, y1, lo, hi) - lo
+            while j > 0:
+                res -= t[s + j]
+                j -= j & -j
+            i -= i & -i
+        return res
+
+    def query(self, x1: int, y1: int, x2: int, y2: int) -> int:
+        """`x1 <= x < x2`かつ`y1 <= y < y2`を満たす点の重みの和 O(log^2 n)"""
+        if x1 >= x2 or y1 >= y2:
+            return 0
+        xs = self._xs
+        return self._prefix_sum(bisect_left(xs, x2), y1, y2) - self._prefix_sum(bisect_left(xs, x1), y1, y2)
+
+
+if __name__ == "__main__":
+    """動作確認"""
+    # 点 (x, y, w) がN個与えられ，Q個のクエリを処理する
+    # 0 x y w: 点(x, y)の重みにwを加算, 1 l d r u: l <= x < r, d <= y < u の点の重みの和
+    from atcoder.others.input import Reader, Writer
+
+    reader = Reader()
+    writer = Writer()
+    N, Q = reader.ints(2)
+    XYW = reader.ints(3 * N)
+    X = XYW[::3]
+    Y = XYW[1::3]
+    W = XYW[2::3]
+    queries: list[list[int]] = []
+    for _ in range(Q):
+        t = reader.int()
+        queries.append([t, *reader.ints(3 if t == 0 else 4)])
+    # 加算される点も事前に登録しておく（重み0）
+    for q in queries:
+        if q[0] == 0:
+            X.append(q[1])
+            Y.append(q[2])
+            W.append(0)
+    bit = OfflineFenwickTree2D(X, Y, W)
+    for q in queries:
+        if q[0] == 0:
+            bit.add(q[1], q[2], q[3])
+        else:
+            writer.print(bit.query(q[1], q[2], q[3], q[4]))
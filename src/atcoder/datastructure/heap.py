@@ -0,0 +1,345 @@
+"""ヒープ（両端優先度付きキュー・インデックス付きヒープ・削除可能ヒープ）"""
+from heapq import heapify, heappop, heappush
+from typing import Generic, Iterable, TypeVar
+
+from atcoder.datastructure.sorted_multiset import Comparable
+
+T = TypeVar("T", bound=Comparable)
+
+
+class IntervalHeap(Generic[T]):
+    """Interval Heap（最小値・最大値の両方を取り出せる優先度付きキュー）
+
+    Attributes:
+        _a: 要素のリスト（頂点`k`は`(_a[2k], _a[2k + 1]) = (最小値, 最大値)`の組，最後の頂点は要素1つのこともある）
+
+    Note:
+        - 偶数番目の要素が最小値のヒープ，奇数番目の要素が最大値のヒープをなし，頂点`k`の子は`2k + 1`, `2k + 2`
+        - 各頂点の組は子孫の要素をすべて含む区間になっている
+        - 追加・最小値・最大値の取り出し O(log n)，最小値・最大値の参照 O(1)
+        - 要素は1つのリストに直接並べるので，要素ごとのタプルなどは作らない
+    """
+    def __init__(self, array: Iterable[T] = ()) -> None:
+        """Init. O(n log n)"""
+        self._a: list[T] = []
+        for x in array:
+            self.push(x)
+
+    def __len__(self) -> int:
+        """要素数"""
+        return len(self._a)
+
+    def _up_min(self, i: int) -> None:
+        """最小値のヒープで，位置`i`（偶数）の要素を上へ移動"""
+        a = self._a
+        x = a[i]
+        while i:
+            p = ((i >> 1) - 1) >> 1 << 1  # 親の頂点の最小値の位置
+            if not x < a[p]:
+                break
+            a[i] = a[p]
+            i = p
+        a[i] = x
+
+    def _up_max(self, i: int) -> None:
+        """最大値のヒープで，位置`i`の要素を上へ移動"""
+        a = self._a
+        x = a[i]
+        while i > 1:
+            p = ((i >> 1) - 1) >> 1 << 1 | 1  # 親の頂点の最大値の位置
+            if not a[p] < x:
+                break
+            a[i] = a[p]
+            i = p
+        a[i] = x
+
+    def push(self, x: T) -> None:
+        """`x`を追加 O(log n)"""
+        a = self._a
+        a.append(x)
+        i = len(a) - 1
+        if i & 1:
+            # 同じ頂点の最小値と比べ，小さければ入れ替えて最小値のヒープへ
+            if x < a[i - 1]:
+                a[i - 1], a[i] = x, a[i - 1]
+                self._up_min(i - 1)
+            else:
+                self._up_max(i)
+        elif i:
+            p = ((i >> 1) - 1) >> 1 << 1
+            if x < a[p]:
+                self._up_min(i)
+            elif a[p + 1] < x:
+                self._up_max(i)
+
+    def peek_min(self) -> T:
+        """最小値 O(1)"""
+        return self._a[0]
+
+    def peek_max(self) -> T:
+        """最大値 O(1)"""
+        a = self._a
+        return a[1] if len(a) > 1 else a[0]
+
+    def pop_min(self) -> T:
+        """最小値を取り出す O(log n)"""
+        a = self._a
+        if len(a) <= 2:  # noqa: PLR2004
+            return a.pop(0)
+        res = a[0]
+        a[0] = a.pop()
+        n = len(a)
+        i = 0
+        while True:
+            c = 2 * i + 2  # 左の子の頂点の最小値の位置
+            if c >= n:
+                break
+            if c + 2 < n and a[c + 2] < a[c]:
+                c += 2
+            if not a[c] < a[i]:
+                break
+            a[i], a[c] = a[c], a[i]
+            # 子の頂点で最小値・最大値が逆転していれば直す
+            if c + 1 < n and a[c + 1] < a[c]:
+                a[c], a[c + 1] = a[c + 1], a[c]
+            i = c
+        return res
+
+    def pop_max(self) -> T:
+        """最大値を取り出す O(log n)"""
+        a = self._a
+        if len(a) <= 2:  # noqa: PLR2004
+            return a.pop()
+        res = a[1]
+        a[1] = a.pop()
+        n = len(a)
+        i = 1
+        while True:
+            c = 2 * i + 1  # 左の子の頂点の最大値の位置（要素が1つなら最小値の位置）
+            if c - 1 >= n:
+                break
+            if c >= n:
+                c -= 1
+            d = c + 2  # 右の子
+            if d - 1 < n:
+                if d >= n:
+                    d -= 1
+                if a[c] < a[d]:
+                    c = d
+            if not a[i] < a[c]:
+                break
+            a[i], a[c] = a[c], a[i]
+            # 子の頂点で最小値・最大値が逆転していれば直す
+            if c & 1 and a[c] < a[c - 1]:
+                a[c], a[c - 1] = a[c - 1], a[c]
+            i = c
+        return res
+
+
+class IndexedHeap:
+    """頂点番号`0, ..., n - 1`をキーの小さい順に取り出す，キーの変更ができるヒープ
+
+    Attributes:
+        _heap: ヒープ（頂点番号のリスト）
+        _pos: 頂点番号 -> ヒープでの位置（含まれていなければ-1）
+        _key: 頂点番号 -> キー
+
+    Note:
+        - 追加・取り出し・キーの変更 O(log n)
+        - Dijkstra法で`heapq`に`(距離, 頂点)`のタプルを積む代わりに使うと，ヒープの大きさが頂点数以下になる
+    """
+    def __init__(self, n: int) -> None:
+        """Init.
+
+        Args:
+            n (int): 頂点数
+        """
+        self._heap: list[int] = []
+        self._pos = [-1] * n
+        self._key: list[int] = [0] * n
+
+    def __len__(self) -> int:
+        """含まれる頂点の数"""
+        return len(self._heap)
+
+    def __contains__(self, v: int) -> bool:
+        """頂点`v`が含まれるか O(1)"""
+        return self._pos[v] >= 0
+
+    def key(self, v: int) -> int:
+        """頂点`v`のキー（取り出した後は最後のキー） O(1)"""
+        return self._key[v]
+
+    def _up(self, i: int) -> None:
+        """位置`i`の頂点を上へ移動"""
+        heap = self._heap
+        pos = self._pos
+        key = self._key
+        v = heap[i]
+        k = key[v]
+        while i:
+            p = (i - 1) >> 1
+            u = heap[p]
+            if not k < key[u]:
+                break
+            heap[i] = u
+            pos[u] = i
+            i = p
+        heap[i] = v
+        pos[v] = i
+
+    def _down(self, i: int) -> None:
+        """位置`i`の頂点を下へ移動"""
+        heap = self._heap
+        pos = self._pos
+        key = self._key
+        n = len(heap)
+        v = heap[i]
+        k = key[v]
+        while True:
+            c = 2 * i + 1
+            if c >= n:
+                break
+            if c + 1 < n and key[heap[c + 1]] < key[heap[c]]:
+                c += 1
+            u = heap[c]
+            if not key[u] < k:
+                break
+            heap[i] = u
+            pos[u] = i
+            i = c
+        heap[i] = v
+        pos[v] = i
+
+    def push(self, v: int, key: int) -> None:
+        """頂点`v`をキー`key`で追加 O(log n)（`v`は含まれていないこと）"""
+        assert self._pos[v] < 0
+        self._key[v] = key
+        self._heap.append(v)
+        self._up(len(self._heap) - 1)
+
+    def decrease_key(self, v: int, key: int) -> bool:
+        """頂点`v`のキーを`key`に下げる（含まれていなければ追加） O(log n)
+
+        Returns:
+            bool: キーを変更（または追加）したか（`key`が今のキー以上なら何もしない）
+        """
+        i = self._pos[v]
+        if i < 0:
+            self.push(v, key)
+            return True
+        if not key < self._key[v]:
+            return False
+        self._key[v] = key
+        self._up(i)
+        return True
+
+    def update(self, v: int, key: int) -> None:
+        """頂点`v`のキーを`key`に変更（含まれていなければ追加） O(log n)"""
+        i = self._pos[v]
+        if i < 0:
+            self.push(v, key)
+            return
+        self._key[v] = key
+        self._up(i)
+        self._down(self._pos[v])
+
+    def top(self) -> int:
+        """キーが最小の頂点 O(1)"""
+        return self._heap[0]
+
+    def pop(self) -> int:
+        """キーが最小の頂点を取り出す O(log n)"""
+        heap = self._heap
+        v = heap[0]
+        self._pos[v] = -1
+        last = heap.pop()
+        if heap:
+            heap[0] = last
+            self._down(0)
+        return v
+
+    def remove(self, v: int) -> None:
+        """頂点`v`を取り除く O(log n)（`v`は含まれていること）"""
+        i = self._pos[v]
+        assert i >= 0
+        heap = self._heap
+        self._pos[v] = -1
+        last = heap.pop()
+        if i < len(heap):
+            heap[i] = last
+            self._pos[last] = i
+            self._up(i)
+            self._down(self._pos[last])
+
+
+class RemovableHeap(Generic[T]):
+    """任意の要素を削除できる最小ヒープ（削除は遅延させる）
+
+    Attributes:
+        _heap: 要素のヒープ（削除済みの要素も含む）
+        _removed: 削除予定の要素のヒープ
+        _size: 削除済みを除いた要素数
+
+    Note:
+        - 削除する要素は`_removed`に積み，2つのヒープの先頭が等しい間まとめて取り除く
+        - 追加・削除・取り出し ならし O(log n)，最小値の参照 ならし O(1)
+    """
+    def __init__(self, array: Iterable[T] = ()) -> None:
+        """Init. O(n)"""
+        self._heap: list[T] = list(array)
+        heapify(self._heap)
+        self._removed: list[T] = []
+        self._size = len(self._heap)
+
+    def __len__(self) -> int:
+        """要素数"""
+        return self._size
+
+    def _clean(self) -> None:
+        """先頭の削除済みの要素を取り除く"""
+        heap = self._heap
+        removed = self._removed
+        while removed and heap[0] == removed[0]:
+            heappop(heap)
+            heappop(removed)
+
+    def push(self, x: T) -> None:
+        """`x`を追加 O(log n)"""
+        heappush(self._heap, x)
+        self._size += 1
+
+    def remove(self, x: T) -> None:
+        """`x`を1つ削除 ならし O(log n)（`x`は含まれていること）"""
+        heappush(self._removed, x)
+        self._size -= 1
+
+    def top(self) -> T:
+        """最小値 ならし O(1)"""
+        self._clean()
+        return self._heap[0]
+
+    def pop(self) -> T:
+        """最小値を取り出す ならし O(log n)"""
+        self._clean()
+        self._size -= 1
+        return heappop(self._heap)
+
+
+if __name__ == "__main__":
+    """動作確認"""
+    # https://judge.yosupo.jp/problem/double_ended_priority_queue
+    from atcoder.others.input import Reader, Writer
+
+    reader = Reader()
+    writer = Writer()
+    N, Q = reader.ints(2)
+    heap = IntervalHeap(reader.ints(N))
+    for _ in range(Q):
+        t = reader.int()
+        if t == 0:
+            heap.push(reader.int())
+        elif t == 1:
+            writer.print(heap.pop_min())
+        else:
+            writer.print(heap.pop_max())
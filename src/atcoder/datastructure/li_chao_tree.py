@@ -0,0 +1,375 @@
+"""Li Chao Tree / Convex Hull Trick（直線の集合についての最小値・最大値クエリ）"""
+from bisect import bisect_left
+
+import numpy as np
+
+# 直線がないことを表す切片（値はすべてこれより小さいこと）
+INF = 1 << 62
+
+
+class LiChaoTree:
+    """クエリの x 座標が事前に分かっている Li Chao Tree
+
+    Attributes:
+        _xs: クエリの x 座標（昇順，重複なし）
+        _size: 葉の数（2の冪）
+        _px: 葉 -> x 座標（`_size`個に足りない分は最後の座標で埋める）
+        _sign: 最小化なら1，最大化なら-1（最大化は符号を反転した直線で最小化する）
+        _a: 頂点 -> その頂点に置いた直線の傾き（符号反転済み，1-indexed）
+        _b: 頂点 -> その頂点に置いた直線の切片（符号反転済み，直線がなければ`INF`）
+
+    Note:
+        - 直線・線分の追加 O(log n)，O(log^2 n)，一点の値 O(log n)（nはx座標の個数）
+        - 値（傾き × x + 切片）の絶対値は`INF`未満であること（`eval_many`ではint64に収まること）
+    """
+    def __init__(self, xs: "list[int] | np.ndarray", *, minimize: bool = True) -> None:
+        """Init. O(n log n)
+
+        Args:
+            xs (list[int] | np.ndarray): クエリの x 座標（重複・順不同でよい，1つ以上）
+            minimize (bool): 最小値（`True`）・最大値（`False`）のどちらを求めるか
+        """
+        self._xs: list[int] = np.unique(np.asarray(xs, dtype=np.int64)).tolist()
+        assert self._xs
+        self._size = size = 1 << (len(self._xs) - 1).bit_length()
+        self._px = self._xs + [self._xs[-1]] * (size - len(self._xs))
+        self._sign = 1 if minimize else -1
+        self._a = [0] * (size << 1)
+        self._b = [INF] * (size << 1)
+
+    def _insert(self, k: int, a: int, b: int) -> None:
+        """頂点`k`以下に直線`a x + b`（符号反転済み）を追加 O(log n)"""
+        px = self._px
+        na = self._a
+        nb = self._b
+        depth = k.bit_length() - 1
+        width = self._size >> depth
+        left = (k - (1 << depth)) * width
+        right = left + width
+        while True:
+            mid = (left + right) >> 1
+            x = px[mid]
+            # 頂点には中央で小さい方を残し，もう一方を交点のある側の子へ送る
+            if a * x + b < na[k] * x + nb[k]:
+                na[k], a = a, na[k]
+                nb[k], b = b, nb[k]
+            if right - left == 1 or b == INF:
+                return
+            x = px[left]
+            if a * x + b < na[k] * x + nb[k]:
+                k <<= 1
+                right = mid
+                continue
+            x = px[right - 1]
+            if a * x + b < na[k] * x + nb[k]:
+                k = k << 1 | 1
+                left = mid
+                continue
+            return
+
+    def add_line(self, a: int, b: int) -> None:
+        """直線`y = a x + b`を追加 O(log n)"""
+        self._insert(1, self._sign * a, self._sign * b)
+
+    def add_segment(self, a: int, b: int, lower: int, upper: int) -> None:
+        """線分`y = a x + b (lower <= x < upper)`を追加 O(log^2 n)"""
+        a *= self._sign
+        b *= self._sign
+        left = bisect_left(self._xs, lower) + self._size
+        right = bisect_left(self._xs, upper) + self._size
+        while left < right:
+            if left & 1:
+                self._insert(left, a, b)
+                left += 1
+            if right & 1:
+                right -= 1
+                self._insert(right, a, b)
+            left >>= 1
+            right >>= 1
+
+    def query(self, x: int) -> int:
+        """`x`での最小値（最大値） O(log n)（`x`は`xs`に含まれること．直線がなければ`INF`（`-INF`））"""
+        i = bisect_left(self._xs, x)
+        assert i < len(self._xs)
+        assert self._xs[i] == x
+        na = self._a
+        nb = self._b
+        k = i + self._size
+        res = INF
+        while k:
+            y = na[k] * x + nb[k]
+            res = min(res, y)
+            k >>= 1
+        return self._sign * res
+
+    def eval_many(self, xs: np.ndarray) -> np.ndarray:
+        """`query`を配列でまとめて計算 O(n + Q log n)（直線の集合を変えない間は何度でも使える）"""
+        xs = np.asarray(xs, dtype=np.int64)
+        coords = np.array(self._xs, dtype=np.int64)
+        i = np.searchsorted(coords, xs)
+        assert np.all(i < len(coords))
+        assert np.all(coords[np.minimum(i, len(coords) - 1)] == xs)
+        na = np.array(self._a, dtype=np.int64)
+        nb = np.array(self._b, dtype=np.int64)
+        k = i + self._size
+        res = np.full(len(xs), INF, dtype=np.int64)
+        for _ in range(self._size.bit_length()):
+            np.minimum(res, na[k] * xs + nb[k], out=res)
+            k >>= 1
+        return self._sign * res
+
+
+class DynamicLiChaoTree:
+    """x 座標の範囲だけを指定し，頂点を必要になったときに作る Li Chao Tree
+
+    Attributes:
+        _lower: x 座標の最小値
+        _upper: x 座標の最大値 + 1
+        _sign: 最小化なら1，最大化なら-1（最大化は符号を反転した直線で最小化する）
+        _a: 頂点 -> その頂点に置いた直線の傾き（符号反転済み，頂点0が根）
+        _b: 頂点 -> その頂点に置いた直線の切片（符号反転済み，直線がなければ`INF`）
+        _left: 頂点 -> 左の子（なければ-1）
+        _right: 頂点 -> 右の子（なければ-1）
+
+    Note:
+        - 頂点`[l, r)`の子は`[l, m)`, `[m, r)`（`m = (l + r) // 2`）
+        - 直線・線分の追加 O(log W)，O(log^2 W)，一点の値 O(log W)（Wは x 座標の範囲の幅）
+        - 値（傾き × x + 切片）の絶対値は`INF`未満であること（`eval_many`ではint64に収まること）
+    """
+    def __init__(self, lower: int, upper: int, *, minimize: bool = True) -> None:
+        """Init.
+
+        Args:
+            lower (int): x 座標の最小値
+            upper (int): x 座標の最大値 + 1
+            minimize (bool): 最小値（`True`）・最大値（`False`）のどちらを求めるか
+        """
+        assert lower < upper
+        self._lower = lower
+        self._upper = upper
+        self._sign = 1 if minimize else -1
+        self._a = [0]
+        self._b = [INF]
+        self._left = [-1]
+        self._right = [-1]
+
+    def _new_node(self) -> int:
+        """直線のない頂点を作る"""
+        self._a.append(0)
+        self._b.append(INF)
+        self._left.append(-1)
+        self._right.append(-1)
+        return len(self._a) - 1
+
+    def _insert(self, k: int, left: int, right: int, a: int, b: int) -> None:
+        """範囲`[left, right)`の頂点`k`以下に直線`a x + b`（符号反転済み）を追加 O(log W)"""
+        na = self._a
+        nb = self._b
+        while True:
+            mid = (left + right) >> 1
+            if a * mid + b < na[k] * mid + nb[k]:
+                na[k], a = a, na[k]
+                nb[k], b = b, nb[k]
+            if right - left == 1 or b == INF:
+                return
+            x = left
+            if a * x + b < na[k] * x + nb[k]:
+                if self._left[k] < 0:
+                    self._left[k] = self._new_node()
+                k = self._left[k]
+                right = mid
+                continue
+            x = right - 1
+            if a * x + b < na[k] * x + nb[k]:
+                if self._right[k] < 0:
+                    self._right[k] = self._new_node()
+                k = self._right[k]
+                left = mid
+                continue
+            return
+
+    def add_line(self, a: int, b: int) -> None:
+        """直線`y = a x + b`を追加 O(log W)"""
+        self._insert(0, self._lower, self._upper, self._sign * a, self._sign * b)
+
+    def add_segment(self, a: int, b: int, lower: int, upper: int) -> None:
+        """線分`y = a x + b (lower <= x < upper)`を追加 O(log^2 W)"""
+        a *= self._sign
+        b *= self._sign
+        lower = max(lower, self._lower)
+        upper = min(upper, self._upper)
+        stack = [(0, self._lower, self._upper)]
+        while stack:
+            k, left, right = stack.pop()
+            if upper <= left or right <= lower:
+                continue
+            if lower <= left and right <= upper:
+                self._insert(k, left, right, a, b)
+                continue
+            mid = (left + right) >> 1
+            if self._left[k] < 0:
+                self._left[k] = self._new_node()
+            if self._right[k] < 0:
+                self._right[k] = self._new_node()
+            stack.append((self._left[k], left, mid))
+            stack.append((self._right[k], mid, right))
+
+    def query(self, x: int) -> int:
+        """`x`での最小値（最大値） O(log W)（直線がなければ`INF`（`-INF`））"""
+        assert self._lower <= x < self._upper
+        na = self._a
+        nb = self._b
+        left = self._lower
+        right = self._upper
+        k = 0
+        res = INF
+        while k >= 0:
+            y = na[k] * x + nb[k]
+            res = min(res, y)
+            mid = (left + right) >> 1
+            if x < mid:
+                k = self._left[k]
+                right = mid
+            else:
+                k = self._right[k]
+                left = mid
+        return self._sign * res
+
+    def eval_many(self, xs: np.ndarray) -> np.ndarray:
+        """`query`を配列でまとめて計算 O(頂点数 + Q log W)（直線の集合を変えない間は何度でも使える）"""
+        xs = np.asarray(xs, dtype=np.int64)
+        assert np.all((self._lower <= xs) & (xs < self._upper))
+        na = np.array(self._a, dtype=np.int64)
+        nb = np.array(self._b, dtype=np.int64)
+        children = np.array([self._left, self._right], dtype=np.int64)
+        res = np.full(len(xs), INF, dtype=np.int64)
+        k = np.zeros(len(xs), dtype=np.int64)
+        left = np.full(len(xs), self._lower, dtype=np.int64)
+        right = np.full(len(xs), self._upper, dtype=np.int64)
+        active = np.arange(len(xs))
+        # 子のない頂点に着いたクエリを除きながら，1段ずつ下る
+        while len(active):
+            kk = k[active]
+            x = xs[active]
+            res[active] = np.minimum(res[active], na[kk] * x + nb[kk])
+            mid = (left[active] + right[active]) >> 1
+            go_right = x >= mid
+            k[active] = children[go_right.astype(np.int64), kk]
+            left[active] = np.where(go_right, mid, left[active])
+            right[active] = np.where(go_right, right[active], mid)
+            active = active[k[active] >= 0]
+        return self._sign * res
+
+
+class MonotoneCHT:
+    """傾きが単調な順に直線を追加する Convex Hull Trick
+
+    Attributes:
+        _sign: 最小化なら1，最大化なら-1（最大化は符号を反転した直線で最小化する）
+        _a: 下側凸包をなす直線の傾き（符号反転済み，狭義単調減少）
+        _b: 下側凸包をなす直線の切片（符号反転済み）
+        _head: `query_monotone`で使う先頭の位置（これより前の直線は使わない）
+
+    Note:
+        - 傾きは最小化なら単調非増加，最大化なら単調非減少の順に追加すること
+        - 追加はならし O(1)，`query`は二分探索で O(log n)，x が単調非減少なら`query_monotone`でならし O(1)
+        - 両端キューの代わりにリストと先頭の位置を使う（二分探索で添字アクセスするため）
+    """
+    def __init__(self, *, minimize: bool = True) -> None:
+        """Init.
+
+        Args:
+            minimize (bool): 最小値（`True`）・最大値（`False`）のどちらを求めるか
+        """
+        self._sign = 1 if minimize else -1
+        self._a: list[int] = []
+        self._b: list[int] = []
+        self._head = 0
+
+    def __len__(self) -> int:
+        """凸包をなす直線の数"""
+        return len(self._a) - self._head
+
+    def add_line(self, a: int, b: int) -> None:
+        """直線`y = a x + b`を追加 ならし O(1)"""
+        a *= self._sign
+        b *= self._sign
+        na = self._a
+        nb = self._b
+        if len(na) > self._head:
+            assert a <= na[-1]
+            if a == na[-1]:
+                if b >= nb[-1]:
+                    return
+                na.pop()
+                nb.pop()
+        # 末尾の直線が新しい直線と1つ前の直線の下に隠れるなら取り除く
+        while len(na) - self._head >= 2:  # noqa: PLR2004
+            a1, b1, a2, b2 = na[-2], nb[-2], na[-1], nb[-1]
+            if (b - b1) * (a1 - a2) > (b2 - b1) * (a1 - a):
+                break
+            na.pop()
+            nb.pop()
+        na.append(a)
+        nb.append(b)
+
+    def query(self, x: int) -> int:
+        """`x`での最小値（最大値） O(log n)"""
+        assert len(self) > 0
+        na = self._a
+        nb = self._b
+        lo = self._head
+        hi = len(na) - 1
+        while lo < hi:
+            mid = (lo + hi) >> 1
+            if na[mid] * x + nb[mid] >= na[mid + 1] * x + nb[mid + 1]:
+                lo = mid + 1
+            else:
+                hi = mid
+        return self._sign * (na[lo] * x + nb[lo])
+
+    def query_monotone(self, x: int) -> int:
+        """`x`での最小値（最大値） ならし O(1)（`x`は呼び出しごとに単調非減少であること）"""
+        assert len(self) > 0
+        na = self._a
+        nb = self._b
+        head = self._head
+        while head + 1 < len(na) and na[head + 1] * x + nb[head + 1] <= na[head] * x + nb[head]:
+            head += 1
+        self._head = head
+        return self._sign * (na[head] * x + nb[head])
+
+    def eval_many(self, xs: np.ndarray) -> np.ndarray:
+        """`query`を配列でまとめて計算（二分探索をクエリ全体で同時に進める） O(n + Q log n)"""
+        assert len(self) > 0
+        xs = np.asarray(xs, dtype=np.int64)
+        na = np.array(self._a, dtype=np.int64)
+        nb = np.array(self._b, dtype=np.int64)
+        lo = np.full(len(xs), self._head, dtype=np.int64)
+        hi = np.full(len(xs), len(na) - 1, dtype=np.int64)
+        for _ in range(len(self).bit_length()):
+            active = lo < hi
+            mid = (lo + hi) >> 1
+            nxt = np.minimum(mid + 1, len(na) - 1)
+            go_right = na[mid] * xs + nb[mid] >= na[nxt] * xs + nb[nxt]
+            lo = np.where(active & go_right, mid + 1, lo)
+            hi = np.where(active & ~go_right, mid, hi)
+        return self._sign * (na[lo] * xs + nb[lo])
+
+
+if __name__ == "__main__":
+    """動作確認"""
+    # https://judge.yosupo.jp/problem/line_add_get_min
+    from atcoder.others.input import Reader, Writer
+
+    reader = Reader()
+    writer = Writer()
+    N, Q = reader.ints(2)
+    tree = DynamicLiChaoTree(-10**9, 10**9 + 1)
+    for _ in range(N):
+        tree.add_line(*reader.ints(2))
+    for _ in range(Q):
+        if reader.int() == 0:
+            tree.add_line(*reader.ints(2))
+        else:
+            writer.print(tree.query(reader.int()))
@@ -156,25 +156,29 @@ class SegmentTree(Generic[T]):
 
 if __name__ == "__main__":
     """動作確認"""
+    from atcoder.others.input import Reader, Writer
+
     # https://atcoder.jp/contests/practice2/tasks/practice2_j
-    N, Q = map(int, input().split())
-    A = list(map(int, input().split()))
+    reader = Reader()
+    writer = Writer()
+    N, Q = reader.ints(2)
+    A = reader.ints(N)
 
     # SegmentTreeの構築
     segtree = SegmentTree(A, max, -1)
 
     for _ in range(Q):
-        t, arg1, arg2 = map(int, input().split())
+        t, arg1, arg2 = reader.ints(3)
         match t:
             case 1:
                 X, V = arg1 - 1, arg2
                 segtree.set_value(X, V)
             case 2:
                 L, R = arg1 - 1, arg2
-                print(segtree.query(L, R))
+                writer.print(segtree.query(L, R))
             case 3:
                 X, V = arg1 - 1, arg2
                 def is_satisfied(seg_val: int, V: int = V) -> bool:
                     """条件式"""
                     return seg_val < V
-                print(segtree.max_right(X, is_satisfied) + 1)
+                writer.print(segtree.max_right(X, is_satisfied) + 1)
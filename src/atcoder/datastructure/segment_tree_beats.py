@@ -0,0 +1,284 @@
+"""Segment Tree Beats（区間chmin・chmax・加算と区間和・最小値・最大値）"""
+# 空の葉の最大値・最小値（値はすべてこれより絶対値が小さいこと）
+INF = 1 << 62
+
+
+class SegmentTreeBeats:
+    """区間chmin・区間chmax・区間加算と，区間和・区間最小値・区間最大値
+
+    Attributes:
+        _n: 元の配列の長さ
+        _log: 木の深さ
+        _size: 完全二分木の葉の数
+        _sum: 頂点 -> 区間和
+        _max: 頂点 -> 最大値
+        _max2: 頂点 -> 2番目に大きい値（なければ`-INF`）
+        _maxc: 頂点 -> 最大値の個数
+        _min: 頂点 -> 最小値
+        _min2: 頂点 -> 2番目に小さい値（なければ`INF`）
+        _minc: 頂点 -> 最小値の個数
+        _len: 頂点 -> 区間内の（元の配列の）要素数
+        _lazy: 頂点 -> 子に伝播していない加算
+        _lo: 頂点 -> 区間の左端
+        _hi: 頂点 -> 区間の右端
+
+    Note:
+        - 頂点の値はフィールドごとに別のリストに持つ（1-indexed, `_xxx[0]`は使わない）
+        - chmin(x)は「最大値 > x > 2番目に大きい値」の頂点で止めて最大値だけを書き換える（chmaxも同様）
+        - chmin・chmaxは条件を満たすまで下りる必要があるので明示的なスタックで行い，加算と取得はACL風に非再帰で行う
+        - chmin・chmaxはならし O(log^2 n)，加算・取得は O(log n)，区間はすべて左閉右開区間
+        - 参考：https://codeforces.com/blog/entry/57319
+    """
+    def __init__(self, array: list[int]) -> None:
+        """Init. O(n)
+
+        Args:
+            array (list[int]): 初期値
+        """
+        self._n = n = len(array)
+        self._log = (n - 1).bit_length() if n else 0
+        self._size = size = 1 << self._log
+        self._sum = [0] * (2 * size)
+        self._max = [-INF] * (2 * size)
+        self._max2 = [-INF] * (2 * size)
+        self._maxc = [0] * (2 * size)
+        self._min = [INF] * (2 * size)
+        self._min2 = [INF] * (2 * size)
+        self._minc = [0] * (2 * size)
+        self._len = [0] * (2 * size)
+        self._lazy = [0] * (2 * size)
+        self._lo = [0] * (2 * size)
+        self._hi = [0] * (2 * size)
+        for k in range(1, 2 * size):
+            depth = k.bit_length() - 1
+            width = size >> depth
+            self._lo[k] = (k - (1 << depth)) * width
+            self._hi[k] = self._lo[k] + width
+        self._sum[size: size + n] = array
+        self._max[size: size + n] = array
+        self._min[size: size + n] = array
+        self._maxc[size: size + n] = self._minc[size: size + n] = self._len[size: size + n] = [1] * n
+        for k in range(size - 1, 0, -1):
+            self._update(k)
+
+    def _update(self, k: int) -> None:
+        """頂点`k`の値を子から計算"""
+        lc, rc = 2 * k, 2 * k + 1
+        self._sum[k] = self._sum[lc] + self._sum[rc]
+        self._len[k] = self._len[lc] + self._len[rc]
+        mx, mx2, mxc = self._max, self._max2, self._maxc
+        if mx[lc] > mx[rc]:
+            mx[k], mxc[k] = mx[lc], mxc[lc]
+            mx2[k] = max(mx2[lc], mx[rc])
+        elif mx[lc] < mx[rc]:
+            mx[k], mxc[k] = mx[rc], mxc[rc]
+            mx2[k] = max(mx[lc], mx2[rc])
+        else:
+            mx[k], mxc[k] = mx[lc], mxc[lc] + mxc[rc]
+            mx2[k] = max(mx2[lc], mx2[rc])
+        mn, mn2, mnc = self._min, self._min2, self._minc
+        if mn[lc] < mn[rc]:
+            mn[k], mnc[k] = mn[lc], mnc[lc]
+            mn2[k] = min(mn2[lc], mn[rc])
+        elif mn[lc] > mn[rc]:
+            mn[k], mnc[k] = mn[rc], mnc[rc]
+            mn2[k] = min(mn[lc], mn2[rc])
+        else:
+            mn[k], mnc[k] = mn[lc], mnc[lc] + mnc[rc]
+            mn2[k] = min(mn2[lc], mn2[rc])
+
+    def _apply_add(self, k: int, x: int) -> None:
+        """頂点`k`の区間全体に`x`を加算"""
+        self._sum[k] += x * self._len[k]
+        self._max[k] += x
+        if self._max2[k] != -INF:
+            self._max2[k] += x
+        self._min[k] += x
+        if self._min2[k] != INF:
+            self._min2[k] += x
+        self._lazy[k] += x
+
+    def _apply_chmin(self, k: int, x: int) -> None:
+        """頂点`k`の最大値を`x`に下げる（`_max2[k] < x < _max[k]`）"""
+        mx = self._max[k]
+        self._sum[k] += (x - mx) * self._maxc[k]
+        # 値が1種類・2種類なら最小値側も最大値と同じ値を指している
+        if self._min[k] == mx:
+            self._min[k] = x
+        elif self._min2[k] == mx:
+            self._min2[k] = x
+        self._max[k] = x
+
+    def _apply_chmax(self, k: int, x: int) -> None:
+        """頂点`k`の最小値を`x`に上げる（`_min[k] < x < _min2[k]`）"""
+        mn = self._min[k]
+        self._sum[k] += (x - mn) * self._minc[k]
+        if self._max[k] == mn:
+            self._max[k] = x
+        elif self._max2[k] == mn:
+            self._max2[k] = x
+        self._min[k] = x
+
+    def _push(self, k: int) -> None:
+        """頂点`k`の加算・chmin・chmaxを子に伝播"""
+        x = self._lazy[k]
+        self._lazy[k] = 0
+        hi = self._max[k]
+        lo = self._min[k]
+        self._push_child(2 * k, x, hi, lo)
+        self._push_child(2 * k + 1, x, hi, lo)
+
+    def _push_child(self, c: int, x: int, hi: int, lo: int) -> None:
+        """子`c`に加算`x`・chmin`hi`・chmax`lo`の順に適用（最も多く呼ばれるので`_apply_xxx`を展開している）"""
+        sm = self._sum
+        mx, mx2 = self._max, self._max2
+        mn, mn2 = self._min, self._min2
+        if x:
+            sm[c] += x * self._len[c]
+            mx[c] += x
+            if mx2[c] != -INF:
+                mx2[c] += x
+            mn[c] += x
+            if mn2[c] != INF:
+                mn2[c] += x
+            self._lazy[c] += x
+        v = mx[c]
+        if v > hi:
+            sm[c] += (hi - v) * self._maxc[c]
+            if mn[c] == v:
+                mn[c] = hi
+            elif mn2[c] == v:
+                mn2[c] = hi
+            mx[c] = hi
+        v = mn[c]
+        if v < lo:
+            sm[c] += (lo - v) * self._minc[c]
+            if mx[c] == v:
+                mx[c] = lo
+            elif mx2[c] == v:
+                mx2[c] = lo
+            mn[c] = lo
+
+    def chmin(self, left: int, right: int, x: int) -> None:
+        """`a[i] = min(a[i], x) (left <= i < right)` ならし O(log^2 n)"""
+        assert 0 <= left <= right <= self._n
+        mx, mx2, lo, hi = self._max, self._max2, self._lo, self._hi
+        stack = [1]
+        while stack:
+            k = stack.pop()
+            if k < 0:
+                self._update(~k)
+                continue
+            if mx[k] <= x or hi[k] <= left or right <= lo[k]:
+                continue
+            if mx2[k] < x and left <= lo[k] and hi[k] <= right:
+                self._apply_chmin(k, x)
+                continue
+            self._push(k)
+            stack += (~k, 2 * k, 2 * k + 1)
+
+    def chmax(self, left: int, right: int, x: int) -> None:
+        """`a[i] = max(a[i], x) (left <= i < right)` ならし O(log^2 n)"""
+        assert 0 <= left <= right <= self._n
+        mn, mn2, lo, hi = self._min, self._min2, self._lo, self._hi
+        stack = [1]
+        while stack:
+            k = stack.pop()
+            if k < 0:
+                self._update(~k)
+                continue
+            if x <= mn[k] or hi[k] <= left or right <= lo[k]:
+                continue
+            if x < mn2[k] and left <= lo[k] and hi[k] <= right:
+                self._apply_chmax(k, x)
+                continue
+            self._push(k)
+            stack += (~k, 2 * k, 2 * k + 1)
+
+    def _push_boundary(self, left: int, right: int) -> None:
+        """区間`[left, right)`（葉の番号）の境界を含む頂点に，上から伝播"""
+        for i in range(self._log, 0, -1):
+            if ((left >> i) << i) != left:
+                self._push(left >> i)
+            if ((right >> i) << i) != right:
+                self._push((right - 1) >> i)
+
+    def add(self, left: int, right: int, x: int) -> None:
+        """`a[i] += x (left <= i < right)` O(log n)"""
+        assert 0 <= left <= right <= self._n
+        if left == right:
+            return
+        left += self._size
+        right += self._size
+        self._push_boundary(left, right)
+        lo, hi = left, right
+        while lo < hi:
+            if lo & 1:
+                self._apply_add(lo, x)
+                lo += 1
+            if hi & 1:
+                hi -= 1
+                self._apply_add(hi, x)
+            lo >>= 1
+            hi >>= 1
+        for i in range(1, self._log + 1):
+            if ((left >> i) << i) != left:
+                self._update(left >> i)
+            if ((right >> i) << i) != right:
+                self._update((right - 1) >> i)
+
+    def _collect(self, left: int, right: int) -> list[int]:
+        """区間`[left, right)`を覆う頂点（伝播済み）"""
+        left += self._size
+        right += self._size
+        self._push_boundary(left, right)
+        nodes = []
+        while left < right:
+            if left & 1:
+                nodes.append(left)
+                left += 1
+            if right & 1:
+                right -= 1
+                nodes.append(right)
+            left >>= 1
+            right >>= 1
+        return nodes
+
+    def query_sum(self, left: int, right: int) -> int:
+        """`sum(a[left: right])` O(log n)"""
+        assert 0 <= left <= right <= self._n
+        s = self._sum
+        return sum(s[k] for k in self._collect(left, right))
+
+    def query_min(self, left: int, right: int) -> int:
+        """`min(a[left: right])` O(log n)（空の区間なら`INF`）"""
+        assert 0 <= left <= right <= self._n
+        m = self._min
+        return min((m[k] for k in self._collect(left, right)), default=INF)
+
+    def query_max(self, left: int, right: int) -> int:
+        """`max(a[left: right])` O(log n)（空の区間なら`-INF`）"""
+        assert 0 <= left <= right <= self._n
+        m = self._max
+        return max((m[k] for k in self._collect(left, right)), default=-INF)
+
+
+if __name__ == "__main__":
+    """動作確認"""
+    # https://judge.yosupo.jp/problem/range_chmin_chmax_add_range_sum
+    from atcoder.others.input import Reader, Writer
+
+    reader = Reader()
+    writer = Writer()
+    N, Q = reader.ints(2)
+    seg = SegmentTreeBeats(reader.ints(N))
+    for _ in range(Q):
+        t = reader.int()
+        if t == 0:
+            seg.chmin(*reader.ints(3))
+        elif t == 1:
+            seg.chmax(*reader.ints(3))
+        elif t == 2:  # noqa: PLR2004
+            seg.add(*reader.ints(3))
+        else:
+            writer.print(seg.query_sum(*reader.ints(2)))
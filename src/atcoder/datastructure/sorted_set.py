@@ -200,18 +200,22 @@ class SortedSet(Generic[T]):
 
 if __name__ == "__main__":
     """動作確認"""
+    from atcoder.others.input import Reader, Writer
+
     # https://atcoder.jp/contests/abc217/tasks/abc217_d
-    L, Q = map(int, input().split())
+    reader = Reader()
+    writer = Writer()
+    L, Q = reader.ints(2)
 
     # SortedSetの構築
     sortedset = SortedSet([0, L])
 
     for _ in range(Q):
-        c, x = map(int, input().split())
+        c, x = reader.ints(2)
         if c == 1:
             sortedset.add(x)
         elif sortedset.ge(x) is not None and sortedset.le(x) is not None:
             right = sortedset.ge(x)
             left = sortedset.le(x)
             if right is not None and left is not None:
-                print(right - left)
+                writer.print(right - left)
@@ -0,0 +1,127 @@
+"""Sparse Table / Disjoint Sparse Table"""
+import math
+import operator
+from typing import Callable, Generic, TypeVar
+
+import numpy as np
+
+T = TypeVar("T")
+
+# 演算名 -> (NumPyのufunc, Pythonの関数)
+IDEMPOTENT_OPS: dict[str, tuple[np.ufunc, Callable]] = {
+    "min": (np.minimum, min),
+    "max": (np.maximum, max),
+    "gcd": (np.gcd, math.gcd),
+    "and": (np.bitwise_and, operator.and_),
+    "or": (np.bitwise_or, operator.or_),
+}
+
+
+class SparseTable:
+    """冪等な演算（min, max, gcd, and, or）についての静的な区間クエリ
+
+    Attributes:
+        _n: 元の配列の長さ
+        _ufunc: 演算（NumPy）
+        _func: 演算（Python）
+        _table: `_table[k, i]`は`op(array[i: i + 2^k])`（範囲外は未使用, shape = (LOG, n)）
+        _log: `_log[x]`は`floor(log2(x))`
+        _log_array: `_log`のNumPy配列
+
+    Note:
+        - 各段は1つ前の段をずらしたスライス同士に`np.minimum`などを適用して構築 O(n log n)
+        - クエリは左閉右開区間で O(1)，`query_many`は配列でまとめて計算
+    """
+    def __init__(self, array: "list[int] | np.ndarray", op: str = "min") -> None:
+        """Init. O(n log n)
+
+        Args:
+            array (list[int] | np.ndarray): 配列（int64に収まること）
+            op (str): 演算（"min", "max", "gcd", "and", "or"）
+        """
+        self._ufunc, self._func = IDEMPOTENT_OPS[op]
+        a = np.array(array, dtype=np.int64).reshape(-1)
+        n = self._n = len(a)
+        levels = max(n, 1).bit_length()
+        self._table = np.zeros((levels, n), dtype=np.int64)
+        self._table[0] = a
+        for k in range(1, levels):
+            half = 1 << (k - 1)
+            prev = self._table[k - 1]
+            self._table[k, : n - (1 << k) + 1] = self._ufunc(prev[: n - (1 << k) + 1], prev[half: n - half + 1])
+        self._log = [0] * (n + 1)
+        for x in range(2, n + 1):
+            self._log[x] = self._log[x >> 1] + 1
+        self._log_array = np.array(self._log, dtype=np.int64)
+
+    def query(self, left: int, right: int) -> int:
+        """`op(array[left: right])` O(1)（`left < right`）"""
+        assert 0 <= left < right <= self._n
+        k = self._log[right - left]
+        t = self._table
+        return self._func(int(t[k, left]), int(t[k, right - (1 << k)]))
+
+    def query_many(self, left: np.ndarray, right: np.ndarray) -> np.ndarray:
+        """`query`を配列でまとめて計算 O(Q)"""
+        left = np.asarray(left, dtype=np.int64)
+        right = np.asarray(right, dtype=np.int64)
+        assert np.all((left >= 0) & (left < right) & (right <= self._n))
+        k = self._log_array[right - left]
+        return self._ufunc(self._table[k, left], self._table[k, right - (1 << k)])
+
+
+class DisjointSparseTable(Generic[T]):
+    """結合的な演算（冪等でなくてよい：mod付きの和・積，行列積など）についての静的な区間クエリ
+
+    Attributes:
+        _n: 元の配列の長さ
+        _func: 演算
+        _table: `_table[k]`は段`k`（長さ`2^k`のブロックの中央から左右に伸ばした累積）のリスト
+
+    Note:
+        - 構築 O(n log n)，クエリは演算1回で O(1)（左閉右開区間）
+        - 演算は結合法則を満たせばよく，可換でなくてもよい
+    """
+    def __init__(self, array: list[T], func: Callable[[T, T], T]) -> None:
+        """Init. O(n log n)
+
+        Args:
+            array (list[T]): 配列
+            func (Callable[[T, T], T]): 結合的な演算
+        """
+        self._func = func
+        n = self._n = len(array)
+        levels = max(n - 1, 1).bit_length() + 1
+        self._table: list[list[T]] = [list(array)]
+        for k in range(1, levels):
+            row = list(array)
+            half = 1 << (k - 1)
+            for mid in range(half, n, 1 << k):
+                # [mid - half, mid) は右から左へ，[mid, mid + half) は左から右へ累積
+                for i in range(mid - 2, mid - half - 1, -1):
+                    row[i] = func(array[i], row[i + 1])
+                for i in range(mid + 1, min(mid + half, n)):
+                    row[i] = func(row[i - 1], array[i])
+            self._table.append(row)
+
+    def query(self, left: int, right: int) -> T:
+        """`func(array[left: right])` O(1)（`left < right`）"""
+        assert 0 <= left < right <= self._n
+        right -= 1
+        if left == right:
+            return self._table[0][left]
+        row = self._table[(left ^ right).bit_length()]
+        return self._func(row[left], row[right])
+
+
+if __name__ == "__main__":
+    """動作確認"""
+    # https://judge.yosupo.jp/problem/staticrmq
+    from atcoder.others.input import Reader, Writer
+
+    reader = Reader()
+    writer = Writer()
+    N, Q = reader.ints(2)
+    st = SparseTable(reader.int_array(N), "min")
+    LR = reader.matrix(Q, 2)
+    writer.lines(st.query_many(LR[:, 0], LR[:, 1]).tolist())
@@ -79,21 +79,25 @@ class UnionFind:
 
 if __name__ == "__main__":
     """動作確認"""
+    from atcoder.others.input import Reader, Writer
+
     # https://atcoder.jp/contests/atc001/tasks/unionfind_a
-    N, Q = map(int, input().split())
+    reader = Reader()
+    writer = Writer()
+    N, Q = reader.ints(2)
 
     # UnionFindの構築
     uf = UnionFind(N)
 
     for _ in range(Q):
-        P, A, B = map(int, input().split())
+        P, A, B = reader.ints(3)
         A -= 1
         B -= 1
         if P == 0:
             uf.union(A, B)
         elif uf.is_same_group(A, B):
-            print("Yes")
+            writer.print("Yes")
         else:
-            print("No")
+            writer.print("No")
 
-    print("uf=\n", uf)
+    writer.print("uf=\n", uf)
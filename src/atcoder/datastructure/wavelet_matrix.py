@@ -0,0 +1,147 @@
+"""Wavelet Matrix"""
+from bisect import bisect_left
+
+import numpy as np
+
+# _MASKS[i]は下位iビットが1の整数
+_MASKS = [(1 << i) - 1 for i in range(64)]
+
+
+class WaveletMatrix:
+    """静的な整数列についての区間k番目・区間の値の個数などのクエリ
+
+    Attributes:
+        _n: 列の長さ
+        _values: 座標圧縮後の値 -> 元の値（昇順のリスト）
+        _bits: 圧縮後の値のビット数
+        _words: 段ごとのビット列（64ビットずつ整数に詰めたリスト，上位ビットの段から順に）
+        _ones: 段ごとの`_words[k][j]`より前の1の個数（`_ones[k][j]`は`rank1(64 * j)`）
+        _zeros: 段ごとの0の個数
+
+    Note:
+        - 値を座標圧縮するので，段数は値の種類数σに対して log σ
+        - 各段はNumPyで「ビットを取り出す → 64ビットずつ詰める → 0を前，1を後ろに安定に並べ替える」ので構築 O(n log σ)
+        - rank（0の個数 = 位置 - 1の個数）はブロックの累積和と`int.bit_count()`で O(1)，各クエリは O(log σ)
+        - 区間はすべて左閉右開区間
+    """
+    def __init__(self, array: "list[int] | np.ndarray") -> None:
+        """Init. O(n log σ)
+
+        Args:
+            array (list[int] | np.ndarray): 整数列（int64に収まること）
+        """
+        a = np.array(array, dtype=np.int64).reshape(-1)
+        values, cur = np.unique(a, return_inverse=True)
+        self._n = n = len(a)
+        self._values: list[int] = values.tolist()
+        self._bits = bits = max(len(values) - 1, 1).bit_length()
+        self._words: list[list[int]] = []
+        self._ones: list[list[int]] = []
+        self._zeros: list[int] = []
+        padded = (n // 64 + 1) * 64
+        cur = cur.reshape(-1).astype(np.int64)
+        for k in range(bits - 1, -1, -1):
+            b = ((cur >> k) & 1).astype(np.uint8)
+            packed = np.zeros(padded, dtype=np.uint8)
+            packed[:n] = b
+            self._words.append(np.packbits(packed, bitorder="little").view("<u8").tolist())
+            cumsum = np.zeros(n + 1, dtype=np.int64)
+            np.cumsum(b, out=cumsum[1:])
+            self._ones.append(cumsum[::64].tolist())
+            self._zeros.append(n - int(cumsum[-1]))
+            cur = np.concatenate((cur[b == 0], cur[b == 1]))
+
+    def __len__(self) -> int:
+        """列の長さ"""
+        return self._n
+
+    def _compress(self, x: int) -> int:
+        """`x`未満の値の種類数（= `x`以上の最小の値の圧縮後の値）"""
+        return bisect_left(self._values, x)
+
+    def kth_smallest(self, left: int, right: int, k: int) -> int:
+        """`sorted(array[left: right])[k]` O(log σ)（`k`は0-indexed）"""
+        assert 0 <= left <= right <= self._n
+        assert 0 <= k < right - left
+        masks = _MASKS
+        res = 0
+        for words, ones, zeros in zip(self._words, self._ones, self._zeros):
+            w = left >> 6
+            l0 = left - ones[w] - (words[w] & masks[left & 63]).bit_count()
+            w = right >> 6
+            r0 = right - ones[w] - (words[w] & masks[right & 63]).bit_count()
+            res <<= 1
+            if k < r0 - l0:
+                left, right = l0, r0
+            else:
+                k -= r0 - l0
+                res |= 1
+                left += zeros - l0
+                right += zeros - r0
+        return self._values[res]
+
+    def kth_largest(self, left: int, right: int, k: int) -> int:
+        """`sorted(array[left: right], reverse=True)[k]` O(log σ)（`k`は0-indexed）"""
+        return self.kth_smallest(left, right, right - left - 1 - k)
+
+    def _count_less(self, left: int, right: int, c: int) -> int:
+        """`array[left: right]`のうち圧縮後の値が`c`未満のものの個数 O(log σ)"""
+        if c >= 1 << self._bits:
+            return right - left
+        masks = _MASKS
+        res = 0
+        k = self._bits
+        for words, ones, zeros in zip(self._words, self._ones, self._zeros):
+            k -= 1
+            w = left >> 6
+            l0 = left - ones[w] - (words[w] & masks[left & 63]).bit_count()
+            w = right >> 6
+            r0 = right - ones[w] - (words[w] & masks[right & 63]).bit_count()
+            if c >> k & 1:
+                res += r0 - l0
+                left += zeros - l0
+                right += zeros - r0
+            else:
+                left, right = l0, r0
+        return res
+
+    def count_less(self, left: int, right: int, x: int) -> int:
+        """`array[left: right]`のうち`x`未満の値の個数 O(log σ)"""
+        assert 0 <= left <= right <= self._n
+        return self._count_less(left, right, self._compress(x))
+
+    def range_freq(self, left: int, right: int, lower: int, upper: int) -> int:
+        """`array[left: right]`のうち`lower`以上`upper`未満の値の個数 O(log σ)"""
+        assert 0 <= left <= right <= self._n
+        if lower >= upper:
+            return 0
+        return (self._count_less(left, right, self._compress(upper))
+                - self._count_less(left, right, self._compress(lower)))
+
+    def prev_value(self, left: int, right: int, x: int) -> int | None:
+        """`array[left: right]`のうち`x`未満の最大の値（存在しなければ`None`） O(log σ)"""
+        assert 0 <= left <= right <= self._n
+        count = self._count_less(left, right, self._compress(x))
+        if count == 0:
+            return None
+        return self.kth_smallest(left, right, count - 1)
+
+    def next_value(self, left: int, right: int, x: int) -> int | None:
+        """`array[left: right]`のうち`x`以上の最小の値（存在しなければ`None`） O(log σ)"""
+        assert 0 <= left <= right <= self._n
+        count = self._count_less(left, right, self._compress(x))
+        if count == right - left:
+            return None
+        return self.kth_smallest(left, right, count)
+
+
+if __name__ == "__main__":
+    """動作確認"""
+    # https://judge.yosupo.jp/problem/range_kth_smallest
+    from atcoder.others.input import Reader, Writer
+
+    reader = Reader()
+    writer = Writer()
+    N, Q = reader.ints(2)
+    wm = WaveletMatrix(reader.int_array(N))
+    writer.lines(wm.kth_smallest(*reader.ints(3)) for _ in range(Q))
@@ -1,10 +1,5 @@
 """強連結成分分解"""
-import sys
 
-sys.setrecursionlimit(10**9)
-
-# import pypyjit
-# pypyjit.set_param('max_unroll_recursion=-1')
 
 def scc(N: int, edges: list[tuple[int, int]]) -> list[list[int]]:  # noqa: C901, PLR0915
     """有向グラフを強連結成分分解し、トポロジカルソートしたものを返す`O(N + M)`
@@ -84,14 +79,16 @@ def scc(N: int, edges: list[tuple[int, int]]) -> list[list[int]]:  # noqa: C901,
 
 if __name__ == "__main__":
     """動作確認"""
+    from atcoder.others.input import Reader, Writer
+
     # https://atcoder.jp/contests/practice2/tasks/practice2_g
-    N, M = map(int, input().split())
-    edges: list[tuple[int, int]] = []
-    for _ in range(M):
-        a, b = map(int, input().split())
-        edges.append((a, b))
+    reader = Reader()
+    writer = Writer()
+    N, M = reader.ints(2)
+    AB = reader.ints(2 * M)
+    edges: list[tuple[int, int]] = list(zip(AB[::2], AB[1::2]))
 
     groups = scc(N, edges)
-    print(len(groups))
+    writer.print(len(groups))
     for g in groups:
-        print(len(g), *g)
+        writer.print(len(g), *g)
@@ -25,7 +25,7 @@ def prepare(N: int, MOD: int) -> tuple[list[int], list[int]]:
     facts_list = facts.ravel().tolist()
 
     invs = np.arange(1, nsq + 1, dtype=np.int64).reshape(nrt, nrt)
-    invs[-1, -1] = pow(facts[-1], MOD - 2, MOD)
+    invs[-1, -1] = pow(int(facts[-1, -1]), MOD - 2, MOD)
     for i in range(nrt - 2, -1, -1):
         invs[:, i] = invs[:, i] * invs[:, i + 1] % MOD
     for i in range(nrt - 2, -1, -1):
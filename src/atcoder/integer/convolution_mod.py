@@ -0,0 +1,88 @@
+"""畳み込み (mod MOD)"""
+from functools import reduce
+
+import numpy as np
+
+# 値を15ビットずつ2つに分けてから掛けることで，積をint64（FFTではfloat64の仮数部）に収める
+_SHIFT = 15
+_LIMBS = 2
+
+# FFTの長さがこれを超えると15ビットずつでは丸め誤差が0.5に近づくので，10ビットずつ3つに分ける
+_SAFE_SIZE = 1 << 18
+_WIDE_SHIFT = 10
+_WIDE_LIMBS = 3
+
+# 10ビットずつに分けても誤差なく丸められるFFTの長さの上限
+_MAX_SIZE = 1 << 24
+
+# これ以下の長さなら`np.convolve`で直接計算する
+_NAIVE_THRESHOLD = 64
+
+
+def _split(x: np.ndarray, shift: int, limbs: int) -> list[np.ndarray]:
+    """`x`を下位から`shift`ビットずつ`limbs`個に分ける"""
+    mask = (1 << shift) - 1
+    return [(x >> (shift * i)) & mask for i in range(limbs)]
+
+
+def _combine(parts: list[np.ndarray], shift: int, mod: int) -> np.ndarray:
+    """`sum(parts[k] * 2^(shift * k)) (mod mod)`（各値は`mod`未満に簡約済み）"""
+    res = parts[-1]
+    for part in reversed(parts[:-1]):
+        res = ((res << shift) % mod + part) % mod
+    return res
+
+
+def convolve_mod(f: "list[int] | np.ndarray", g: "list[int] | np.ndarray", mod: int) -> np.ndarray:
+    """`h[k] = sum(f[i] * g[k - i]) (mod mod)` O((n + m) log(n + m))
+
+    Args:
+        f (list[int] | np.ndarray): 数列
+        g (list[int] | np.ndarray): 数列
+        mod (int): 法（`mod < 2^30`，素数でなくてよい）
+
+    Returns:
+        np.ndarray: 長さ`len(f) + len(g) - 1`の畳み込み（int64）
+
+    Note:
+        - 短い方が`_NAIVE_THRESHOLD`以下なら`np.convolve`，そうでなければ`np.fft.rfft`で計算する
+        - FFTの丸め誤差は長さ × 2^(2 * 分割のビット数) に比例する．15ビットずつ2つに分けるのは
+          FFTの長さが`_SAFE_SIZE = 2^18`以下のときだけで，それより長ければ10ビットずつ3つに分ける（変換の回数は約1.6倍）
+        - 10ビットずつでも`len(f) + len(g) - 1 <= _MAX_SIZE = 2^24`が必要
+    """
+    assert mod < 1 << (_SHIFT * _LIMBS)
+    f = np.asarray(f, dtype=np.int64) % mod
+    g = np.asarray(g, dtype=np.int64) % mod
+    if len(f) == 0 or len(g) == 0:
+        return np.zeros(0, dtype=np.int64)
+    n = len(f) + len(g) - 1
+    assert n <= _MAX_SIZE
+    size = 1 << (n - 1).bit_length()
+    shift, limbs = (_SHIFT, _LIMBS) if size <= _SAFE_SIZE else (_WIDE_SHIFT, _WIDE_LIMBS)
+    fs, gs = _split(f, shift, limbs), _split(g, shift, limbs)
+    # parts[k] = sum(fs[i] * gs[k - i])
+    degrees = range(2 * limbs - 1)
+    pairs = [[(i, k - i) for i in range(max(0, k - limbs + 1), min(k, limbs - 1) + 1)] for k in degrees]
+    if min(len(f), len(g)) <= _NAIVE_THRESHOLD:
+        parts = [reduce(np.add, [np.convolve(fs[i], gs[j]) for i, j in pair]) % mod for pair in pairs]
+        return _combine(parts, shift, mod)
+    rfs = [np.fft.rfft(x, size) for x in fs]
+    rgs = [np.fft.rfft(x, size) for x in gs]
+
+    def inverse(x: np.ndarray) -> np.ndarray:
+        """逆変換して整数に丸め，`mod`で簡約"""
+        return np.rint(np.fft.irfft(x, size)[:n]).astype(np.int64) % mod
+    return _combine([inverse(reduce(np.add, [rfs[i] * rgs[j] for i, j in pair])) for pair in pairs], shift, mod)
+
+
+if __name__ == "__main__":
+    """動作確認"""
+    # https://judge.yosupo.jp/problem/convolution_mod_1000000007
+    from atcoder.others.input import Reader, Writer
+
+    reader = Reader()
+    writer = Writer()
+    N, M = reader.ints(2)
+    a = reader.int_array(N)
+    b = reader.int_array(M)
+    writer.array(convolve_mod(a, b, 10**9 + 7))
@@ -0,0 +1,134 @@
+"""線形漸化式 (mod MOD)"""
+import numpy as np
+
+from atcoder.integer.convolution_mod import convolve_mod
+from atcoder.integer.matrix_mod import mat_mul_mod
+
+
+def berlekamp_massey(a: "list[int] | np.ndarray", mod: int) -> list[int]:
+    """数列`a`を満たす最短の線形漸化式の係数 O(n^2)
+
+    Args:
+        a (list[int] | np.ndarray): 数列の先頭の項
+        mod (int): 法（素数，`mod < 2^30`）
+
+    Returns:
+        list[int]: `a[i] = c[0] * a[i - 1] + c[1] * a[i - 2] + ... + c[d - 1] * a[i - d] (mod mod)`を満たす`c`
+
+    Note:
+        - 次数`d`の漸化式を復元するには，先頭の`2d`項が必要
+        - ずれの計算（内積）と漸化式の更新はNumPyで行う
+    """
+    a = np.asarray(a, dtype=np.int64) % mod
+    n = len(a)
+    c = np.zeros(2 * n + 2, dtype=np.int64)  # 現在の漸化式（特性多項式の逆順，c[0] = 1）
+    b = np.zeros(2 * n + 2, dtype=np.int64)  # 最後に次数が変わる直前の漸化式
+    c[0] = b[0] = 1
+    length = 0
+    b_length = 0
+    shift = 1
+    last = 1
+    for i in range(n):
+        # 現在の漸化式で a[i] を予測したときのずれ
+        d = (int(a[i]) + int(mat_mul_mod(c[1: length + 1], a[i - length: i][::-1], mod))) % mod
+        if d == 0:
+            shift += 1
+            continue
+        coef = d * pow(last, mod - 2, mod) % mod
+        prev = c[: length + 1].copy() if 2 * length <= i else None
+        c[shift: shift + b_length + 1] = (c[shift: shift + b_length + 1] - coef * b[: b_length + 1]) % mod
+        if prev is not None:
+            b[: length + 1] = prev
+            b_length = length
+            length = i + 1 - length
+            last = d
+            shift = 1
+        else:
+            shift += 1
+    return ((-c[1: length + 1]) % mod).tolist()
+
+
+def bostan_mori(p: "list[int] | np.ndarray", q: "list[int] | np.ndarray", n: int, mod: int) -> int:
+    """有理式`P(x) / Q(x)`の`x^n`の係数 O(d log d log n)
+
+    Args:
+        p (list[int] | np.ndarray): 分子の係数（`len(p) < len(q)`）
+        q (list[int] | np.ndarray): 分母の係数（`q[0]`は`mod`と互いに素）
+        n (int): 次数（10^18程度でもよい）
+        mod (int): 法（`mod < 2^30`）
+
+    Returns:
+        int: `[x^n] P(x) / Q(x) (mod mod)`
+
+    Note:
+        - `P(x) / Q(x) = P(x) Q(-x) / (Q(x) Q(-x))`の分母は偶関数なので，
+          分子から`n`と偶奇の同じ次数の項だけを取り出すと`n`を半分にできる
+    """
+    p = np.asarray(p, dtype=np.int64) % mod
+    q = np.asarray(q, dtype=np.int64) % mod
+    while n and len(p):
+        q_neg = q.copy()
+        q_neg[1::2] = (-q_neg[1::2]) % mod
+        p = convolve_mod(p, q_neg, mod)[n & 1:: 2]
+        q = convolve_mod(q, q_neg, mod)[::2]
+        n >>= 1
+    if len(p) == 0:
+        return 0
+    return int(p[0]) * pow(int(q[0]), -1, mod) % mod
+
+
+def linear_recurrence_nth(a: list[int], c: list[int], n: int, mod: int) -> int:
+    """線形漸化式`a[i] = c[0] * a[i - 1] + ... + c[d - 1] * a[i - d]`の第`n`項（0-indexed） O(d log d log n)
+
+    Args:
+        a (list[int]): 先頭の`d`項
+        c (list[int]): 漸化式の係数（長さ`d`）
+        n (int): 項の番号（10^18程度でもよい）
+        mod (int): 法（`mod < 2^30`）
+
+    Returns:
+        int: 第`n`項 (mod mod)
+
+    Note:
+        - 母関数は`P(x) / Q(x)`，`Q(x) = 1 - c[0] x - ... - c[d - 1] x^d`，`P(x) = A(x) Q(x) mod x^d`
+    """
+    d = len(c)
+    assert len(a) >= d
+    if n < len(a):
+        return a[n] % mod
+    q = np.zeros(d + 1, dtype=np.int64)
+    q[0] = 1
+    q[1:] = (-np.asarray(c, dtype=np.int64)) % mod
+    p = convolve_mod(a[:d], q, mod)[:d]
+    return bostan_mori(p, q, n, mod)
+
+
+def guess_nth_term(a: list[int], n: int, mod: int) -> int:
+    """数列の先頭の項`a`から最短の線形漸化式を推定し，第`n`項を求める O(len(a)^2 + d log d log n)
+
+    Args:
+        a (list[int]): 数列の先頭の項（漸化式の次数の2倍以上）
+        n (int): 項の番号（0-indexed）
+        mod (int): 法（素数，`mod < 2^30`）
+
+    Returns:
+        int: 第`n`項 (mod mod)
+    """
+    c = berlekamp_massey(a, mod)
+    if not c:
+        # すべて0
+        return 0
+    return linear_recurrence_nth(a, c, n, mod)
+
+
+if __name__ == "__main__":
+    """動作確認"""
+    # https://judge.yosupo.jp/problem/kth_term_of_linearly_recurrent_sequence
+    from atcoder.others.input import Reader, Writer
+
+    reader = Reader()
+    writer = Writer()
+    d, k = reader.ints(2)
+    a = reader.ints(d)
+    c = reader.ints(d)
+    writer.print(linear_recurrence_nth(a, c, k, 998244353))
@@ -0,0 +1,75 @@
+"""行列の積・累乗 (mod MOD)"""
+import numpy as np
+
+# 値を上位・下位15ビットに分けてから掛けることで，積和をfloat64で誤差なく計算できる範囲に収める
+_SHIFT = 15
+_MASK = (1 << _SHIFT) - 1
+
+
+def mat_mul_mod(a: "list[list[int]] | np.ndarray", b: "list[list[int]] | np.ndarray", mod: int) -> np.ndarray:
+    """行列の積`a @ b (mod mod)` O(nmk)
+
+    Args:
+        a (list[list[int]] | np.ndarray): 行列（またはベクトル）
+        b (list[list[int]] | np.ndarray): 行列（またはベクトル）
+        mod (int): 法（`mod < 2^30`）
+
+    Returns:
+        np.ndarray: 積（int64）
+
+    Note:
+        - `a = a1 * 2^15 + a0`，`b = b1 * 2^15 + b0`と分けると，各積は2^30未満なので，
+          内側の次元が2^22未満なら積和がfloat64の仮数部（53ビット）に収まり，誤差なく計算できる
+        - int64の行列積はBLASを使わず遅いので，float64の行列積で計算する
+        - 998244353, 10^9 + 7 はどちらも2^30未満
+    """
+    assert mod < 1 << (2 * _SHIFT)
+    a = np.asarray(a, dtype=np.int64) % mod
+    b = np.asarray(b, dtype=np.int64) % mod
+    assert a.shape[-1] < 1 << 22
+    a1, a0 = (a >> _SHIFT).astype(np.float64), (a & _MASK).astype(np.float64)
+    b1, b0 = (b >> _SHIFT).astype(np.float64), (b & _MASK).astype(np.float64)
+
+    def dot(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        """浮動小数点数の行列積（BLAS）を整数に戻して`mod`で簡約"""
+        return (x @ y).astype(np.int64) % mod
+    hi = dot(a1, b1)
+    mid = (dot(a1, b0) + dot(a0, b1)) % mod
+    lo = dot(a0, b0)
+    return ((hi << (2 * _SHIFT)) % mod + (mid << _SHIFT) + lo) % mod
+
+
+def mat_pow_mod(a: "list[list[int]] | np.ndarray", e: int, mod: int) -> np.ndarray:
+    """正方行列の累乗`a^e (mod mod)` O(n^3 log e)
+
+    Args:
+        a (list[list[int]] | np.ndarray): 正方行列
+        e (int): 指数（0以上，10^18程度でもよい）
+        mod (int): 法（`mod < 2^30`）
+
+    Returns:
+        np.ndarray: 累乗（int64）
+    """
+    assert e >= 0
+    a = np.asarray(a, dtype=np.int64) % mod
+    assert a.ndim == 2  # noqa: PLR2004
+    assert a.shape[0] == a.shape[1]
+    res = np.eye(len(a), dtype=np.int64) % mod
+    while e:
+        if e & 1:
+            res = mat_mul_mod(res, a, mod)
+        e >>= 1
+        if e:
+            a = mat_mul_mod(a, a, mod)
+    return res
+
+
+if __name__ == "__main__":
+    """動作確認"""
+    # https://judge.yosupo.jp/problem/pow_of_matrix
+    from atcoder.others.input import Reader, Writer
+
+    reader = Reader()
+    writer = Writer()
+    N, K = reader.ints(2)
+    writer.array(mat_pow_mod(reader.matrix(N, N), K, 998244353))
@@ -0,0 +1,294 @@
+"""剰余演算（逆元・中国剰余定理・floor sum・原始根・離散対数）"""
+from math import gcd, isqrt
+
+import numpy as np
+
+from atcoder.integer.prime_factorization import prime_factorize
+
+
+def inv_gcd(a: int, b: int) -> tuple[int, int]:
+    """`(g, x)`：`g = gcd(a, b)`，`a x ≡ g (mod b)`，`0 <= x < b / g` O(log b)
+
+    Note:
+        - 拡張ユークリッドの互除法
+        - 参考：https://github.com/atcoder/ac-library/blob/master/atcoder/internal_math.hpp
+    """
+    a %= b
+    if a == 0:
+        return b, 0
+    s, t = b, a
+    m0, m1 = 0, 1
+    while t:
+        u = s // t
+        s -= t * u
+        m0 -= m1 * u
+        s, t = t, s
+        m0, m1 = m1, m0
+    if m0 < 0:
+        m0 += b // s
+    return s, m0
+
+
+def mod_inverse(a: int, mod: int) -> int:
+    """`a`の逆元 (mod mod) O(log mod)（`mod`は素数でなくてよい）
+
+    Raises:
+        ValueError: `a`と`mod`が互いに素でないとき
+    """
+    g, x = inv_gcd(a, mod)
+    if g != 1:
+        msg = f"{a} is not invertible modulo {mod}"
+        raise ValueError(msg)
+    return x
+
+
+def _prefix_products(a: np.ndarray, mod: int) -> np.ndarray:
+    """累積積`a[0] * ... * a[i] (mod mod)` O(n)
+
+    `sqrt(n)`×`sqrt(n)`の行列に並べ，列方向・行方向の順にまとめて掛ける．
+    """
+    n = len(a)
+    r = isqrt(n - 1) + 1
+    flat = np.ones(r * r, dtype=np.int64)
+    flat[:n] = a
+    p = flat.reshape(r, r)
+    for j in range(1, r):
+        p[:, j] = p[:, j] * p[:, j - 1] % mod
+    for i in range(1, r):
+        p[i] = p[i] * p[i - 1, -1] % mod
+    return p.ravel()[:n]
+
+
+def batch_inverse(values: "list[int] | np.ndarray", mod: int) -> np.ndarray:
+    """各要素の逆元 (mod mod) をまとめて計算 O(n + log mod)
+
+    Args:
+        values (list[int] | np.ndarray): 整数列（各要素は`mod`と互いに素）
+        mod (int): 法（`mod < 2^31`，素数でなくてよい）
+
+    Returns:
+        np.ndarray: 逆元の配列（int64）
+
+    Raises:
+        ValueError: `mod`と互いに素でない要素があるとき（最初のそのような要素とその位置を示す）
+
+    Note:
+        - `inv(a[i]) = (a[0] ... a[i - 1]) (a[i + 1] ... a[n - 1]) inv(a[0] ... a[n - 1])`なので，
+          累積積を左右から計算すれば，逆元の計算（拡張ユークリッドの互除法）は全体の積について1回で済む
+    """
+    assert mod < 1 << 31
+    a = np.asarray(values, dtype=np.int64) % mod
+    if len(a) == 0:
+        return a
+    bad = np.flatnonzero(np.gcd(a, mod) != 1)
+    if len(bad):
+        i = int(bad[0])
+        msg = f"values[{i}] = {values[i]} is not invertible modulo {mod}"
+        raise ValueError(msg)
+    prefix = _prefix_products(a, mod)
+    suffix = _prefix_products(a[::-1], mod)[::-1]
+    inv_total = mod_inverse(int(prefix[-1]), mod)
+    left = np.ones_like(a)
+    left[1:] = prefix[:-1]
+    right = np.ones_like(a)
+    right[:-1] = suffix[1:]
+    return left * right % mod * inv_total % mod
+
+
+def crt(r: list[int], m: list[int]) -> tuple[int, int]:
+    """中国剰余定理：`x ≡ r[i] (mod m[i])`をすべて満たす`x ≡ y (mod z)`の`(y, z)` O(k log lcm(m))
+
+    Returns:
+        tuple[int, int]: `(y, z)`（`z = lcm(m)`，`0 <= y < z`．解がなければ`(0, 0)`）
+
+    Note:
+        - `m`は互いに素でなくてよい
+        - 参考：https://github.com/atcoder/ac-library/blob/master/atcoder/math.hpp
+    """
+    assert len(r) == len(m)
+    r0, m0 = 0, 1
+    for r1, m1 in zip(r, m):
+        assert m1 >= 1
+        ri, mi = r1 % m1, m1
+        if m0 < mi:
+            r0, ri = ri, r0
+            m0, mi = mi, m0
+        if m0 % mi == 0:
+            if r0 % mi != ri:
+                return 0, 0
+            continue
+        g, im = inv_gcd(m0, mi)
+        u1 = mi // g
+        if (ri - r0) % g:
+            return 0, 0
+        x = (ri - r0) // g % u1 * im % u1
+        r0 += x * m0
+        m0 *= u1
+    return r0 % m0, m0
+
+
+def garner(r: list[int], m: list[int], mod: int) -> int:
+    """`x ≡ r[i] (mod m[i])`を満たす最小の`x >= 0`を`mod`で割った余り O(k^2 log max(m))
+
+    Args:
+        r (list[int]): 余り
+        m (list[int]): 法（どの2つも互いに素）
+        mod (int): 答えの法
+
+    Note:
+        - `x = t[0] + t[1] m[0] + t[2] m[0] m[1] + ...`（`0 <= t[i] < m[i]`）と表して`t`を順に求める
+        - `x`そのもの（`prod(m)`程度の大きさ）を経由しないので，`mod`での値だけが必要なときに使う
+    """
+    assert len(r) == len(m)
+    moduli = [*m, mod]
+    coeffs = [1] * len(moduli)
+    constants = [0] * len(moduli)
+    for i, (ri, mi) in enumerate(zip(r, m)):
+        t = (ri - constants[i]) * mod_inverse(coeffs[i], mi) % mi
+        for j in range(i + 1, len(moduli)):
+            constants[j] = (constants[j] + t * coeffs[j]) % moduli[j]
+            coeffs[j] = coeffs[j] * mi % moduli[j]
+    return constants[-1]
+
+
+def garner_many(r: np.ndarray, m: list[int], mod: int) -> np.ndarray:
+    """`garner`を配列でまとめて計算 O(k^2 N)
+
+    Args:
+        r (np.ndarray): 余り（shape = (k, N)，`r[i]`が法`m[i]`での余りの列）
+        m (list[int]): 法（どの2つも互いに素，`m[i] < 2^31`）
+        mod (int): 答えの法（`mod < 2^31`）
+
+    Returns:
+        np.ndarray: 長さ`N`の答え（int64）
+
+    Note:
+        - 係数`coeffs`はすべての列で共通なので，Pythonの整数で計算して逆元も1回ずつで済む
+    """
+    assert all(mi < 1 << 31 for mi in m)
+    assert mod < 1 << 31
+    r = np.asarray(r, dtype=np.int64)
+    assert r.ndim == 2  # noqa: PLR2004
+    assert len(r) == len(m)
+    moduli = [*m, mod]
+    coeffs = [1] * len(moduli)
+    constants = [np.zeros(r.shape[1], dtype=np.int64) for _ in moduli]
+    for i, mi in enumerate(m):
+        t = (r[i] - constants[i]) % mi * mod_inverse(coeffs[i], mi) % mi
+        for j in range(i + 1, len(moduli)):
+            constants[j] = (constants[j] + t * coeffs[j]) % moduli[j]
+            coeffs[j] = coeffs[j] * mi % moduli[j]
+    return constants[-1]
+
+
+def floor_sum(n: int, m: int, a: int, b: int) -> int:
+    """`sum((a * i + b) // m for i in range(n))` O(log m)
+
+    Note:
+        - `a`, `b`は負でもよい（`m >= 1`）：`//`, `%`は負の数でも切り捨て・非負の余りになるので，そのまま簡約できる
+        - 参考：https://github.com/atcoder/ac-library/blob/master/atcoder/math.hpp
+    """
+    assert n >= 0
+    assert m >= 1
+    res = 0
+    while True:
+        res += n * (n - 1) // 2 * (a // m) + n * (b // m)
+        a %= m
+        b %= m
+        y_max = a * n + b
+        if y_max < m:
+            return res
+        n, b = divmod(y_max, m)
+        m, a = a, m
+
+
+def floor_sum_many(n: np.ndarray, m: np.ndarray, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """`floor_sum`を配列でまとめて計算 O(N log max(m))
+
+    Note:
+        - `n, m <= 10^9`程度で，途中の値（`a * n + b`など）と答えがint64に収まること
+        - 各反復で`a < m`, `b < m`に簡約してから判定するので，終わった要素は以降の反復で値が変わらない
+    """
+    n, m, a, b = (np.array(x, dtype=np.int64) for x in np.broadcast_arrays(n, m, a, b))
+    assert np.all(n >= 0)
+    assert np.all(m >= 1)
+    res = np.zeros(n.shape, dtype=np.int64)
+    active = np.ones(res.shape, dtype=bool)
+    while True:
+        res += n * (n - 1) // 2 * (a // m) + n * (b // m)
+        a %= m
+        b %= m
+        y_max = a * n + b
+        active &= y_max >= m
+        if not active.any():
+            return res
+        n, b = np.where(active, y_max // m, n), np.where(active, y_max % m, b)
+        m, a = np.where(active, a, m), np.where(active, m, a)
+
+
+def primitive_root(p: int) -> int:
+    """素数`p`の最小の原始根 O(sqrt(p))
+
+    Note:
+        - `g^((p - 1) / q) != 1`が`p - 1`のすべての素因数`q`について成り立てば`g`は原始根
+    """
+    if p == 2:  # noqa: PLR2004
+        return 1
+    factors = list(prime_factorize(p - 1))
+    g = 2
+    while any(pow(g, (p - 1) // q, p) == 1 for q in factors):
+        g += 1
+    return g
+
+
+def discrete_log(x: int, y: int, m: int) -> int | None:
+    """`x^k ≡ y (mod m)`を満たす最小の`k >= 0`（なければ`None`） O(sqrt(m))
+
+    Note:
+        - Baby-step Giant-step（baby-stepの値はdictに入れる）
+        - `m`は素数でなくてよい：`gcd(x, m) > 1`の間は両辺を割って`x`と`m`が互いに素な場合に帰着する
+    """
+    assert m >= 1
+    x %= m
+    y %= m
+    k = 1 % m  # 帰着後の式`k x^t ≡ y`の係数
+    offset = 0
+    while (g := gcd(x, m)) > 1:
+        if y == k:
+            return offset
+        if y % g:
+            return None
+        y //= g
+        m //= g
+        k = k * (x // g) % m
+        offset += 1
+    if m == 1:
+        return offset
+    n = isqrt(m) + 1
+    # baby-step：y x^j -> j（同じ値なら大きいjを残すと，最初に見つかる解が最小になる）
+    table = {}
+    cur = y
+    for j in range(n + 1):
+        table[cur] = j
+        cur = cur * x % m
+    # giant-step：k x^(n i)
+    step = pow(x, n, m)
+    cur = k
+    for i in range(1, n + 1):
+        cur = cur * step % m
+        if cur in table:
+            return n * i - table[cur] + offset
+    return None
+
+
+if __name__ == "__main__":
+    """動作確認"""
+    # https://judge.yosupo.jp/problem/discrete_logarithm_mod
+    from atcoder.others.input import Reader, Writer
+
+    reader = Reader()
+    writer = Writer()
+    T = reader.int()
+    for _ in range(T):
+        res = discrete_log(*reader.ints(3))
+        writer.print(-1 if res is None else res)
@@ -0,0 +1,612 @@
+"""提出用の1ファイルへの展開（使っているクラス・関数とその依存だけを埋め込む）
+
+例::
+
+    python -m atcoder.others.bundler solution.py -o submit.py
+
+- 解答中の`from atcoder.xxx import Name`を，`Name`の定義と（推移的に）依存する定義・importに置き換える
+- 使われていない定義や`import numpy as np`などは含めないので，ジャッジ上での起動が速くなる
+- ライブラリ側の`if __name__ == "__main__":`ブロック，docstring，関数の型注釈は削除する
+- 異なるモジュールで同じ名前の定義（`T`など）がぶつかる場合は，`T_segment_tree`のように改名する
+  （キーワード引数での呼び出し`f(T=...)`は改名の対象外）
+- トップレベルの`if` / `try`（`if TYPE_CHECKING:`，バージョンによる分岐，`try: import ... except ...`など）は，
+  そのモジュールから何か1つでも埋め込むときは常に残す．それ以外の名前を定義しないトップレベルの文
+  （関数呼び出しなど）は埋め込まず，警告を出す
+"""
+import argparse
+import ast
+import importlib.util
+import os
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+PACKAGE = "atcoder"
+
+# 外部のimport（モジュール名, インポートする名前 (`import x`なら`None`), 束縛する名前）
+ExternalKey = tuple[str, str | None, str]
+# ライブラリ内の定義（モジュール名, 名前）
+SymbolKey = tuple[str, str]
+# 定義する名前によらず，モジュールを埋め込むときは常に残すトップレベルの文
+_KEPT_STATEMENTS = (ast.If, ast.Try)
+
+
+class BundleError(Exception):
+    """展開できないimportなど"""
+
+
+@dataclass
+class _Module:
+    """解析済みのライブラリのモジュール
+
+    Attributes:
+        name: モジュール名（`atcoder.xxx.yyy`）
+        nodes: トップレベルの定義（docstring・型注釈は削除済み）
+        defines: 名前 -> その名前を定義する`nodes`のindexのリスト
+        imports: 名前 -> ライブラリ内の別モジュールからimportした定義
+        externals: 名前 -> 外部からのimport
+        always: 常に残す文（トップレベルの`if` / `try`）の`nodes`でのindex
+    """
+    name: str
+    nodes: list[ast.stmt] = field(default_factory=list)
+    defines: dict[str, list[int]] = field(default_factory=dict)
+    imports: dict[str, SymbolKey] = field(default_factory=dict)
+    externals: dict[str, ExternalKey] = field(default_factory=dict)
+    always: list[int] = field(default_factory=list)
+
+
+def _is_main_block(node: ast.stmt) -> bool:
+    """`if __name__ == "__main__":`かどうか"""
+    return (isinstance(node, ast.If) and isinstance(node.test, ast.Compare)
+            and isinstance(node.test.left, ast.Name) and node.test.left.id == "__name__")
+
+
+def _is_docstring(node: ast.stmt) -> bool:
+    """文字列だけの式文（docstring）かどうか"""
+    return isinstance(node, ast.Expr) and isinstance(node.value, ast.Constant) and isinstance(node.value.value, str)
+
+
+def _resolve_module(module: str | None, level: int, current: str) -> str:
+    """相対importを絶対モジュール名にする"""
+    if level == 0:
+        assert module is not None
+        return module
+    base = current.split(".")[:-level]
+    return ".".join(base + ([module] if module else []))
+
+
+def _is_package_module(module: str) -> bool:
+    """ライブラリ内のモジュールかどうか"""
+    return module == PACKAGE or module.startswith(PACKAGE + ".")
+
+
+class _Stripper(ast.NodeTransformer):
+    """docstringと関数の型注釈を削除"""
+    def __init__(self, *, keep_docstrings: bool) -> None:
+        self._keep_docstrings = keep_docstrings
+        self._in_function = 0
+
+    def _strip_body(self, body: list[ast.stmt]) -> list[ast.stmt]:
+        if not self._keep_docstrings and body and _is_docstring(body[0]):
+            body = body[1:]
+        return body or [ast.Pass()]
+
+    def _visit_function(self, node: ast.FunctionDef | ast.AsyncFunctionDef) -> ast.AST:
+        node.returns = None
+        for arg in (*node.args.posonlyargs, *node.args.args, *node.args.kwonlyargs, node.args.vararg, node.args.kwarg):
+            if arg is not None:
+                arg.annotation = None
+        node.body = self._strip_body(node.body)
+        self._in_function += 1
+        self.generic_visit(node)
+        self._in_function -= 1
+        return node
+
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> ast.AST:
+        """関数"""
+        return self._visit_function(node)
+
+    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> ast.AST:
+        """async関数"""
+        return self._visit_function(node)
+
+    def visit_ClassDef(self, node: ast.ClassDef) -> ast.AST:
+        """クラス（クラス直下の型注釈は`NamedTuple`などで意味を持つので残す）"""
+        node.body = self._strip_body(node.body)
+        depth = self._in_function
+        self._in_function = 0
+        self.generic_visit(node)
+        self._in_function = depth
+        return node
+
+    def visit_AnnAssign(self, node: ast.AnnAssign) -> ast.AST | None:
+        """関数内の型注釈付き代入は普通の代入にする"""
+        if not self._in_function:
+            return node
+        if node.value is None:
+            return ast.Pass()
+        return ast.Assign(targets=[node.target], value=node.value, lineno=node.lineno)
+
+
+class _Renamer(ast.NodeTransformer):
+    """識別子をまとめて改名"""
+    def __init__(self, mapping: dict[str, str]) -> None:
+        self._mapping = mapping
+
+    def visit_Name(self, node: ast.Name) -> ast.AST:
+        """変数"""
+        node.id = self._mapping.get(node.id, node.id)
+        return node
+
+    def visit_arg(self, node: ast.arg) -> ast.AST:
+        """引数"""
+        node.arg = self._mapping.get(node.arg, node.arg)
+        self.generic_visit(node)
+        return node
+
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> ast.AST:
+        """関数"""
+        node.name = self._mapping.get(node.name, node.name)
+        self.generic_visit(node)
+        return node
+
+    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> ast.AST:
+        """async関数"""
+        node.name = self._mapping.get(node.name, node.name)
+        self.generic_visit(node)
+        return node
+
+    def visit_ClassDef(self, node: ast.ClassDef) -> ast.AST:
+        """クラス"""
+        node.name = self._mapping.get(node.name, node.name)
+        self.generic_visit(node)
+        return node
+
+    def visit_Global(self, node: ast.Global) -> ast.AST:
+        """global文"""
+        node.names = [self._mapping.get(n, n) for n in node.names]
+        return node
+
+    def visit_Nonlocal(self, node: ast.Nonlocal) -> ast.AST:
+        """nonlocal文"""
+        node.names = [self._mapping.get(n, n) for n in node.names]
+        return node
+
+    def visit_alias(self, node: ast.alias) -> ast.AST:
+        """import文で束縛する名前（`if` / `try`の中や関数内のimport）"""
+        bound = node.asname or node.name
+        if bound in self._mapping and (node.asname or "." not in node.name):
+            node.asname = self._mapping[bound]
+        return node
+
+
+def _child_statements(node: ast.If | ast.Try) -> list[ast.stmt]:
+    """`if` / `try`の各節の文"""
+    if isinstance(node, ast.If):
+        return [*node.body, *node.orelse]
+    return [*node.body, *(s for h in node.handlers for s in h.body), *node.orelse, *node.finalbody]
+
+
+def _defined_names(node: ast.stmt) -> list[str]:
+    """トップレベルの文が定義する名前（`if` / `try`はその中の文が定義する名前）"""
+    if isinstance(node, _KEPT_STATEMENTS):
+        return [n for child in _child_statements(node) for n in _defined_names(child)]
+    if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+        return [node.name]
+    if isinstance(node, (ast.Assign, ast.AnnAssign, ast.AugAssign)):
+        targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+        return [n.id for t in targets for n in ast.walk(t) if isinstance(n, ast.Name)]
+    if isinstance(node, (ast.Import, ast.ImportFrom)):
+        return [a.asname or a.name.split(".")[0] for a in node.names]
+    return []
+
+
+def _referenced_names(node: ast.AST) -> set[str]:
+    """文の中で参照される（可能性のある）名前"""
+    return {n.id for n in ast.walk(node) if isinstance(n, ast.Name)}
+
+
+class Bundler:
+    """解答スクリプトへのライブラリの埋め込み
+
+    Attributes:
+        _keep_docstrings: ライブラリのdocstringを残すかどうか
+        _modules: モジュール名 -> 解析済みのモジュール
+        _included: 埋め込む定義（モジュール名 -> `nodes`のindexの集合）
+        _deps: モジュール名 -> そのモジュールの定義が依存するモジュール名の集合
+        _stack: `require`で処理中のモジュール名
+        _externals: 埋め込む外部のimport（出現順）
+        warnings: 埋め込まなかったトップレベルの文などの警告
+    """
+    def __init__(self, *, keep_docstrings: bool = False) -> None:
+        """Init.
+
+        Args:
+            keep_docstrings (bool): ライブラリのdocstringを残すかどうか
+        """
+        self._keep_docstrings = keep_docstrings
+        self._modules: dict[str, _Module] = {}
+        self._included: dict[str, set[int]] = {}
+        self._deps: dict[str, set[str]] = {}
+        self._stack: list[str] = []
+        self._externals: dict[ExternalKey, None] = {}
+        self.warnings: list[str] = []
+
+    def _load(self, name: str) -> _Module:
+        """モジュールのソースを（実行せずに）読み込んで解析"""
+        if name in self._modules:
+            return self._modules[name]
+        spec = importlib.util.find_spec(name)
+        if spec is None or spec.origin is None:
+            msg = f"module not found: {name}"
+            raise BundleError(msg)
+        tree = ast.parse(Path(spec.origin).read_text(encoding="utf-8"))
+        tree = _Stripper(keep_docstrings=self._keep_docstrings).visit(tree)
+        module = _Module(name)
+        package = name if spec.submodule_search_locations else name.rpartition(".")[0]
+        for node in tree.body:
+            self._add_statement(module, node, package)
+        self._modules[name] = module
+        return module
+
+    def _add_statement(self, module: _Module, node: ast.stmt, package: str) -> None:
+        """トップレベルの文を`module`に登録"""
+        if _is_main_block(node) or _is_docstring(node):
+            return
+        if isinstance(node, ast.ImportFrom):
+            if node.module != "__future__":
+                self._add_import_from(module, node, package)
+            return
+        if isinstance(node, ast.Import):
+            self._add_import(module, node)
+            return
+        if isinstance(node, _KEPT_STATEMENTS):
+            self._check_nested_imports(module.name, node, package)
+            module.always.append(len(module.nodes))
+        elif not _defined_names(node):
+            first_line = ast.unparse(node).splitlines()[0]
+            self.warnings.append(f"{module.name}:{node.lineno}: top-level statement `{first_line}` is not bundled")
+            return
+        index = len(module.nodes)
+        module.nodes.append(node)
+        for n in _defined_names(node):
+            module.defines.setdefault(n, []).append(index)
+
+    @staticmethod
+    def _add_import_from(module: _Module, node: ast.ImportFrom, package: str) -> None:
+        """`from ... import ...`を登録"""
+        source = _resolve_module(node.module, node.level, package + ".__init__")
+        for alias in node.names:
+            local = alias.asname or alias.name
+            if _is_package_module(source):
+                module.imports[local] = (source, alias.name)
+            else:
+                module.externals[local] = (source, alias.name, local)
+
+    @staticmethod
+    def _add_import(module: _Module, node: ast.Import) -> None:
+        """`import ...`を登録"""
+        for alias in node.names:
+            if _is_package_module(alias.name):
+                msg = f"`import {alias.name}` in {module.name} is not supported; use `from ... import ...`"
+                raise BundleError(msg)
+            local = alias.asname or alias.name.split(".")[0]
+            module.externals[local] = (alias.name if alias.asname else local, None, local)
+
+    @staticmethod
+    def _check_nested_imports(name: str, node: ast.If | ast.Try, package: str) -> None:
+        """常に残す`if` / `try`の中にライブラリ内のimportがないことを確かめる（展開できないので）"""
+        for n in ast.walk(node):
+            if isinstance(n, ast.ImportFrom):
+                modules = [_resolve_module(n.module, n.level, package + ".__init__")]
+            elif isinstance(n, ast.Import):
+                modules = [a.name for a in n.names]
+            else:
+                continue
+            if any(_is_package_module(m) for m in modules):
+                msg = f"{name}:{n.lineno}: importing from {PACKAGE} inside a top-level if/try is not supported"
+                raise BundleError(msg)
+
+    def require(self, module_name: str, name: str) -> SymbolKey:
+        """`module_name`の`name`を埋め込む（依存も推移的に埋め込む）
+
+        Returns:
+            SymbolKey: `name`の実体がある（モジュール名, 名前）
+        """
+        if self._stack and self._stack[-1] != module_name:
+            self._deps.setdefault(self._stack[-1], set()).add(module_name)
+        self._stack.append(module_name)
+        try:
+            return self._require(module_name, name)
+        finally:
+            self._stack.pop()
+
+    def _require(self, module_name: str, name: str) -> SymbolKey:
+        """`require`の本体"""
+        module = self._load(module_name)
+        if name in module.imports:
+            return self.require(*module.imports[name])
+        if name in module.externals:
+            self._externals.setdefault(module.externals[name])
+            return module_name, name
+        if name not in module.defines:
+            # サブモジュールの`import`（`from atcoder.others import input`など）
+            if importlib.util.find_spec(f"{module_name}.{name}") is not None:
+                msg = f"importing the module {module_name}.{name} is not supported; import names from it"
+                raise BundleError(msg)
+            msg = f"cannot find {name} in {module_name}"
+            raise BundleError(msg)
+        if module_name not in self._included:
+            # 初めて埋め込むモジュールでは，トップレベルの`if` / `try`も残す
+            self._included[module_name] = set()
+            for index in module.always:
+                self._include(module, index)
+        for index in module.defines[name]:
+            self._include(module, index)
+        return module_name, name
+
+    def _include(self, module: _Module, index: int) -> None:
+        """`module.nodes[index]`とその依存を埋め込む"""
+        included = self._included[module.name]
+        if index in included:
+            return
+        included.add(index)
+        for ref in sorted(_referenced_names(module.nodes[index])):
+            if ref in module.defines or ref in module.imports or ref in module.externals:
+                self.require(module.name, ref)
+
+    def require_all(self, module_name: str) -> None:
+        """`from module_name import *`"""
+        module = self._load(module_name)
+        for name in [*module.defines, *module.imports, *module.externals]:
+            if not name.startswith("_"):
+                self.require(module_name, name)
+
+    def _module_order(self) -> list[str]:
+        """埋め込むモジュールの順序（依存されるものが先）"""
+        order: list[str] = []
+        visited: set[str] = set()
+
+        def dfs(name: str) -> None:
+            visited.add(name)
+            for dep in sorted(self._deps.get(name, ())):
+                if dep not in visited:
+                    dfs(dep)
+            if name in self._included:
+                order.append(name)
+
+        for name in self._included:
+            if name not in visited:
+                dfs(name)
+        return order
+
+    def render(self, reserved: set[str]) -> tuple[str, dict[SymbolKey, str]]:
+        """埋め込む部分のソースを作る
+
+        Args:
+            reserved (set[str]): 解答側で定義されている名前（ライブラリ側の定義はこれらと重ならないよう改名する）
+
+        Returns:
+            tuple[str, dict[SymbolKey, str]]: (ソース, (モジュール名, 名前) -> 埋め込み後の名前)
+        """
+        module_order = self._module_order()
+        final, external_names = self._assign_names(reserved, module_order)
+        lines = [_import_source(key, bound) for key, bound in external_names.items()]
+        for module_name in module_order:
+            module = self._modules[module_name]
+            mapping = self._renaming(module, final, external_names)
+            lines.append("")
+            lines.append(f"# {module_name}")
+            for index in sorted(self._included[module_name]):
+                node = module.nodes[index]
+                if mapping:
+                    node = _Renamer(mapping).visit(ast.parse(ast.unparse(node)).body[0])
+                lines.append(ast.unparse(node))
+        return "\n".join(lines) + "\n", final
+
+    def _assign_names(self, reserved: set[str],
+                      module_order: list[str]) -> tuple[dict[SymbolKey, str], dict[ExternalKey, str]]:
+        """外部のimportと埋め込む定義に，互いに（と`reserved`と）重ならない名前を割り当てる"""
+        used = set(reserved)
+
+        def assign(preferred: str, suffix: str) -> str:
+            candidate = preferred
+            k = 1
+            while candidate in used:
+                candidate = f"{preferred}_{suffix}" if k == 1 else f"{preferred}_{suffix}{k}"
+                k += 1
+            used.add(candidate)
+            return candidate
+
+        external_names = {key: assign(key[2], "ext") for key in self._externals}
+        final: dict[SymbolKey, str] = {}
+        for module_name in module_order:
+            module = self._modules[module_name]
+            suffix = module_name.rsplit(".", 1)[-1]
+            for index in sorted(self._included[module_name]):
+                for n in _defined_names(module.nodes[index]):
+                    if (module_name, n) not in final:
+                        final[module_name, n] = assign(n, suffix)
+        return final, external_names
+
+    def _renaming(self, module: _Module, final: dict[SymbolKey, str],
+                  external_names: dict[ExternalKey, str]) -> dict[str, str]:
+        """`module`の中の名前 -> 埋め込み後の名前（変わるものだけ）"""
+        mapping = {n: final[module.name, n] for n in module.defines if (module.name, n) in final}
+        for local, target in module.imports.items():
+            resolved = self._resolve(target)
+            if resolved in final:
+                mapping[local] = final[resolved]
+        for local, ext in module.externals.items():
+            if ext in external_names:
+                mapping[local] = external_names[ext]
+        return {k: v for k, v in mapping.items() if k != v}
+
+    def _resolve(self, key: SymbolKey) -> SymbolKey:
+        """importを辿って実体の（モジュール名, 名前）を返す"""
+        module = self._modules.get(key[0])
+        while module is not None and key[1] in module.imports:
+            key = module.imports[key[1]]
+            module = self._modules.get(key[0])
+        return key
+
+
+def _import_source(key: ExternalKey, bound: str) -> str:
+    """外部のimportを`bound`に束縛するimport文"""
+    source, name, _ = key
+    if name is None:
+        return f"import {source}" + ("" if source == bound else f" as {bound}")
+    return f"from {source} import {name}" + ("" if name == bound else f" as {bound}")
+
+
+@dataclass
+class BundleResult:
+    """展開結果
+
+    Attributes:
+        source: 展開後のソース
+        library_source: 埋め込んだライブラリ部分のソース
+        original_imports: 解答中のライブラリのimport文
+        warnings: 埋め込まなかったトップレベルの文などの警告
+    """
+    source: str
+    library_source: str
+    original_imports: list[str]
+    warnings: list[str] = field(default_factory=list)
+
+
+@dataclass
+class _SolutionImports:
+    """解答スクリプトのトップレベルのimport
+
+    Attributes:
+        requested: (モジュール名, 名前 (`*`なら`None`), 解答側で束縛する名前) のリスト
+        remove_lines: 展開後に削除する行番号（1-indexed）
+        future: `from __future__ import ...`の文
+        original_imports: ライブラリのimport文（元のソースのまま）
+    """
+    requested: list[tuple[str, str | None, str]] = field(default_factory=list)
+    remove_lines: set[int] = field(default_factory=set)
+    future: list[str] = field(default_factory=list)
+    original_imports: list[str] = field(default_factory=list)
+
+
+def _scan_imports(tree: ast.Module, src_lines: list[str]) -> _SolutionImports:
+    """解答スクリプトのライブラリのimportと`__future__`のimportを集める"""
+    res = _SolutionImports()
+    for node in tree.body:
+        lines = range(node.lineno, (node.end_lineno or node.lineno) + 1)
+        if isinstance(node, ast.ImportFrom) and node.module == "__future__":
+            res.future.append(ast.unparse(node))
+            res.remove_lines.update(lines)
+        elif isinstance(node, ast.ImportFrom) and node.level == 0 and _is_package_module(node.module or ""):
+            assert node.module is not None
+            module = node.module
+            res.requested.extend((module, None if a.name == "*" else a.name, a.asname or a.name) for a in node.names)
+            res.remove_lines.update(lines)
+            res.original_imports.append("\n".join(src_lines[node.lineno - 1: node.end_lineno]))
+        elif isinstance(node, ast.Import) and any(_is_package_module(a.name) for a in node.names):
+            msg = f"line {node.lineno}: `import atcoder...` is not supported; use `from atcoder... import Name`"
+            raise BundleError(msg)
+    return res
+
+
+def _reserved_names(tree: ast.Module) -> set[str]:
+    """解答側で定義されている名前（ライブラリのimportで束縛する名前を除く）"""
+    reserved: set[str] = set()
+    for node in tree.body:
+        if not (isinstance(node, ast.ImportFrom) and _is_package_module(node.module or "")):
+            reserved.update(_defined_names(node))
+    for n in ast.walk(tree):
+        if isinstance(n, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            reserved.add(n.name)
+        elif isinstance(n, ast.Name) and isinstance(n.ctx, ast.Store):
+            reserved.add(n.id)
+    return reserved
+
+
+def bundle(solution: str, *, keep_docstrings: bool = False) -> BundleResult:
+    """解答スクリプトのライブラリのimportを，必要な定義の埋め込みに置き換える
+
+    Args:
+        solution (str): 解答スクリプトのソース
+        keep_docstrings (bool): ライブラリのdocstringを残すかどうか
+
+    Returns:
+        BundleResult: 展開結果
+    """
+    tree = ast.parse(solution)
+    src_lines = solution.splitlines()
+    imports = _scan_imports(tree, src_lines)
+    bundler = Bundler(keep_docstrings=keep_docstrings)
+    aliases: list[tuple[SymbolKey, str]] = []
+    for module_name, name, bound in imports.requested:
+        if name is None:
+            bundler.require_all(module_name)
+        else:
+            aliases.append((bundler._resolve(bundler.require(module_name, name)), bound))  # noqa: SLF001
+    reserved = _reserved_names(tree) - {bound for _, bound in aliases}
+    library, final = bundler.render(reserved)
+
+    # 改名された，あるいは`as`で別名を付けたものは解答側の名前で参照できるようにする
+    # （`final`にないものは外部のimportを経由したもの）
+    alias_lines = [f"{bound} = {final[key]}" for key, bound in aliases if key in final and final[key] != bound]
+    if alias_lines:
+        library += "\n" + "\n".join(alias_lines) + "\n"
+
+    body = "\n".join(line for i, line in enumerate(src_lines, 1) if i not in imports.remove_lines)
+    header = "\n".join(imports.future) + "\n" if imports.future else ""
+    source = f"{header}# ---- bundled from {PACKAGE} ----\n{library}# ---- end of {PACKAGE} ----\n\n{body}\n"
+    return BundleResult(source, header + library, imports.original_imports, bundler.warnings)
+
+
+def estimate_startup(code: str, repeat: int = 5, env: dict[str, str] | None = None) -> float:
+    """`code`を新しいPythonプロセスで実行したときの，空のプロセスと比べた起動時間の増分（秒, `repeat`回の最小値）"""
+    def run(c: str) -> float:
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            subprocess.run([sys.executable, "-c", c], check=True, env=env,  # noqa: S603
+                           stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL)
+            best = min(best, time.perf_counter() - start)
+        return best
+    return max(0.0, run(code) - run("pass"))
+
+
+def main(argv: list[str] | None = None) -> int:
+    """エントリーポイント"""
+    parser = argparse.ArgumentParser(prog="python -m atcoder.others.bundler", description=__doc__.splitlines()[0])
+    parser.add_argument("solution", help="解答スクリプト")
+    parser.add_argument("-o", "--output", help="出力先 (省略時は標準出力)")
+    parser.add_argument("--keep-docstrings", action="store_true", help="ライブラリのdocstringを残す")
+    parser.add_argument("--no-timing", action="store_true", help="起動時間の見積もりをしない")
+    args = parser.parse_args(argv)
+
+    try:
+        result = bundle(Path(args.solution).read_text(encoding="utf-8"), keep_docstrings=args.keep_docstrings)
+    except BundleError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    for warning in result.warnings:
+        print(f"warning: {warning}", file=sys.stderr)
+    if args.output is None:
+        sys.stdout.write(result.source)
+    else:
+        Path(args.output).write_text(result.source, encoding="utf-8")
+
+    if not args.no_timing:
+        package_root = str(Path(__file__).resolve().parents[2])
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.pathsep.join(filter(None, [package_root, env.get("PYTHONPATH")]))
+        bundled = estimate_startup(result.library_source, env=env)
+        print(f"estimated startup of bundled library code: {bundled * 1000:.1f} ms", file=sys.stderr)
+        if result.original_imports:
+            original = estimate_startup("\n".join(result.original_imports), env=env)
+            print(f"estimated startup of original imports:     {original * 1000:.1f} ms", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,158 @@
+"""座標圧縮とオフラインクエリ用の並べ替え"""
+from bisect import bisect_left, bisect_right
+
+import numpy as np
+
+
+class Compressor:
+    """整数列の座標圧縮（複数の列をまとめて圧縮できる）
+
+    Attributes:
+        _values: 圧縮後の値 -> 元の値（昇順，重複なし）
+        _list: `_values`のリスト（1つずつ変換するときに使う）
+        _codes: 入力の列ごとの圧縮後の値
+
+    Note:
+        - 構築は`np.unique(..., return_inverse=True)`で O(n log n)，変換は`np.searchsorted`でまとめて O(k log n)
+        - 圧縮後の値は0-indexedで，元の値の大小関係を保つ
+        - 変換にdictを使わないので，クエリの値が構築に使った値に含まれなくてもよい
+    """
+    def __init__(self, *arrays: "list[int] | np.ndarray") -> None:
+        """Init. O(n log n)
+
+        Args:
+            *arrays (list[int] | np.ndarray): 圧縮する整数列（int64に収まること）
+        """
+        parts = [np.asarray(a, dtype=np.int64).reshape(-1) for a in arrays]
+        concat = np.concatenate(parts) if parts else np.zeros(0, dtype=np.int64)
+        values, inverse = np.unique(concat, return_inverse=True)
+        self._values: np.ndarray = values
+        self._list: list[int] = values.tolist()
+        sections = np.cumsum([len(p) for p in parts[:-1]], dtype=np.int64)
+        self._codes: list[np.ndarray] = np.split(inverse.reshape(-1).astype(np.int64), sections)
+
+    def __len__(self) -> int:
+        """値の種類数"""
+        return len(self._list)
+
+    def values(self) -> np.ndarray:
+        """圧縮後の値 -> 元の値（昇順）"""
+        return self._values
+
+    def codes(self) -> list[np.ndarray]:
+        """構築に使った各列を圧縮したもの（int64，入力と同じ順）"""
+        return self._codes
+
+    def compress(self, x: int) -> int:
+        """`x`の圧縮後の値（含まれなければ-1） O(log n)"""
+        i = bisect_left(self._list, x)
+        return i if i < len(self._list) and self._list[i] == x else -1
+
+    def compress_many(self, xs: "list[int] | np.ndarray") -> np.ndarray:
+        """各要素の圧縮後の値（含まれなければ-1） O(k log n)"""
+        xs = np.asarray(xs, dtype=np.int64)
+        i = np.searchsorted(self._values, xs)
+        found = i < len(self._values)
+        found[found] = self._values[i[found]] == xs[found]
+        return np.where(found, i, -1)
+
+    def lower_bound(self, x: int) -> int:
+        """`x`未満の値の種類数（= `x`以上の最小の値の圧縮後の値） O(log n)"""
+        return bisect_left(self._list, x)
+
+    def upper_bound(self, x: int) -> int:
+        """`x`以下の値の種類数（= `x`より大きい最小の値の圧縮後の値） O(log n)"""
+        return bisect_right(self._list, x)
+
+    def lower_bound_many(self, xs: "list[int] | np.ndarray") -> np.ndarray:
+        """各要素の`lower_bound` O(k log n)"""
+        return np.searchsorted(self._values, np.asarray(xs, dtype=np.int64), side="left")
+
+    def upper_bound_many(self, xs: "list[int] | np.ndarray") -> np.ndarray:
+        """各要素の`upper_bound` O(k log n)"""
+        return np.searchsorted(self._values, np.asarray(xs, dtype=np.int64), side="right")
+
+    def decompress(self, i: int) -> int:
+        """圧縮後の値`i`の元の値 O(1)"""
+        return self._list[i]
+
+    def decompress_many(self, indices: "list[int] | np.ndarray") -> np.ndarray:
+        """各要素の元の値 O(k)"""
+        return self._values[np.asarray(indices, dtype=np.int64)]
+
+
+def rank_with_index(a: "list[int] | np.ndarray", *, reverse_ties: bool = False) -> np.ndarray:
+    """`(a[i], i)`の組で座標圧縮した値（`0, ..., n - 1`の順列） O(n log n)
+
+    Args:
+        a (list[int] | np.ndarray): 整数列
+        reverse_ties (bool): 値が等しい要素を，位置の大きい順に並べるか
+
+    Returns:
+        np.ndarray: `i` -> `(a[i], i)`の順位（int64）
+
+    Note:
+        - 値が等しくても異なる値に圧縮されるので，Fenwick Treeで「自分より前（後）の要素」だけを数えたいときに使う
+        - 例えば`reverse_ties=True`で圧縮した値の狭義増加列は，元の列の狭義増加列に対応する
+    """
+    a = np.asarray(a, dtype=np.int64).reshape(-1)
+    n = len(a)
+    # 逆順の列の安定ソートは，値が等しい要素を位置の大きい順に並べる
+    order = n - 1 - np.argsort(a[::-1], kind="stable") if reverse_ties else np.argsort(a, kind="stable")
+    rank = np.empty(n, dtype=np.int64)
+    rank[order] = np.arange(n, dtype=np.int64)
+    return rank
+
+
+def event_order(*keys: "list[int] | np.ndarray") -> np.ndarray:
+    """イベントを`(keys[0][i], keys[1][i], ...)`の辞書順に並べたときの番号の列 O(n log n)
+
+    Args:
+        *keys (list[int] | np.ndarray): 同じ長さの整数列（先頭ほど優先）
+
+    Returns:
+        np.ndarray: 並べ替えた後の番号（すべてのキーが等しいイベントは番号の小さい順）
+
+    Note:
+        - `np.lexsort`は最後のキーを優先するので，逆順に渡す
+        - 例えば「座標 → 種類（追加を先・クエリを後など）」の順に並べたい走査で，タプルのリストを作らずに済む
+    """
+    assert keys
+    return np.lexsort([np.asarray(k).reshape(-1) for k in reversed(keys)])
+
+
+def group_starts(sorted_keys: "list[int] | np.ndarray") -> np.ndarray:
+    """ソート済みの列で，等しい値が続く区間の境界 O(n)
+
+    Returns:
+        np.ndarray: `starts`（`sorted_keys[starts[j]: starts[j + 1]]`が`j`番目の値の区間，長さは値の種類数 + 1）
+    """
+    k = np.asarray(sorted_keys).reshape(-1)
+    if len(k) == 0:
+        return np.zeros(1, dtype=np.int64)
+    inner = np.flatnonzero(k[1:] != k[:-1]) + 1
+    return np.concatenate(([0], inner, [len(k)])).astype(np.int64)
+
+
+if __name__ == "__main__":
+    """動作確認"""
+    # https://judge.yosupo.jp/problem/static_range_frequency
+    from atcoder.others.input import Reader, Writer
+
+    reader = Reader()
+    writer = Writer()
+    N, Q = reader.ints(2)
+    A = reader.int_array(N)
+    LRX = reader.matrix(Q, 3)
+    compressor = Compressor(A)
+    (code,) = compressor.codes()
+    # (値, 位置)の順に並べた位置の列
+    order = event_order(code, np.arange(N))
+    c = compressor.compress_many(LRX[:, 2])
+    found = c >= 0
+    c = np.where(found, c, 0)
+    # 値`c`の区間の中で，位置が`[l, r)`にある個数を二分探索
+    keys = code[order] * (N + 1) + order
+    base = c * (N + 1)
+    ans = np.searchsorted(keys, base + LRX[:, 1]) - np.searchsorted(keys, base + LRX[:, 0])
+    writer.lines(np.where(found, ans, 0).tolist())
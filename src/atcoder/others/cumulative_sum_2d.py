@@ -1,4 +1,7 @@
 """2次元累積和による部分和"""
+import numpy as np
+
+
 def compute_2d_cumulative_sum(matrix: list[list[int]]) -> list[list[int]]:
     """2次元累積和の作成
 
@@ -50,3 +53,287 @@ def get_submatrix_sum(cumulative_sum: list[list[int]], x1: int, y1: int, x2: int
             - cumulative_sum[x1 - 1][y2]
             - cumulative_sum[x2][y1 - 1]
             + cumulative_sum[x1 - 1][y1 - 1])
+
+
+def _check_mod(mod: int | None, shape: "tuple[int, ...]", *, exact: bool) -> None:
+    """int64で各軸の累積和 (mod mod) を取っても途中の値がオーバーフローしないことを確かめる"""
+    if mod is None or exact:
+        return
+    assert mod >= 1
+    assert mod * max(shape, default=1) < 1 << 63
+
+
+class PrefixSum2D:
+    """NumPyによる2次元累積和（左閉右開区間 `[x1, x2) × [y1, y2)` の和を O(1) で計算）
+
+    Attributes:
+        _mod: 法（`None`なら剰余を取らない）
+        _s: 0でパディングした累積和テーブル（shape = (H + 1, W + 1)）
+
+    Note:
+        - `exact=True` のときは `dtype=object`（Pythonのint）で計算するため，オーバーフローしない（その分遅い）
+        - `mod` を指定したときは，剰余を取った値（`mod`未満）について各軸の累積和を取り，そのたびに剰余を取る．
+          途中の値は`mod × 軸の長さ`未満なので，これが2^63未満であれば int64 でもオーバーフローしない
+          （`mod ≈ 10^9`なら軸の長さ 9 × 10^9 程度まで）
+    """
+    def __init__(self, matrix: "list[list[int]] | np.ndarray", *, mod: int | None = None, exact: bool = False) -> None:
+        """Init. O(HW)
+
+        Args:
+            matrix (list[list[int]] | np.ndarray): 2次元配列
+            mod (int | None): 法
+            exact (bool): Pythonのintで計算するかどうか
+        """
+        self._mod = mod
+        a = np.array(matrix, dtype=object if exact else np.int64, ndmin=2)
+        assert a.ndim == 2  # noqa: PLR2004
+        _check_mod(mod, a.shape, exact=exact)
+        if mod is not None:
+            a %= mod
+        h, w = a.shape
+        self._s = np.zeros((h + 1, w + 1), dtype=a.dtype)
+        a = a.cumsum(axis=0, dtype=a.dtype)
+        if mod is not None:
+            a %= mod
+        a = a.cumsum(axis=1, dtype=a.dtype)
+        if mod is not None:
+            a %= mod
+        self._s[1:, 1:] = a
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        """元の配列のshape"""
+        return (self._s.shape[0] - 1, self._s.shape[1] - 1)
+
+    def query(self, x1: int, y1: int, x2: int, y2: int) -> int:
+        """`sum(matrix[x1: x2, y1: y2])` O(1)"""
+        h, w = self.shape
+        assert 0 <= x1 <= x2 <= h
+        assert 0 <= y1 <= y2 <= w
+        s = self._s
+        res = int(s[x2, y2] - s[x1, y2] - s[x2, y1] + s[x1, y1])
+        return res if self._mod is None else res % self._mod
+
+    def query_many(self, x1: np.ndarray, y1: np.ndarray, x2: np.ndarray, y2: np.ndarray) -> np.ndarray:
+        """`query`を配列でまとめて計算 O(Q)
+
+        Args:
+            x1 (np.ndarray): 開始行の配列
+            y1 (np.ndarray): 開始列の配列
+            x2 (np.ndarray): 終了行の配列（含まない）
+            y2 (np.ndarray): 終了列の配列（含まない）
+
+        Returns:
+            np.ndarray: 各長方形の和
+        """
+        x1, y1, x2, y2 = (np.asarray(v) for v in (x1, y1, x2, y2))
+        h, w = self.shape
+        assert np.all((x1 >= 0) & (x1 <= x2) & (x2 <= h))
+        assert np.all((y1 >= 0) & (y1 <= y2) & (y2 <= w))
+        s = self._s
+        res = s[x2, y2] - s[x1, y2] - s[x2, y1] + s[x1, y1]
+        return res if self._mod is None else res % self._mod
+
+
+class PrefixSumND:
+    """NumPyによるN次元累積和（各軸について左閉右開区間の和を O(2^N) で計算）
+
+    Attributes:
+        _mod: 法（`None`なら剰余を取らない）
+        _s: 各軸の先頭を0でパディングした累積和テーブル
+
+    Note:
+        - `mod`を指定したときの int64 でのオーバーフローの条件は`PrefixSum2D`と同じ（`mod × 軸の長さ < 2^63`）
+    """
+    def __init__(self, array: np.ndarray, *, mod: int | None = None, exact: bool = False) -> None:
+        """Init. O(N × 要素数)
+
+        Args:
+            array (np.ndarray): N次元配列
+            mod (int | None): 法
+            exact (bool): Pythonのintで計算するかどうか
+        """
+        self._mod = mod
+        a = np.array(array, dtype=object if exact else np.int64)
+        _check_mod(mod, a.shape, exact=exact)
+        if mod is not None:
+            a %= mod
+        for axis in range(a.ndim):
+            a = a.cumsum(axis=axis, dtype=a.dtype)
+            if mod is not None:
+                a %= mod
+        self._s = np.zeros(tuple(d + 1 for d in a.shape), dtype=a.dtype)
+        self._s[(slice(1, None),) * a.ndim] = a
+
+    def query(self, lows: "tuple[int, ...]", highs: "tuple[int, ...]") -> int:
+        """`sum(array[lows[0]: highs[0], lows[1]: highs[1], ...])` O(2^N)"""
+        ndim = self._s.ndim
+        assert len(lows) == len(highs) == ndim
+        assert all(0 <= lo <= hi <= n - 1 for lo, hi, n in zip(lows, highs, self._s.shape))
+        res = 0
+        for mask in range(1 << ndim):
+            index = tuple(lows[d] if mask >> d & 1 else highs[d] for d in range(ndim))
+            if mask.bit_count() & 1:
+                res -= int(self._s[index])
+            else:
+                res += int(self._s[index])
+        return res if self._mod is None else res % self._mod
+
+    def query_many(self, lows: np.ndarray, highs: np.ndarray) -> np.ndarray:
+        """`query`を配列でまとめて計算 O(2^N Q)
+
+        Args:
+            lows (np.ndarray): shape = (Q, N) の各軸の開始位置
+            highs (np.ndarray): shape = (Q, N) の各軸の終了位置（含まない）
+
+        Returns:
+            np.ndarray: 各直方体の和
+        """
+        lows = np.asarray(lows)
+        highs = np.asarray(highs)
+        ndim = self._s.ndim
+        assert np.all((lows >= 0) & (lows <= highs) & (highs <= np.array(self._s.shape) - 1))
+        res = np.zeros(len(lows), dtype=self._s.dtype)
+        for mask in range(1 << ndim):
+            index = tuple(lows[:, d] if mask >> d & 1 else highs[:, d] for d in range(ndim))
+            if mask.bit_count() & 1:
+                res -= self._s[index]
+            else:
+                res += self._s[index]
+            if self._mod is not None:
+                res %= self._mod
+        return res
+
+
+class Imos2D:
+    """2次元いもす法（長方形への一様加算をまとめて行い，最後に一度だけ累積和を取る）
+
+    Attributes:
+        _mod: 法（`None`なら剰余を取らない）
+        _diff: 差分配列（shape = (H + 1, W + 1)）
+    """
+    def __init__(self, height: int, width: int, *, mod: int | None = None, exact: bool = False) -> None:
+        """Init.
+
+        Args:
+            height (int): 行数
+            width (int): 列数
+            mod (int | None): 法
+            exact (bool): Pythonのintで計算するかどうか
+        """
+        self._mod = mod
+        self._diff = np.zeros((height + 1, width + 1), dtype=object if exact else np.int64)
+
+    def add(self, x1: int, y1: int, x2: int, y2: int, value: int) -> None:
+        """`matrix[x1: x2, y1: y2]`に`value`を加算 O(1)"""
+        h, w = self._diff.shape
+        assert 0 <= x1 <= x2 < h
+        assert 0 <= y1 <= y2 < w
+        if self._mod is not None:
+            value %= self._mod
+        d = self._diff
+        d[x1, y1] += value
+        d[x1, y2] -= value
+        d[x2, y1] -= value
+        d[x2, y2] += value
+
+    def add_many(self, x1: np.ndarray, y1: np.ndarray, x2: np.ndarray, y2: np.ndarray, values: np.ndarray) -> None:
+        """`add`を配列でまとめて行う O(Q)"""
+        x1, y1, x2, y2 = (np.asarray(v) for v in (x1, y1, x2, y2))
+        d = self._diff
+        h, w = d.shape
+        assert np.all((x1 >= 0) & (x1 <= x2) & (x2 < h))
+        assert np.all((y1 >= 0) & (y1 <= y2) & (y2 < w))
+        values = np.asarray(values, dtype=d.dtype)
+        if self._mod is not None:
+            values %= self._mod
+        np.add.at(d, (x1, y1), values)
+        np.add.at(d, (x1, y2), -values)
+        np.add.at(d, (x2, y1), -values)
+        np.add.at(d, (x2, y2), values)
+        if self._mod is not None:
+            d %= self._mod
+
+    def build(self) -> np.ndarray:
+        """加算後の配列（shape = (H, W)）を返す O(HW)"""
+        a = self._diff[:-1, :-1]
+        _check_mod(self._mod, a.shape, exact=a.dtype == object)
+        if self._mod is not None:
+            a = a % self._mod
+        for axis in range(2):
+            a = a.cumsum(axis=axis, dtype=a.dtype)
+            if self._mod is not None:
+                a %= self._mod
+        return a
+
+
+class ImosND:
+    """N次元いもす法（直方体への一様加算をまとめて行い，最後に一度だけ累積和を取る）
+
+    Attributes:
+        _mod: 法（`None`なら剰余を取らない）
+        _diff: 差分配列（各軸の長さ + 1）
+    """
+    def __init__(self, shape: "tuple[int, ...]", *, mod: int | None = None, exact: bool = False) -> None:
+        """Init.
+
+        Args:
+            shape (tuple[int, ...]): 配列のshape
+            mod (int | None): 法
+            exact (bool): Pythonのintで計算するかどうか
+        """
+        self._mod = mod
+        self._diff = np.zeros(tuple(d + 1 for d in shape), dtype=object if exact else np.int64)
+
+    def add(self, lows: "tuple[int, ...]", highs: "tuple[int, ...]", value: int) -> None:
+        """`array[lows[0]: highs[0], lows[1]: highs[1], ...]`に`value`を加算 O(2^N)"""
+        assert all(0 <= lo <= hi < n for lo, hi, n in zip(lows, highs, self._diff.shape))
+        if self._mod is not None:
+            value %= self._mod
+        ndim = self._diff.ndim
+        for mask in range(1 << ndim):
+            index = tuple(highs[d] if mask >> d & 1 else lows[d] for d in range(ndim))
+            self._diff[index] += -value if mask.bit_count() & 1 else value
+
+    def add_many(self, lows: np.ndarray, highs: np.ndarray, values: np.ndarray) -> None:
+        """`add`を配列でまとめて行う（`lows`, `highs`は shape = (Q, N)） O(2^N Q)"""
+        lows = np.asarray(lows)
+        highs = np.asarray(highs)
+        d = self._diff
+        assert np.all((lows >= 0) & (lows <= highs) & (highs < np.array(d.shape)))
+        values = np.asarray(values, dtype=d.dtype)
+        if self._mod is not None:
+            values %= self._mod
+        ndim = d.ndim
+        for mask in range(1 << ndim):
+            index = tuple(highs[:, k] if mask >> k & 1 else lows[:, k] for k in range(ndim))
+            np.add.at(d, index, -values if mask.bit_count() & 1 else values)
+        if self._mod is not None:
+            d %= self._mod
+
+    def build(self) -> np.ndarray:
+        """加算後の配列を返す O(N × 要素数)"""
+        a = self._diff[(slice(None, -1),) * self._diff.ndim]
+        _check_mod(self._mod, a.shape, exact=a.dtype == object)
+        if self._mod is not None:
+            a = a % self._mod
+        for axis in range(a.ndim):
+            a = a.cumsum(axis=axis, dtype=a.dtype)
+            if self._mod is not None:
+                a %= self._mod
+        return a
+
+
+if __name__ == "__main__":
+    """動作確認"""
+    from atcoder.others.input import Reader, Writer
+
+    # 長方形領域の和
+    reader = Reader()
+    writer = Writer()
+    H, W = reader.ints(2)
+    ps = PrefixSum2D(reader.matrix(H, W))
+    Q = reader.int()
+    queries = reader.matrix(Q, 4)
+    # 入力は1-indexedの閉区間 (x1, y1, x2, y2)
+    writer.lines(ps.query_many(queries[:, 0] - 1, queries[:, 1] - 1, queries[:, 2], queries[:, 3]).tolist())
@@ -1,4 +1,150 @@
 """入力高速化"""
+import atexit
+import builtins
 import sys
+from typing import IO, TYPE_CHECKING, Any, Iterable
+
+if TYPE_CHECKING:
+    import numpy as np
 
 input = sys.stdin.readline  # noqa: A001
+
+
+class Reader:
+    """標準入力を一度に読み込み，トークン単位で返す高速な入力
+
+    Attributes:
+        _stream: 入力元（`None`なら`sys.stdin.buffer`）
+        _tokens: 空白区切りのトークンのリスト（最初の読み込み時に作成）
+        _pos: 次に読むトークンの位置
+
+    Note:
+        - 入力全体を`read().split()`するので，`input()`と混ぜて使うことはできない
+        - `int_array`や`matrix`はトークンのスライスをまとめて`np.array`に変換するので，
+          10^6個の整数でも`int()`を10^6回呼ばずに済む
+        - NumPyはそれらを呼んだときに初めてimportする（起動時間の短縮）
+    """
+    def __init__(self, stream: IO[bytes] | None = None) -> None:
+        """Init.（この時点では読み込まない）
+
+        Args:
+            stream (IO[bytes] | None): 入力元（`None`なら`sys.stdin.buffer`）
+        """
+        self._stream = stream
+        self._tokens: list[bytes] | None = None
+        self._pos = 0
+
+    def _take(self, n: builtins.int) -> list[bytes]:
+        """次の`n`個のトークン"""
+        if self._tokens is None:
+            stream = sys.stdin.buffer if self._stream is None else self._stream
+            self._tokens = stream.read().split()
+        pos = self._pos
+        self._pos += n
+        if self._pos > len(self._tokens):
+            raise EOFError
+        return self._tokens[pos: self._pos]
+
+    def token(self) -> bytes:
+        """次のトークン"""
+        return self._take(1)[0]
+
+    def int(self) -> builtins.int:
+        """次の整数"""
+        return builtins.int(self._take(1)[0])
+
+    def ints(self, n: builtins.int) -> list[builtins.int]:
+        """次の`n`個の整数のリスト"""
+        return list(map(builtins.int, self._take(n)))
+
+    def int_array(self, n: builtins.int) -> "np.ndarray":
+        """次の`n`個の整数のNumPy配列（int64）"""
+        import numpy as np  # noqa: PLC0415  # 起動時間の短縮のため，使うときに初めてimportする
+        return np.array(self._take(n), dtype=np.int64)
+
+    def matrix(self, h: builtins.int, w: builtins.int) -> "np.ndarray":
+        """次の`h` × `w`個の整数のNumPy配列（int64, shape = (h, w)）"""
+        import numpy as np  # noqa: PLC0415
+        return np.array(self._take(h * w), dtype=np.int64).reshape(h, w)
+
+    def float(self) -> builtins.float:
+        """次の実数"""
+        return builtins.float(self._take(1)[0])
+
+    def str(self) -> builtins.str:
+        """次の文字列"""
+        return self._take(1)[0].decode()
+
+    def strs(self, n: builtins.int) -> list[builtins.str]:
+        """次の`n`個の文字列のリスト"""
+        return [t.decode() for t in self._take(n)]
+
+    def grid(self, h: builtins.int) -> list[builtins.str]:
+        """`h`行の文字列のグリッド（各行は空白を含まないこと）"""
+        return self.strs(h)
+
+    def grid_array(self, h: builtins.int) -> "np.ndarray":
+        """`h`行の文字列のグリッドを文字コードのNumPy配列（uint8, shape = (h, w)）として返す"""
+        import numpy as np  # noqa: PLC0415
+        rows = self._take(h)
+        return np.frombuffer(b"".join(rows), dtype=np.uint8).reshape(h, -1)
+
+
+class Writer:
+    """出力をバッファに溜め，終了時に一度だけ書き出す高速な出力
+
+    Attributes:
+        _stream: 出力先（`None`なら`sys.stdout`）
+        _buffer: 出力する文字列のリスト
+
+    Note:
+        - 生成時に`atexit`へ`flush`を登録する
+    """
+    def __init__(self, stream: IO[str] | None = None) -> None:
+        """Init.
+
+        Args:
+            stream (IO[str] | None): 出力先（`None`なら`sys.stdout`）
+        """
+        self._stream = stream
+        self._buffer: list[str] = []
+        atexit.register(self.flush)
+
+    def print(self, *args: Any, sep: str = " ", end: str = "\n") -> None:
+        """`print`と同様に出力をバッファに追加"""
+        self._buffer.append(sep.join(map(str, args)) + end)
+
+    def lines(self, values: Iterable[Any]) -> None:
+        """`values`の各要素を1行ずつ出力"""
+        self._buffer.append("".join(f"{v}\n" for v in values))
+
+    def array(self, values: "np.ndarray | Iterable[Any]", sep: str = " ") -> None:
+        """配列を`sep`区切りで1行に出力（2次元のNumPy配列なら1行ずつ出力）"""
+        # NumPyがimportされていなければ`values`はNumPy配列ではない（ここでimportすると起動が遅くなる）
+        numpy = sys.modules.get("numpy")
+        if numpy is not None and isinstance(values, numpy.ndarray):
+            if values.ndim == 2:  # noqa: PLR2004
+                self.lines(" ".join(map(str, row)) for row in values.tolist())
+                return
+            values = values.tolist()
+        self._buffer.append(sep.join(map(str, values)) + "\n")
+
+    def flush(self) -> None:
+        """バッファの内容を書き出す"""
+        if not self._buffer:
+            return
+        stream = sys.stdout if self._stream is None else self._stream
+        stream.write("".join(self._buffer))
+        stream.flush()
+        self._buffer.clear()
+
+
+if __name__ == "__main__":
+    """動作確認"""
+    # https://atcoder.jp/contests/practice/tasks/practice_1
+    reader = Reader()
+    writer = Writer()
+    a = reader.int()
+    b, c = reader.ints(2)
+    s = reader.str()
+    writer.print(a + b + c, s)
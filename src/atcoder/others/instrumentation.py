@@ -0,0 +1,316 @@
+"""データ構造の内部イベントの計測（遅い提出の原因調査用）
+
+計測用のサブクラスに差し替える方式なので，計測しないときは元のクラスのままでオーバーヘッドはない．
+
+例::
+
+    from atcoder.datastructure.sorted_multiset import SortedMultiset
+    from atcoder.others.instrumentation import maybe_instrument
+
+    SortedMultiset = maybe_instrument(SortedMultiset)  # 環境変数`ATCODER_INSTRUMENT=1`のときだけ計測版になる
+"""
+import atexit
+import os
+import sys
+import weakref
+from collections import Counter
+from itertools import count
+from typing import Any, Callable, ClassVar, TypeVar
+
+from atcoder.datastructure.segment_tree import SegmentTree
+from atcoder.datastructure.sorted_multiset import SortedMultiset
+from atcoder.datastructure.sorted_set import SortedSet
+from atcoder.datastructure.unionfind import UnionFind
+
+ENV_VAR = "ATCODER_INSTRUMENT"
+
+C = TypeVar("C", bound=type)
+
+
+class Instrumented:
+    """計測用サブクラスの共通部分
+
+    Attributes:
+        instances: 生成順の番号 -> 計測用インスタンス（`report_all`用，弱参照なので生存期間は延ばさない）
+        counters: イベント名 -> 回数（`max_`で始まるものは最大値）
+    """
+    instances: ClassVar["weakref.WeakValueDictionary[int, Instrumented]"] = weakref.WeakValueDictionary()
+    _ids: ClassVar[count] = count()
+    counters: Counter[str]
+
+    def _init_counters(self) -> None:
+        """カウンタを初期化し，インスタンスを登録"""
+        self.counters = Counter()
+        Instrumented.instances[next(Instrumented._ids)] = self
+
+    def _record_max(self, key: str, value: int) -> None:
+        """`counters[key]`を`value`との最大値で更新"""
+        self.counters[key] = max(self.counters[key], value)
+
+    def report(self) -> str:
+        """計測結果の文字列"""
+        body = ", ".join(f"{k}={v}" for k, v in sorted(self.counters.items()))
+        return f"{type(self).__name__}(id={id(self):#x}): {body}"
+
+
+class _InstrumentedSortedMixin(Instrumented):
+    """`SortedMultiset` / `SortedSet`共通の計測
+
+    - `position_calls`, `bucket_scans`: `_position`の呼び出し回数と，走査したバケット数の合計
+    - `max_bucket_scan`: 1回の`_position`で走査したバケット数の最大値
+    - `bucket_splits`: `add`で大きくなりすぎたバケットを2つに分割した回数
+    - `empty_bucket_deletions`: `_pop`で空になったバケットを削除した回数
+    - `max_buckets`: バケット数の最大値
+
+    元のクラスはバケットの併合や全体の再構築を行わない（小さいバケットは空になるまで残る）ので，
+    バケットの個数の変化はこの2つだけで説明できる．
+    """
+    array: list[list[Any]]
+
+    def _position(self, x: Any) -> tuple[list[Any], int, int]:
+        """`_position`（走査したバケット数を記録）"""
+        res = super()._position(x)  # type: ignore[misc]
+        self.counters["position_calls"] += 1
+        self.counters["bucket_scans"] += res[1] + 1
+        self._record_max("max_bucket_scan", res[1] + 1)
+        return res
+
+    def add(self, x: Any) -> Any:
+        """`add`（バケットの分割を記録）"""
+        num_bucket = len(self.array)
+        res = super().add(x)  # type: ignore[misc]
+        if len(self.array) > num_bucket:
+            if num_bucket:
+                self.counters["bucket_splits"] += 1
+            self._record_max("max_buckets", len(self.array))
+        return res
+
+    def _pop(self, a: list[Any], b: int, i: int) -> Any:
+        """`_pop`（空になったバケットの削除を記録）"""
+        num_bucket = len(self.array)
+        res = super()._pop(a, b, i)  # type: ignore[misc]
+        if len(self.array) < num_bucket:
+            self.counters["empty_bucket_deletions"] += 1
+        return res
+
+
+class InstrumentedSortedMultiset(_InstrumentedSortedMixin, SortedMultiset):
+    """計測用`SortedMultiset`"""
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Init."""
+        self._init_counters()
+        super().__init__(*args, **kwargs)
+        self._record_max("max_buckets", len(self.array))
+
+
+class InstrumentedSortedSet(_InstrumentedSortedMixin, SortedSet):
+    """計測用`SortedSet`"""
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Init."""
+        self._init_counters()
+        super().__init__(*args, **kwargs)
+        self._record_max("max_buckets", len(self.array))
+
+
+class InstrumentedSegmentTree(Instrumented, SegmentTree):
+    """計測用`SegmentTree`
+
+    - `func`: 演算（モノイドの積）の評価回数の合計
+    - `max_right_calls`, `max_right_func`, `max_right_predicate`: `max_right`の呼び出し回数と，
+      その中での演算・条件式の評価回数
+    - `min_left_calls`, `min_left_func`, `min_left_predicate`: `min_left`について同様
+    """
+    def __init__(self, array: list[Any], func: Callable[[Any, Any], Any], unit: Any) -> None:
+        """Init."""
+        self._init_counters()
+        counters = self.counters
+
+        def counted_func(a: Any, b: Any) -> Any:
+            counters["func"] += 1
+            return func(a, b)
+        super().__init__(array, counted_func, unit)
+
+    def _search(self, name: str, search: Callable[[int, Callable[[Any], bool]], int], index: int,
+                is_satisfied: Callable[[Any], bool]) -> int:
+        """`max_right` / `min_left`の呼び出しを計測"""
+        counters = self.counters
+
+        def counted_predicate(x: Any) -> bool:
+            counters[f"{name}_predicate"] += 1
+            return is_satisfied(x)
+        before = counters["func"]
+        res = search(index, counted_predicate)
+        counters[f"{name}_calls"] += 1
+        counters[f"{name}_func"] += counters["func"] - before
+        return res
+
+    def max_right(self, left: int, is_satisfied: Callable[[Any], bool]) -> int:
+        """`SegmentTree.max_right`"""
+        return self._search("max_right", super().max_right, left, is_satisfied)
+
+    def min_left(self, right: int, is_satisfied: Callable[[Any], bool]) -> int:
+        """`SegmentTree.min_left`"""
+        return self._search("min_left", super().min_left, right, is_satisfied)
+
+
+class InstrumentedUnionFind(Instrumented, UnionFind):
+    """計測用`UnionFind`
+
+    - `find_root_calls`, `find_root_path`: `find_root`の呼び出し回数と，根までの経路長（= 経路圧縮した辺数）の合計
+    - `max_find_root_path`: 経路長の最大値
+    """
+    def __init__(self, n: int) -> None:
+        """Init."""
+        self._init_counters()
+        super().__init__(n)
+
+    def find_root(self, x: int) -> int:
+        """`UnionFind.find_root`と同じ結果（経路圧縮も同じ）を非再帰で計算し，経路長を記録"""
+        parents = self._parents
+        root = x
+        path = 0
+        while parents[root] >= 0:
+            root = parents[root]
+            path += 1
+        while parents[x] >= 0 and parents[x] != root:
+            parents[x], x = root, parents[x]
+        self.counters["find_root_calls"] += 1
+        self.counters["find_root_path"] += path
+        self._record_max("max_find_root_path", path)
+        return root
+
+
+def _csr(N: int, edges: list[tuple[int, int]]) -> tuple[list[int], list[int]]:
+    """隣接リストをCSR形式`(start, elist)`で作る（`v`の行き先は`elist[start[v]: start[v + 1]]`）"""
+    start = [0] * (N + 1)
+    for a, _ in edges:
+        start[a + 1] += 1
+    for i in range(N):
+        start[i + 1] += start[i]
+    counter = start[:]
+    elist = [0] * len(edges)
+    for a, b in edges:
+        elist[counter[a]] = b
+        counter[a] += 1
+    return start, elist
+
+
+def _pop_component(v: int, visited: list[int], order: list[int], ids: list[int], group: int) -> None:
+    """`visited`の末尾から`v`までを成分`group`として取り出す（取り出した頂点の`order`は`len(order)`で上書き）"""
+    while True:
+        u = visited.pop()
+        order[u] = len(order)
+        ids[u] = group
+        if u == v:
+            return
+
+
+def instrumented_scc(N: int, edges: list[tuple[int, int]]) -> tuple[list[list[int]], Counter[str]]:
+    """計測用`scc`
+
+    Returns:
+        tuple[list[list[int]], Counter[str]]: (`scc`の結果, 計測結果)
+
+    Note:
+        - `scc`のDFSは関数内で閉じていて差し替えられないので，同じアルゴリズムを計測付きで書き直している
+        - `dfs_roots`: DFSの開始頂点の数
+        - `stack_pushes`: DFSのスタックへのpush回数
+        - `max_stack_depth`: DFSのスタックの長さの最大値
+    """
+    counters: Counter[str] = Counter()
+    start, elist = _csr(N, edges)
+    visited: list[int] = []
+    low = [0] * (N + 1)  # `low[-1]`はDFSの根の親（`bef = -1`）用のダミー
+    order = [-1] * N
+    ids = [0] * N
+    num_visited = num_groups = 0
+    for root in range(N):
+        if order[root] != -1:
+            continue
+        counters["dfs_roots"] += 1
+        stack = [(root, -1, 0), (root, -1, 1)]
+        while stack:
+            counters["max_stack_depth"] = max(counters["max_stack_depth"], len(stack))
+            v, bef, t = stack.pop()
+            if t:
+                if order[v] != -1:
+                    low[bef] = min(low[bef], order[v])
+                    continue
+                low[v] = order[v] = num_visited
+                num_visited += 1
+                visited.append(v)
+                for to in elist[start[v]: start[v + 1]]:
+                    if order[to] == -1:
+                        stack += ((to, v, 0), (to, v, 1))
+                        counters["stack_pushes"] += 2
+                    else:
+                        low[v] = min(low[v], order[to])
+                continue
+            if low[v] == order[v]:
+                _pop_component(v, visited, order, ids, num_groups)
+                num_groups += 1
+            low[bef] = min(low[bef], low[v])
+    groups: list[list[int]] = [[] for _ in range(num_groups)]
+    for v in range(N):
+        groups[num_groups - 1 - ids[v]].append(v)
+    return groups, counters
+
+
+INSTRUMENTED: dict[type, type] = {
+    SortedMultiset: InstrumentedSortedMultiset,
+    SortedSet: InstrumentedSortedSet,
+    SegmentTree: InstrumentedSegmentTree,
+    UnionFind: InstrumentedUnionFind,
+}
+
+
+def is_enabled() -> bool:
+    """環境変数`ATCODER_INSTRUMENT`が設定されているか（"", "0"以外）"""
+    return os.environ.get(ENV_VAR, "0") not in ("", "0")
+
+
+def report_all(file: Any = None) -> None:
+    """これまでに生成した計測用インスタンスのうち，まだ生きているものの結果を生成順に出力（既定は標準エラー出力）"""
+    for instance in list(Instrumented.instances.values()):
+        print(instance.report(), file=sys.stderr if file is None else file)
+
+
+_report_registered = False
+
+
+def maybe_instrument(cls: C) -> C:
+    """環境変数`ATCODER_INSTRUMENT`が設定されていれば計測用サブクラスを，そうでなければ`cls`をそのまま返す
+
+    計測用サブクラスを返したときは，終了時に`report_all`を実行する．
+    """
+    global _report_registered  # noqa: PLW0603
+    if not is_enabled():
+        return cls
+    if not _report_registered:
+        atexit.register(report_all)
+        _report_registered = True
+    return INSTRUMENTED[cls]  # type: ignore[return-value]
+
+
+if __name__ == "__main__":
+    """動作確認"""
+    import random
+
+    rng = random.Random(0)  # noqa: S311
+    ms = InstrumentedSortedMultiset()
+    for _ in range(10**4):
+        ms.add(rng.randrange(10**9))
+    for _ in range(5000):
+        ms.discard(ms[rng.randrange(len(ms))])
+
+    seg = InstrumentedSegmentTree([rng.randrange(100) for _ in range(1000)], max, -1)
+    for _ in range(100):
+        seg.max_right(rng.randrange(1000), lambda x: x < 90)  # noqa: PLR2004
+
+    uf = InstrumentedUnionFind(10**4)
+    for _ in range(10**4):
+        uf.union(rng.randrange(10**4), rng.randrange(10**4))
+
+    scc_groups, scc_counters = instrumented_scc(10**4, [(i, i + 1) for i in range(10**4 - 1)])
+    report_all(sys.stdout)
+    print("scc:", len(scc_groups), dict(scc_counters))
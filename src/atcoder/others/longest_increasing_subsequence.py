@@ -1,41 +1,175 @@
 """最長増加部分列"""
-from bisect import bisect_left
+from bisect import bisect_left, bisect_right
+from typing import Callable, Generic, Iterable, TypeVar
 
+from atcoder.datastructure.sorted_multiset import Comparable
 
-def lis(li: list) -> list[int]:
-    """最長部分増加列（`bisect_left`を`bisect_right`に変えれば、最長部分広義増加列となる）O(n log n)
+T = TypeVar("T", bound=Comparable)
+
+
+class LISStream(Generic[T]):
+    """要素を1つずつ追加しながら最長増加部分列を管理する
+
+    Attributes:
+        _strict: 狭義単調増加かどうか（`False`なら広義単調増加）
+        _key: 比較に用いるキー関数
+        _values: 追加された要素
+        _tails: `_tails[k]`は長さ`k + 1`の増加部分列の末尾のキーの最小値
+        _tails_index: `_tails[k]`を与える要素のindex
+        _prev: 各要素を末尾とする増加部分列における直前の要素のindex（なければ-1）
+
+    Note:
+        - `_tails`は必要な分だけ伸ばす
+        - 追加 O(log n)，現在のLIS長 O(1)
+    """
+    def __init__(self, *, strict: bool = True, key: Callable[[T], Comparable] | None = None) -> None:
+        """Init.
+
+        Args:
+            strict (bool): 狭義単調増加かどうか（`False`なら広義単調増加）
+            key (Callable[[T], Comparable] | None): 比較に用いるキー関数
+        """
+        self._strict = strict
+        self._key = key
+        self._values: list[T] = []
+        self._tails: list[Comparable] = []
+        self._tails_index: list[int] = []
+        self._prev: list[int] = []
+
+    def append(self, x: T) -> int:
+        """`x`を末尾に追加し，`x`を末尾とする最長増加部分列の長さを返す O(log n)"""
+        k = x if self._key is None else self._key(x)
+        tails = self._tails
+        pos = bisect_left(tails, k) if self._strict else bisect_right(tails, k)
+        i = len(self._values)
+        self._values.append(x)
+        self._prev.append(self._tails_index[pos - 1] if pos else -1)
+        if pos == len(tails):
+            tails.append(k)
+            self._tails_index.append(i)
+        else:
+            tails[pos] = k
+            self._tails_index[pos] = i
+        return pos + 1
+
+    def extend(self, xs: Iterable[T]) -> None:
+        """`xs`の要素を順に追加 O(k log n)"""
+        for x in xs:
+            self.append(x)
+
+    def __len__(self) -> int:
+        """現在の最長増加部分列の長さ O(1)"""
+        return len(self._tails)
+
+    def indices(self) -> list[int]:
+        """現在の最長増加部分列の1つを，元の列でのindexのリストとして返す O(LIS長)"""
+        if not self._tails_index:
+            return []
+        res = []
+        i = self._tails_index[-1]
+        while i != -1:
+            res.append(i)
+            i = self._prev[i]
+        res.reverse()
+        return res
+
+    def values(self) -> list[T]:
+        """現在の最長増加部分列の1つを返す O(LIS長)"""
+        return [self._values[i] for i in self.indices()]
+
+
+def lis_indices(li: Iterable[T], *, strict: bool = True, key: Callable[[T], Comparable] | None = None) -> list[int]:
+    """最長増加部分列の1つを元の列でのindexのリストとして返す O(n log n)
+
+    Args:
+        li (Iterable[T]): 数列
+        strict (bool): 狭義単調増加かどうか（`False`なら広義単調増加）
+        key (Callable[[T], Comparable] | None): 比較に用いるキー関数
+
+    Returns:
+        list[int]: 最長増加部分列のindex（昇順）
+    """
+    stream: LISStream[T] = LISStream(strict=strict, key=key)
+    stream.extend(li)
+    return stream.indices()
+
+
+def lis(li: list[T], *, strict: bool = True, key: Callable[[T], Comparable] | None = None) -> list[T]:
+    """最長増加部分列 O(n log n)
+
+    Args:
+        li (list[T]): 数列
+        strict (bool): 狭義単調増加かどうか（`False`なら最長広義増加部分列）
+        key (Callable[[T], Comparable] | None): 比較に用いるキー関数
+
+    Returns:
+        list[T]: 最長増加部分列
+    """
+    return [li[i] for i in lis_indices(li, strict=strict, key=key)]
+
+
+def count_lis(li: list[T], MOD: int = 998244353, *, strict: bool = True,
+              key: Callable[[T], Comparable] | None = None) -> tuple[int, int]:
+    """最長増加部分列の長さと，その個数 (mod MOD) を返す O(n log n)
 
     Args:
-        li (list): 数列
+        li (list[T]): 数列
+        MOD (int): modulo
+        strict (bool): 狭義単調増加かどうか（`False`なら広義単調増加）
+        key (Callable[[T], Comparable] | None): 比較に用いるキー関数
 
     Returns:
-        list[int]: 最長増加部分列
+        tuple[int, int]: (最長増加部分列の長さ, 最長増加部分列の個数 (mod MOD))
+
+    Note:
+        - 個数は選んだindexの集合として数える（値が同じでも位置が異なれば別物）
+        - 圧縮したキー上のFenwick Treeに (長さ, 個数) の最大値を載せる
     """
-    # STEP1: LIS長パート with 使用位置
-    n = len(li)
-    lisDP = [float("inf")] * n # 通常のLIS用リスト
-    index_list: list[int] = [-1] * n # lの[i]文字目が使われた場所を記録する
-    for i in range(n):
-        # 通常のLISを求め、indexListに使った場所を記録する
-        ind = bisect_left(lisDP, li[i])
-        lisDP[ind] = li[i]
-        index_list[i] = ind
-    # STEP2: LIS復元パート by 元配列の使用した位置
-    # 後ろから見ていくので、まずは、LIS長目(targetIndex)のindexListを探したいとする
-    targetIndex = max(index_list)
-    ans = [0] * (targetIndex + 1) # 復元結果(indexListは0-indexedなのでlen=4ならmax=3で格納されているので+1する)
-    # 後ろから見ていく
-    for i in range(n - 1, -1, -1):
-        # もし、一番最後に出てきているtargetIndexなら
-        if index_list[i] == targetIndex:
-            ans[targetIndex] = li[i] # ansのtargetIndexを確定
-            targetIndex -= 1
-    return ans
+    keys: list[Comparable] = list(li) if key is None else [key(x) for x in li]
+    sorted_keys = sorted(set(keys))
+    m = len(sorted_keys)
+    length_t = [0] * (m + 1)
+    count_t = [0] * (m + 1)
+    for k in keys:
+        # キーが`k`未満（広義なら`k`以下）の要素で終わる最長増加部分列
+        i = bisect_left(sorted_keys, k) if strict else bisect_right(sorted_keys, k)
+        best, cnt = _prefix_best(length_t, count_t, i)
+        _update_best(length_t, count_t, bisect_left(sorted_keys, k) + 1, best + 1, cnt % MOD, MOD=MOD)
+    best, cnt = _prefix_best(length_t, count_t, m)
+    return best, cnt % MOD
 
 
+def _prefix_best(length_t: list[int], count_t: list[int], i: int) -> tuple[int, int]:
+    """Fenwick Treeの先頭`i`個のうち最長の長さと，その長さの個数の和（長さ0なら個数は1） O(log n)"""
+    best = 0
+    cnt = 1
+    while i > 0:
+        if length_t[i] > best:
+            best = length_t[i]
+            cnt = count_t[i]
+        elif length_t[i] == best and best:
+            cnt += count_t[i]
+        i -= i & -i
+    return best, cnt
+
+
+def _update_best(length_t: list[int], count_t: list[int], i: int, best: int, cnt: int, *, MOD: int) -> None:
+    """Fenwick Treeの位置`i`（1-indexed）に (長さ`best`, 個数`cnt`) を反映 O(log n)"""
+    m = len(length_t) - 1
+    while i <= m:
+        if length_t[i] < best:
+            length_t[i] = best
+            count_t[i] = cnt
+        elif length_t[i] == best:
+            count_t[i] = (count_t[i] + cnt) % MOD
+        i += i & -i
+
 if __name__ == "__main__":
-    N = int(input())
-    A = list(map(int, input().split()))
+    from atcoder.others.input import Reader
+
+    reader = Reader()
+    N = reader.int()
+    A = reader.ints(N)
 
     ans = lis(A)
     print(len(ans))
@@ -0,0 +1,286 @@
+"""Mo's algorithm（区間への要素の追加・削除で答えを更新するオフラインの区間クエリ）"""
+import time
+from typing import Callable, NamedTuple, TypeVar
+
+import numpy as np
+
+T = TypeVar("T")
+
+
+class MoStats(NamedTuple):
+    """クエリの並べ替えと実行の統計（ブロックサイズなどの調整用）
+
+    Attributes:
+        sort_seconds: クエリの並べ替えにかかった時間（秒）
+        left_moves: 左端の移動回数（= 左端でのコールバックの呼び出し回数）
+        right_moves: 右端の移動回数（= 右端でのコールバックの呼び出し回数）
+    """
+    sort_seconds: float
+    left_moves: int
+    right_moves: int
+
+    @property
+    def moves(self) -> int:
+        """左右の移動回数の合計"""
+        return self.left_moves + self.right_moves
+
+
+def hilbert_keys(left: np.ndarray, right: np.ndarray, n: int) -> np.ndarray:
+    """点`(left[i], right[i])`のヒルベルト曲線上の位置（`0 <= left, right <= n`） O(Q log n)
+
+    ビットごとのループをクエリ全体についてまとめて計算する．
+    """
+    x = np.array(left, dtype=np.int64)
+    y = np.array(right, dtype=np.int64)
+    size = 1 << max(n, 1).bit_length()
+    d = np.zeros(len(x), dtype=np.int64)
+    s = size >> 1
+    while s:
+        rx = (x & s) > 0
+        ry = (y & s) > 0
+        d += s * s * ((3 * rx) ^ ry)
+        # 象限に合わせて回転・反転
+        flip = rx & ~ry
+        x = np.where(flip, size - 1 - x, x)
+        y = np.where(flip, size - 1 - y, y)
+        x, y = np.where(ry, x, y), np.where(ry, y, x)
+        s >>= 1
+    return d
+
+
+def block_keys(left: np.ndarray, right: np.ndarray, n: int, block_size: int) -> np.ndarray:
+    """左端のブロック順，ブロック内では右端の昇順・降順を交互にしたキー O(Q)"""
+    left = np.asarray(left, dtype=np.int64)
+    right = np.asarray(right, dtype=np.int64)
+    block = left // block_size
+    return block * (n + 1) + np.where(block & 1, n - right, right)
+
+
+def default_block_size(n: int, q: int) -> int:
+    """ブロックサイズの目安`n / sqrt(q)`"""
+    return max(1, int(n / max(q, 1) ** 0.5))
+
+
+def _moves(positions: np.ndarray, start: int) -> int:
+    """`start`から`positions`の順に移動したときの移動距離の合計"""
+    return int(np.abs(np.diff(positions, prepend=start)).sum())
+
+
+class Mo:
+    """Mo's algorithm
+
+    Attributes:
+        n: 列の長さ
+        left: クエリの左端
+        right: クエリの右端（左閉右開）
+        order: クエリを処理する順番（クエリの番号の配列）
+        stats: 並べ替えの時間と，`run`での左右の移動回数
+
+    Note:
+        - 既定ではヒルベルト曲線順に並べる（`order="block"`で左端のブロック順）
+        - 移動回数は並べ替えの時点で計算できるので，`run`の前に`stats`を見てブロックサイズを調整できる
+        - 状態の更新が O(1) なら全体で O(n sqrt(Q))
+    """
+    def __init__(self, n: int, left: "list[int] | np.ndarray", right: "list[int] | np.ndarray",
+                 order: str = "hilbert", block_size: int | None = None) -> None:
+        """Init.（クエリの並べ替え） O(Q log n)
+
+        Args:
+            n (int): 列の長さ
+            left (list[int] | np.ndarray): クエリの左端
+            right (list[int] | np.ndarray): クエリの右端（左閉右開）
+            order (str): "hilbert"（ヒルベルト曲線順）または"block"（左端のブロック順）
+            block_size (int | None): `order="block"`のときのブロックサイズ（`None`なら`n / sqrt(Q)`）
+        """
+        self.n = n
+        self.left = np.array(left, dtype=np.int64).reshape(-1)
+        self.right = np.array(right, dtype=np.int64).reshape(-1)
+        assert np.all((self.left >= 0) & (self.left <= self.right) & (self.right <= n))
+        start = time.perf_counter()
+        if order == "hilbert":
+            keys = hilbert_keys(self.left, self.right, n)
+        elif order == "block":
+            if block_size is None:
+                block_size = default_block_size(n, len(self.left))
+            keys = block_keys(self.left, self.right, n, block_size)
+        else:
+            msg = f"unknown order: {order}"
+            raise ValueError(msg)
+        self.order = np.argsort(keys, kind="stable")
+        sort_seconds = time.perf_counter() - start
+        self.stats = MoStats(sort_seconds, _moves(self.left[self.order], 0), _moves(self.right[self.order], 0))
+
+    def run(self, add_left: Callable[[int], None], add_right: Callable[[int], None],
+            remove_left: Callable[[int], None], remove_right: Callable[[int], None],
+            answer: Callable[[], T]) -> list[T]:
+        """クエリを処理する O(n sqrt(Q))
+
+        Args:
+            add_left (Callable[[int], None]): 区間の左に要素`i`を追加
+            add_right (Callable[[int], None]): 区間の右に要素`i`を追加
+            remove_left (Callable[[int], None]): 区間の左端の要素`i`を削除
+            remove_right (Callable[[int], None]): 区間の右端の要素`i`を削除
+            answer (Callable[[], T]): 現在の区間についての答え
+
+        Returns:
+            list[T]: クエリの番号順の答え
+
+        Note:
+            - 空の区間`[0, 0)`から始め，区間を広げてから縮めるので，途中でも`left <= right`が保たれる
+        """
+        res: list[T] = [None] * len(self.order)  # type: ignore[list-item]
+        left = right = 0
+        ls = self.left.tolist()
+        rs = self.right.tolist()
+        for i in self.order.tolist():
+            ql = ls[i]
+            qr = rs[i]
+            while right < qr:
+                add_right(right)
+                right += 1
+            while left > ql:
+                left -= 1
+                add_left(left)
+            while right > qr:
+                right -= 1
+                remove_right(right)
+            while left < ql:
+                remove_left(left)
+                left += 1
+            res[i] = answer()
+        return res
+
+
+class RollbackMo:
+    """削除のできない（追加とロールバックのみの）Mo's algorithm
+
+    Attributes:
+        n: 列の長さ
+        left: クエリの左端
+        right: クエリの右端（左閉右開）
+        block_size: ブロックサイズ
+        order: クエリを処理する順番（クエリの番号の配列）
+        stats: 並べ替えの時間と，`run`での左右の移動回数（`left_moves`はロールバックされる追加も含む）
+
+    Note:
+        - 左端のブロックごとに状態を`reset`し，右端はブロックの右端から単調に伸ばす
+        - 左端はクエリごとに`snapshot`してからブロックの右端から左へ伸ばし，答えを求めたら`rollback`する
+        - ブロック内に収まる短いクエリは，空の状態から`add_left`で直接追加して求める
+        - 最頻値の出現回数など，削除が難しい統計に使う
+    """
+    def __init__(self, n: int, left: "list[int] | np.ndarray", right: "list[int] | np.ndarray",
+                 block_size: int | None = None) -> None:
+        """Init.（クエリの並べ替え） O(Q log Q)
+
+        Args:
+            n (int): 列の長さ
+            left (list[int] | np.ndarray): クエリの左端
+            right (list[int] | np.ndarray): クエリの右端（左閉右開）
+            block_size (int | None): ブロックサイズ（`None`なら`n / sqrt(Q)`）
+        """
+        self.n = n
+        self.left = np.array(left, dtype=np.int64).reshape(-1)
+        self.right = np.array(right, dtype=np.int64).reshape(-1)
+        assert np.all((self.left >= 0) & (self.left <= self.right) & (self.right <= n))
+        if block_size is None:
+            block_size = default_block_size(n, len(self.left))
+        self.block_size = block_size
+        start = time.perf_counter()
+        self.order = np.lexsort((self.right, self.left // block_size))
+        sort_seconds = time.perf_counter() - start
+        self.stats = MoStats(sort_seconds, *self._count_moves())
+
+    def _count_moves(self) -> tuple[int, int]:
+        """`run`での左右の追加の回数"""
+        left = self.left[self.order]
+        right = self.right[self.order]
+        border = (left // self.block_size + 1) * self.block_size
+        short = right <= border
+        left_moves = int(np.where(short, right - left, border - left).sum())
+        # 右端はブロックごとにブロックの右端から単調に伸びる
+        reach = np.where(short, border, right)
+        block_max = np.zeros(self.n // self.block_size + 1, dtype=np.int64)
+        block = left // self.block_size
+        np.maximum.at(block_max, block, reach)
+        used = np.unique(block)
+        right_moves = int((block_max[used] - (used + 1) * self.block_size).sum())
+        return left_moves, right_moves
+
+    def run(self, add_left: Callable[[int], None], add_right: Callable[[int], None],  # noqa: PLR0917
+            snapshot: Callable[[], None], rollback: Callable[[], None], reset: Callable[[], None],
+            answer: Callable[[], T]) -> list[T]:
+        """クエリを処理する O(n sqrt(Q))
+
+        Args:
+            add_left (Callable[[int], None]): 区間の左に要素`i`を追加
+            add_right (Callable[[int], None]): 区間の右に要素`i`を追加
+            snapshot (Callable[[], None]): 現在の状態を記録
+            rollback (Callable[[], None]): `snapshot`した状態に戻す
+            reset (Callable[[], None]): 空の区間の状態に戻す
+            answer (Callable[[], T]): 現在の区間についての答え
+
+        Returns:
+            list[T]: クエリの番号順の答え
+        """
+        res: list[T] = [None] * len(self.order)  # type: ignore[list-item]
+        ls = self.left.tolist()
+        rs = self.right.tolist()
+        size = self.block_size
+        current_block = -1
+        border = right = 0
+        for i in self.order.tolist():
+            ql = ls[i]
+            qr = rs[i]
+            if ql // size != current_block:
+                current_block = ql // size
+                border = right = (current_block + 1) * size
+                reset()
+            if qr <= border:
+                # ブロック内に収まるクエリ（右端の昇順なので，まだ右には伸ばしていない）
+                snapshot()
+                for j in range(qr - 1, ql - 1, -1):
+                    add_left(j)
+                res[i] = answer()
+                rollback()
+                continue
+            while right < qr:
+                add_right(right)
+                right += 1
+            snapshot()
+            for j in range(border - 1, ql - 1, -1):
+                add_left(j)
+            res[i] = answer()
+            rollback()
+        return res
+
+
+if __name__ == "__main__":
+    """動作確認"""
+    # https://judge.yosupo.jp/problem/static_range_count_distinct
+    from atcoder.others.compressor import Compressor
+    from atcoder.others.input import Reader, Writer
+
+    reader = Reader()
+    writer = Writer()
+    N, Q = reader.ints(2)
+    a = Compressor(reader.int_array(N)).codes()[0].tolist()
+    LR = reader.matrix(Q, 2)
+    count = [0] * N
+    distinct = 0
+
+    def add(i: int) -> None:
+        """要素`i`を追加"""
+        global distinct  # noqa: PLW0603
+        if count[a[i]] == 0:
+            distinct += 1
+        count[a[i]] += 1
+
+    def remove(i: int) -> None:
+        """要素`i`を削除"""
+        global distinct  # noqa: PLW0603
+        count[a[i]] -= 1
+        if count[a[i]] == 0:
+            distinct -= 1
+
+    mo = Mo(N, LR[:, 0], LR[:, 1])
+    writer.lines(mo.run(add, add, remove, remove, lambda: distinct))
@@ -1,8 +1,122 @@
-"""再帰の回数上限増加 & 再帰の高速化"""
+"""再帰の高速化（ジェネレータによるトランポリンで再帰を明示的なスタックに置き換える）"""
+from functools import wraps
+from types import GeneratorType
+from typing import Any, Callable, Generator, Hashable, TypeVar
 
-import sys
+R = TypeVar("R")
 
-# import pypyjit
 
-# pypyjit.set_param("max_unroll_recursion=-1")
-sys.setrecursionlimit(10**9)
+def recursive(func: Callable[..., Generator[Any, Any, R]] | None = None, *,
+              memo: bool = False) -> Any:
+    """ジェネレータで書いた再帰関数を，明示的なスタックで実行する関数に変換するデコレータ
+
+    再帰呼び出しを`yield f(child)`，戻り値を`return value`と書く．
+    `sys.setrecursionlimit`を変更する必要がなく，深さ10^6の再帰でもCのスタックを消費しない．
+
+    Args:
+        func (Callable[..., Generator[Any, Any, R]] | None): ジェネレータ関数
+        memo (bool): 引数をキーとして戻り値をメモ化するかどうか（引数はhashableであること）
+
+    Returns:
+        Any: 変換後の関数（`memo=True`のときは`cache`属性にメモのdictを持つ）
+
+    Note:
+        - 例::
+
+            @recursive
+            def dfs(v: int, parent: int):
+                size = 1
+                for to in graph[v]:
+                    if to != parent:
+                        size += yield dfs(to, v)
+                return size
+
+        - 外側からの呼び出しはそのまま値を返す．関数内で`yield`せずに呼び出した場合はジェネレータが返るので注意
+        - 速さでは，CPython 3.11以降で再帰の上限を上げた通常の再帰の方が3倍程度速い（benchmarksの`recursion`と
+          `recursion_native`）．この変換の利点は，グローバルな上限を変更せず，Cのスタックのあふれで落ちないこと
+        - 参考：https://github.com/cheran-senthil/PyRival/blob/master/pyrival/misc/bootstrap.py
+    """
+    def decorator(func: Callable[..., Generator[Any, Any, R]]) -> Callable[..., R]:
+        cache: dict[Hashable, Any] = {}
+        running = False
+        call = _memoized(func, cache) if memo else func
+
+        @wraps(func)
+        def wrapper(*args: Any) -> Any:
+            nonlocal running
+            if memo and args in cache:
+                return cache[args]
+            if running:
+                # トランポリン実行中の再帰呼び出しはジェネレータを返し，`yield`でスタックに積ませる
+                return call(*args)
+            running = True
+            try:
+                return _trampoline(call(*args))
+            finally:
+                running = False
+
+        if memo:
+            wrapper.cache = cache  # type: ignore[attr-defined]
+        return wrapper
+
+    if func is None:
+        return decorator
+    return decorator(func)
+
+
+def _memoized(func: Callable[..., Generator[Any, Any, R]],
+              cache: dict[Hashable, Any]) -> Callable[..., Generator[Any, Any, R]]:
+    """`func(*args)`を実行し，戻り値を`cache[args]`にメモするジェネレータ関数"""
+    def call(*args: Any) -> Generator[Any, Any, R]:
+        value = yield from func(*args)
+        cache[args] = value
+        return value
+    return call
+
+
+def _trampoline(root: Generator[Any, Any, R]) -> R:
+    """ジェネレータ`root`を明示的なスタックで最後まで実行し，戻り値を返す"""
+    stack = [root]
+    value = None
+    while stack:
+        try:
+            child = stack[-1].send(value)
+        except StopIteration as e:
+            stack.pop()
+            value = e.value
+            continue
+        if type(child) is GeneratorType:
+            stack.append(child)
+            value = None
+        else:
+            value = child  # メモ済みの値
+    return value  # type: ignore[return-value]
+
+if __name__ == "__main__":
+    """動作確認"""
+    # 深さ10^6のパスグラフの部分木サイズ
+    N = 10**6
+    graph: list[list[int]] = [[] for _ in range(N)]
+    for i in range(N - 1):
+        graph[i].append(i + 1)
+        graph[i + 1].append(i)
+
+    @recursive
+    def dfs(v: int, parent: int) -> Generator[Any, Any, int]:
+        """`v`を根とする部分木のサイズ"""
+        size = 1
+        for to in graph[v]:
+            if to != parent:
+                size += yield dfs(to, v)
+        return size
+
+    print(dfs(0, -1))
+
+    @recursive(memo=True)
+    def fib(n: int) -> Generator[Any, Any, int]:
+        """フィボナッチ数 (mod 998244353)"""
+        if n < 2:  # noqa: PLR2004
+            return n
+        return ((yield fib(n - 1)) + (yield fib(n - 2))) % 998244353
+
+    print(fib(10**5))
@@ -1,26 +1,152 @@
 """ランレングス圧縮"""
+from bisect import bisect_left, bisect_right
+from collections.abc import Hashable
+from itertools import accumulate, groupby
+from typing import Generic, Iterable, Iterator, TypeVar
 
-def run_length_encoding(s: str) -> list[tuple[str, int]]:
-    """ランレングス圧縮
+import numpy as np
+
+T = TypeVar("T")
+H = TypeVar("H", bound=Hashable)
+
+
+def iter_run_length(s: Iterable[T]) -> Iterator[tuple[T, int]]:
+    """ランレングス圧縮をジェネレータとして返す（入力を1回なめるだけで，メモリは定数）
+
+    Args:
+        s (Iterable[T]): 圧縮する列（文字列・リスト・ストリームなど）
+
+    Yields:
+        tuple[T, int]: (値, 連続する個数)
+    """
+    for value, group in groupby(s):
+        yield value, sum(1 for _ in group)
+
+
+def run_length_encoding(s: Iterable[T]) -> list[tuple[T, int]]:
+    """ランレングス圧縮 O(n)
 
     Args:
-        s (str): 圧縮する文字列
+        s (Iterable[T]): 圧縮する列
 
     Returns:
-        list[tuple[str, int]]: (文字, 文字数)のリスト
+        list[tuple[T, int]]: (値, 個数)のリスト
     """
-    res = []
-    cnt = 1
-    for i in range(1, len(s)):
-        if s[i] == s[i - 1]:
-            cnt += 1
-        else:
-            res.append((s[i - 1], cnt))
-            cnt = 1
-        if i == len(s) - 1:
-            res.append((s[i], cnt))
-    return res
-
-s = "AAAAAAABBBBCCDEEEEEAAA"
-
-print(run_length_encoding(s))
+    return list(iter_run_length(s))
+
+
+def run_length_encoding_np(a: "np.ndarray | bytes | bytearray") -> tuple[np.ndarray, np.ndarray]:
+    """NumPyによるランレングス圧縮 O(n)
+
+    Args:
+        a (np.ndarray | bytes | bytearray): 圧縮する1次元配列（`bytes`は`uint8`の配列として扱う）
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: (各ランの値, 各ランの長さ)
+    """
+    if isinstance(a, (bytes, bytearray)):
+        a = np.frombuffer(a, dtype=np.uint8)
+    a = np.asarray(a)
+    if len(a) == 0:
+        return a[:0], np.zeros(0, dtype=np.int64)
+    starts = np.concatenate(([0], np.flatnonzero(a[1:] != a[:-1]) + 1))
+    lengths = np.diff(np.append(starts, len(a)))
+    return a[starts], lengths
+
+
+def run_length_decoding(runs: Iterable[tuple[T, int]]) -> Iterator[T]:
+    """ランレングス圧縮の復元をジェネレータとして返す（文字列なら`"".join(...)`で復元）"""
+    for value, length in runs:
+        for _ in range(length):
+            yield value
+
+
+def run_length_decoding_np(values: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+    """`run_length_encoding_np`の逆変換 O(n)"""
+    return np.repeat(values, lengths)
+
+
+class RunLengthArray(Generic[H]):
+    """ランレングス圧縮された列に対する位置・個数のクエリ
+
+    Attributes:
+        _values: 各ランの値
+        _starts: 各ランの開始位置（末尾に全体の長さを追加）
+        _value_starts: 値ごとの，その値のランの開始位置のリスト
+        _value_prefix: 値ごとの，その値のランの長さの累積和（先頭は0）
+
+    Note:
+        - ラン数をkとして，構築 O(k)，クエリ O(log k)
+        - 区間は左閉右開区間
+    """
+    def __init__(self, runs: Iterable[tuple[H, int]]) -> None:
+        """Init. O(k)
+
+        Args:
+            runs (Iterable[tuple[H, int]]): (値, 個数)の列（`iter_run_length`などの出力）
+        """
+        self._values: list[H] = []
+        lengths: list[int] = []
+        for value, length in runs:
+            if length <= 0:
+                continue
+            if self._values and self._values[-1] == value:
+                lengths[-1] += length
+            else:
+                self._values.append(value)
+                lengths.append(length)
+        self._starts = [0, *accumulate(lengths)]
+        self._value_starts: dict[H, list[int]] = {}
+        self._value_prefix: dict[H, list[int]] = {}
+        for value, start, length in zip(self._values, self._starts, lengths):
+            if value not in self._value_starts:
+                self._value_starts[value] = []
+                self._value_prefix[value] = [0]
+            self._value_starts[value].append(start)
+            prefix = self._value_prefix[value]
+            prefix.append(prefix[-1] + length)
+
+    def __len__(self) -> int:
+        """復元後の長さ"""
+        return self._starts[-1]
+
+    def __getitem__(self, i: int) -> H:
+        """復元後の`i`番目の値 O(log k)"""
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError
+        return self._values[bisect_right(self._starts, i) - 1]
+
+    def runs(self) -> Iterator[tuple[H, int]]:
+        """(値, 個数)の列"""
+        for k, value in enumerate(self._values):
+            yield value, self._starts[k + 1] - self._starts[k]
+
+    def _count_prefix(self, x: H, p: int) -> int:
+        """復元後の`[0, p)`に含まれる`x`の個数"""
+        starts = self._value_starts.get(x)
+        if starts is None:
+            return 0
+        k = bisect_left(starts, p)  # 開始位置が`p`未満のランの数
+        if k == 0:
+            return 0
+        prefix = self._value_prefix[x]
+        # 最後のラン以外は丸ごと含まれる
+        return prefix[k - 1] + min(prefix[k] - prefix[k - 1], p - starts[k - 1])
+
+    def count(self, x: H, left: int = 0, right: int | None = None) -> int:
+        """復元後の`[left, right)`に含まれる`x`の個数 O(log k)"""
+        if right is None:
+            right = len(self)
+        assert 0 <= left <= right <= len(self)
+        return self._count_prefix(x, right) - self._count_prefix(x, left)
+
+
+if __name__ == "__main__":
+    """動作確認"""
+    s = "AAAAAAABBBBCCDEEEEEAAA"
+    print(run_length_encoding(s))
+    print(run_length_encoding_np(s.encode()))
+    rla = RunLengthArray(iter_run_length(s))
+    print(rla[10], rla.count("A", 3, 21))
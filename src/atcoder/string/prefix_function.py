@@ -0,0 +1,53 @@
+"""Prefix function（KMP法の失敗関数）"""
+from typing import Sequence
+
+
+def prefix_function(s: str | bytes | Sequence[int]) -> list[int]:
+    """Prefix function O(n)
+
+    Args:
+        s (str | bytes | Sequence[int]): 文字列・バイト列・整数列
+
+    Returns:
+        list[int]: `pi[i]`は`s[:i + 1]`の真の接頭辞かつ接尾辞であるものの最大の長さ
+    """
+    n = len(s)
+    pi = [0] * n
+    for i in range(1, n):
+        k = pi[i - 1]
+        while k > 0 and s[i] != s[k]:
+            k = pi[k - 1]
+        if s[i] == s[k]:
+            k += 1
+        pi[i] = k
+    return pi
+
+
+def find_all(text: str | bytes | Sequence[int], pattern: str | bytes | Sequence[int]) -> list[int]:
+    """`text`中に`pattern`が現れる開始位置をすべて返す（KMP法） O(|text| + |pattern|)"""
+    m = len(pattern)
+    if m == 0:
+        return list(range(len(text) + 1))
+    pi = prefix_function(pattern)
+    res = []
+    k = 0
+    for i, c in enumerate(text):
+        while k > 0 and c != pattern[k]:
+            k = pi[k - 1]
+        if c == pattern[k]:
+            k += 1
+        if k == m:
+            res.append(i - m + 1)
+            k = pi[k - 1]
+    return res
+
+
+if __name__ == "__main__":
+    """動作確認"""
+    from atcoder.others.input import Reader, Writer
+
+    reader = Reader()
+    writer = Writer()
+    T = reader.str()
+    P = reader.str()
+    writer.lines(find_all(T, P))
@@ -0,0 +1,185 @@
+"""ローリングハッシュ"""
+import random
+from typing import Callable, Sequence
+
+import numpy as np
+
+
+def _lcp(get1: Callable[[int, int], int], l1: int, get2: Callable[[int, int], int], l2: int, limit: int) -> int:
+    """`get1(l1, l1 + k) == get2(l2, l2 + k)`となる最大の`k <= limit` O(log LCP)
+
+    長さ1, 2, 4, ...と倍々に調べてから二分探索する（LCPが短いときに速い）．
+    """
+    ok = 0
+    ng = 1
+    while ng <= limit and get1(l1, l1 + ng) == get2(l2, l2 + ng):
+        ok = ng
+        ng <<= 1
+    ng = min(ng, limit + 1)
+    while ng - ok > 1:
+        mid = (ok + ng) >> 1
+        if get1(l1, l1 + mid) == get2(l2, l2 + mid):
+            ok = mid
+        else:
+            ng = mid
+    return ok
+
+
+class RollingHash:
+    """mod 2^61 - 1 のローリングハッシュ
+
+    Attributes:
+        MOD: 法（2^61 - 1）
+        _base: 基数（全インスタンスで共通，最初のインスタンス生成時にランダムに決める）
+        _hash: 接頭辞のハッシュ（`_hash[i]`は`s[:i]`のハッシュ）
+        _power: `_power[i] = base^i`
+
+    Note:
+        - 異なる文字列のハッシュを比較できるよう，基数はクラスで共通
+        - 部分文字列のハッシュ O(1)，LCP O(log n)
+    """
+    MOD = (1 << 61) - 1
+    _base: int | None = None
+
+    def __init__(self, s: str | bytes | Sequence[int], base: int | None = None) -> None:
+        """Init. O(n)
+
+        Args:
+            s (str | bytes | Sequence[int]): 文字列・バイト列・整数列
+            base (int | None): 基数（`None`ならクラスで共通のランダムな値）
+        """
+        if base is None:
+            if RollingHash._base is None:
+                # 基数は衝突を狙った入力を避けるための乱択で，暗号的な強度は要らない
+                RollingHash._base = random.randrange(1 << 10, self.MOD - 1)  # noqa: S311
+            base = RollingHash._base
+        mod = self.MOD
+        values = [ord(c) for c in s] if isinstance(s, str) else s
+        n = len(values)
+        h = self._hash = [0] * (n + 1)
+        p = self._power = [1] * (n + 1)
+        for i, c in enumerate(values):
+            h[i + 1] = (h[i] * base + c + 1) % mod
+            p[i + 1] = p[i] * base % mod
+
+    def __len__(self) -> int:
+        """元の列の長さ"""
+        return len(self._hash) - 1
+
+    def get(self, left: int, right: int) -> int:
+        """`s[left: right]`のハッシュ O(1)"""
+        assert 0 <= left <= right <= len(self)
+        return (self._hash[right] - self._hash[left] * self._power[right - left]) % self.MOD
+
+    def connect(self, h1: int, h2: int, len2: int) -> int:
+        """ハッシュ`h1`の列の後ろに，長さ`len2`でハッシュ`h2`の列をつなげた列のハッシュ O(1)"""
+        return (h1 * self._power[len2] + h2) % self.MOD
+
+    def lcp(self, l1: int, l2: int, other: "RollingHash | None" = None) -> int:
+        """`s[l1:]`と`other[l2:]`（`other`が`None`なら`s[l2:]`）の最長共通接頭辞の長さ O(log LCP)"""
+        if other is None:
+            other = self
+        return _lcp(self.get, l1, other.get, l2, min(len(self) - l1, len(other) - l2))
+
+def _mod_powers(base: int, n: int, mod: int) -> np.ndarray:
+    """`[base^0, base^1, ..., base^(n-1)] (mod mod)`をダブリングで計算（`mod < 2^31`）"""
+    p = np.ones(max(n, 1), dtype=np.int64)
+    if n > 1:
+        p[1] = base % mod
+    k = 2
+    while k < n:
+        m = min(k, n - k)
+        p[k: k + m] = p[:m] * p[k - 1] % mod * (base % mod) % mod
+        k += m
+    return p[:n]
+
+
+class DoubleRollingHash:
+    """2つの法（998244353, 10^9 + 7）によるローリングハッシュ（接頭辞のハッシュはNumPyで計算）
+
+    Attributes:
+        MODS: 法
+        _bases: 基数（全インスタンスで共通，最初のインスタンス生成時にランダムに決める）
+        _hash: 法ごとの接頭辞のハッシュ（shape = (2, n + 1)）
+        _power: 法ごとの基数の累乗（shape = (2, n + 1)）
+
+    Note:
+        - `s[j] * base^(-j - 1)`の累積和に`base^i`を掛けることで，逐次的な漸化式を使わずに接頭辞のハッシュを計算する
+        - 値はいずれも2^30程度未満なので，積はint64に収まる
+        - ハッシュは`h1 * MODS[1] + h2`の1つの整数として返す
+    """
+    MODS = (998244353, 1000000007)
+    _bases: tuple[int, int] | None = None
+
+    def __init__(self, s: str | bytes | Sequence[int], bases: tuple[int, int] | None = None) -> None:
+        """Init. O(n)
+
+        Args:
+            s (str | bytes | Sequence[int]): 文字列・バイト列・整数列（int64に収まること）
+            bases (tuple[int, int] | None): 基数（`None`ならクラスで共通のランダムな値）
+        """
+        if bases is None:
+            if DoubleRollingHash._bases is None:
+                DoubleRollingHash._bases = (random.randrange(1 << 10, self.MODS[0] - 1),  # noqa: S311
+                                            random.randrange(1 << 10, self.MODS[1] - 1))  # noqa: S311
+            bases = DoubleRollingHash._bases
+        if isinstance(s, (bytes, bytearray)):
+            values = np.frombuffer(s, dtype=np.uint8).astype(np.int64)
+        elif isinstance(s, str):
+            values = np.array([ord(c) for c in s], dtype=np.int64)
+        else:
+            values = np.array(s, dtype=np.int64).reshape(-1)
+        n = len(values)
+        self._n = n
+        self._hash = np.zeros((2, n + 1), dtype=np.int64)
+        self._power = np.zeros((2, n + 1), dtype=np.int64)
+        for t, (base, mod) in enumerate(zip(bases, self.MODS)):
+            power = _mod_powers(base, n + 1, mod)
+            inv_power = _mod_powers(pow(base, mod - 2, mod), n + 1, mod)
+            # s[j] * base^(-j - 1) の累積和（各項 < mod なので n < 9 * 10^9 まではint64に収まる）
+            terms = (values % mod + 1) * inv_power[1:] % mod
+            self._hash[t, 1:] = np.cumsum(terms) % mod * power[1:] % mod
+            self._power[t] = power
+
+    def __len__(self) -> int:
+        """元の列の長さ"""
+        return self._n
+
+    def get(self, left: int, right: int) -> int:
+        """`s[left: right]`のハッシュ O(1)"""
+        assert 0 <= left <= right <= self._n
+        m0, m1 = self.MODS
+        h, p = self._hash, self._power
+        h0 = (int(h[0, right]) - int(h[0, left]) * int(p[0, right - left])) % m0
+        h1 = (int(h[1, right]) - int(h[1, left]) * int(p[1, right - left])) % m1
+        return h0 * m1 + h1
+
+    def get_many(self, left: np.ndarray, right: np.ndarray) -> np.ndarray:
+        """`get`を配列でまとめて計算 O(Q)"""
+        left = np.asarray(left)
+        right = np.asarray(right)
+        m0, m1 = self.MODS
+        h, p = self._hash, self._power
+        length = right - left
+        h0 = (h[0, right] - h[0, left] * p[0, length] % m0) % m0
+        h1 = (h[1, right] - h[1, left] * p[1, length] % m1) % m1
+        return h0 * m1 + h1
+
+    def lcp(self, l1: int, l2: int, other: "DoubleRollingHash | None" = None) -> int:
+        """`s[l1:]`と`other[l2:]`（`other`が`None`なら`s[l2:]`）の最長共通接頭辞の長さ O(log LCP)"""
+        if other is None:
+            other = self
+        return _lcp(self.get, l1, other.get, l2, min(len(self) - l1, len(other) - l2))
+
+if __name__ == "__main__":
+    """動作確認"""
+    # 文字列Tの中に文字列Pが現れる位置
+    from atcoder.others.input import Reader, Writer
+
+    reader = Reader()
+    writer = Writer()
+    T = reader.str()
+    P = reader.str()
+    rh_t = RollingHash(T)
+    h_p = RollingHash(P).get(0, len(P))
+    writer.lines(i for i in range(len(T) - len(P) + 1) if rh_t.get(i, i + len(P)) == h_p)
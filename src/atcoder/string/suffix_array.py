@@ -0,0 +1,205 @@
+"""接尾辞配列（SA-IS）とLCP配列"""
+from typing import Sequence
+
+
+def _to_int_list(s: str | bytes | Sequence[int], upper: int | None = None) -> tuple[list[int], int]:
+    """`s`を非負整数のリストに変換し，（リスト, 値の上限）を返す
+
+    `str`は文字コード，`bytes`はそのまま，整数列は`upper`が指定されていなければ座標圧縮する．
+    """
+    if isinstance(s, str):
+        res = [ord(c) for c in s]
+        return res, max(res, default=0)
+    if isinstance(s, (bytes, bytearray)):
+        return list(s), 255
+    if upper is not None:
+        assert all(0 <= x <= upper for x in s)
+        return list(s), upper
+    values = sorted(set(s))
+    index = {x: i for i, x in enumerate(values)}
+    return [index[x] for x in s], max(len(values) - 1, 0)
+
+
+def _sa_naive(s: list[int]) -> list[int]:
+    """愚直な接尾辞配列 O(n^2 log n)"""
+    return sorted(range(len(s)), key=lambda i: s[i:])
+
+
+def _sa_doubling(s: list[int]) -> list[int]:
+    """ダブリングによる接尾辞配列 O(n log^2 n)"""
+    n = len(s)
+    sa = list(range(n))
+    rnk = s[:]
+    tmp = [0] * n
+    k = 1
+    while k < n:
+        def key(x: int, k: int = k, rnk: list[int] = rnk) -> tuple[int, int]:
+            return (rnk[x], rnk[x + k] if x + k < n else -1)
+        sa.sort(key=key)
+        tmp[sa[0]] = 0
+        for i in range(1, n):
+            tmp[sa[i]] = tmp[sa[i - 1]] + (key(sa[i - 1]) < key(sa[i]))
+        tmp, rnk = rnk, tmp
+        k <<= 1
+    return sa
+
+
+def sa_is(s: list[int], upper: int) -> list[int]:  # noqa: C901, PLR0912, PLR0915
+    """SA-ISによる接尾辞配列 O(n + upper)
+
+    Args:
+        s (list[int]): `0 <= s[i] <= upper`を満たす整数列
+        upper (int): 値の上限
+
+    Returns:
+        list[int]: 接尾辞配列
+
+    Note:
+        - 参考：https://github.com/atcoder/ac-library/blob/master/atcoder/string.hpp
+    """
+    n = len(s)
+    if n == 0:
+        return []
+    if n == 1:
+        return [0]
+    if n == 2:  # noqa: PLR2004
+        return [0, 1] if s[0] < s[1] else [1, 0]
+    if n < 10:  # noqa: PLR2004
+        return _sa_naive(s)
+    if n < 40:  # noqa: PLR2004
+        return _sa_doubling(s)
+
+    sa = [0] * n
+    ls = [False] * n  # S型ならTrue
+    for i in range(n - 2, -1, -1):
+        ls[i] = ls[i + 1] if s[i] == s[i + 1] else s[i] < s[i + 1]
+    sum_l = [0] * (upper + 1)
+    sum_s = [0] * (upper + 1)
+    for i in range(n):
+        if not ls[i]:
+            sum_s[s[i]] += 1
+        else:
+            sum_l[s[i] + 1] += 1
+    for i in range(upper + 1):
+        sum_s[i] += sum_l[i]
+        if i < upper:
+            sum_l[i + 1] += sum_s[i]
+
+    def induce(lms: list[int]) -> None:
+        """LMSの位置から誘導ソート"""
+        for i in range(n):
+            sa[i] = -1
+        buf = sum_s[:]
+        for d in lms:
+            if d == n:
+                continue
+            sa[buf[s[d]]] = d
+            buf[s[d]] += 1
+        buf = sum_l[:]
+        sa[buf[s[n - 1]]] = n - 1
+        buf[s[n - 1]] += 1
+        for i in range(n):
+            v = sa[i]
+            if v >= 1 and not ls[v - 1]:
+                sa[buf[s[v - 1]]] = v - 1
+                buf[s[v - 1]] += 1
+        buf = sum_l[:]
+        for i in range(n - 1, -1, -1):
+            v = sa[i]
+            if v >= 1 and ls[v - 1]:
+                buf[s[v - 1] + 1] -= 1
+                sa[buf[s[v - 1] + 1]] = v - 1
+
+    lms_map = [-1] * (n + 1)
+    lms: list[int] = []
+    for i in range(1, n):
+        if not ls[i - 1] and ls[i]:
+            lms_map[i] = len(lms)
+            lms.append(i)
+    m = len(lms)
+    induce(lms)
+
+    if m:
+        sorted_lms = [v for v in sa if lms_map[v] != -1]
+        rec_s = [0] * m
+        rec_upper = 0
+        rec_s[lms_map[sorted_lms[0]]] = 0
+        for i in range(1, m):
+            left = sorted_lms[i - 1]
+            right = sorted_lms[i]
+            end_l = lms[lms_map[left] + 1] if lms_map[left] + 1 < m else n
+            end_r = lms[lms_map[right] + 1] if lms_map[right] + 1 < m else n
+            same = True
+            if end_l - left != end_r - right:
+                same = False
+            else:
+                while left < end_l:
+                    if s[left] != s[right]:
+                        break
+                    left += 1
+                    right += 1
+                if left == n or s[left] != s[right]:
+                    same = False
+            if not same:
+                rec_upper += 1
+            rec_s[lms_map[sorted_lms[i]]] = rec_upper
+        rec_sa = sa_is(rec_s, rec_upper)
+        for i in range(m):
+            sorted_lms[i] = lms[rec_sa[i]]
+        induce(sorted_lms)
+    return sa
+
+
+def suffix_array(s: str | bytes | Sequence[int], upper: int | None = None) -> list[int]:
+    """接尾辞配列 O(n + upper)（整数列で`upper`を省略した場合は座標圧縮のため O(n log n)）
+
+    Args:
+        s (str | bytes | Sequence[int]): 文字列・バイト列・整数列
+        upper (int | None): 整数列の値の上限（`0 <= s[i] <= upper`）
+
+    Returns:
+        list[int]: 接尾辞配列（`sa[i]`は辞書順で`i`番目の接尾辞の開始位置）
+    """
+    t, u = _to_int_list(s, upper)
+    return sa_is(t, u)
+
+
+def lcp_array(s: str | bytes | Sequence[int], sa: list[int]) -> list[int]:
+    """Kasai法によるLCP配列 O(n)
+
+    Args:
+        s (str | bytes | Sequence[int]): 文字列・バイト列・整数列
+        sa (list[int]): `s`の接尾辞配列
+
+    Returns:
+        list[int]: 長さ`n - 1`のリストで，`lcp[i]`は`s[sa[i]:]`と`s[sa[i + 1]:]`の最長共通接頭辞の長さ
+    """
+    n = len(s)
+    assert n >= 1
+    rnk = [0] * n
+    for i, p in enumerate(sa):
+        rnk[p] = i
+    lcp = [0] * (n - 1)
+    h = 0
+    for i in range(n):
+        if h > 0:
+            h -= 1
+        if rnk[i] == 0:
+            continue
+        j = sa[rnk[i] - 1]
+        while j + h < n and i + h < n and s[j + h] == s[i + h]:
+            h += 1
+        lcp[rnk[i] - 1] = h
+    return lcp
+
+
+if __name__ == "__main__":
+    """動作確認"""
+    # https://atcoder.jp/contests/practice2/tasks/practice2_i
+    from atcoder.others.input import Reader, Writer
+
+    reader = Reader()
+    writer = Writer()
+    S = reader.str()
+    sa = suffix_array(S)
+    writer.print(len(S) * (len(S) + 1) // 2 - sum(lcp_array(S, sa)))
@@ -0,0 +1,39 @@
+"""Z-algorithm"""
+from typing import Sequence
+
+
+def z_algorithm(s: str | bytes | Sequence[int]) -> list[int]:
+    """Z配列 O(n)
+
+    参考：https://github.com/atcoder/ac-library/blob/master/atcoder/string.hpp
+
+    Args:
+        s (str | bytes | Sequence[int]): 文字列・バイト列・整数列
+
+    Returns:
+        list[int]: `z[i]`は`s`と`s[i:]`の最長共通接頭辞の長さ（`z[0] = n`）
+    """
+    n = len(s)
+    if n == 0:
+        return []
+    z = [0] * n
+    j = 0  # これまでで`i + z[i]`が最大となる`i`
+    for i in range(1, n):
+        k = 0 if j + z[j] <= i else min(j + z[j] - i, z[i - j])
+        while i + k < n and s[k] == s[i + k]:
+            k += 1
+        z[i] = k
+        if j + z[j] < i + k:
+            j = i
+    z[0] = n
+    return z
+
+
+if __name__ == "__main__":
+    """動作確認"""
+    # https://judge.yosupo.jp/problem/zalgorithm
+    from atcoder.others.input import Reader, Writer
+
+    reader = Reader()
+    writer = Writer()
+    writer.print(*z_algorithm(reader.str()))